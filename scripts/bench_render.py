@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+Headless render benchmark for the app's screens.
+
+Builds the real app under SDL's dummy video driver (DEV_MODE=true, so
+config and logs go to workdir/), loads a synthetic AppState fixture per
+scenario and replays a scripted key sequence through the app's own key
+handler. Every step renders a full frame (background, screen, CRT
+layers) and presents it, scaled to the window when RENDER_RESOLUTION is
+set; its time is recorded and frames of repeated runs are pooled.
+Steps driven by a key also record input latency, from handing the event
+to the app to the end of the present (in_p50/in_p99).
+
+Per-scenario percentiles are printed and can be saved as a JSON baseline
+and compared against later:
+
+    python scripts/bench_render.py --out bench/baseline.json
+    python scripts/bench_render.py --compare bench/baseline.json
+
+With --compare the exit status is 1 when a scenario's p50 or p99 (frame
+time or input latency) got slower than the baseline by more than
+--threshold percent.
+
+--window WxH resizes the window before the first scenario, e.g. to see
+how frame cost grows with the display, with and without a fixed
+RENDER_RESOLUTION:
+
+    python scripts/bench_render.py --window 1920x1080
+    RENDER_RESOLUTION=800x600 python scripts/bench_render.py --window 1920x1080
+
+Usage:
+    python scripts/bench_render.py [--scenario NAME ...] [--repeat N]
+                                   [--window WxH] [--out FILE]
+                                   [--compare FILE] [--threshold PCT]
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(SCRIPT_DIR, "..", "src")
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("DEV_MODE", "true")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+GAME_COUNT = 50000
+QUEUE_SIZE = 40
+METRICS = ("p50", "p90", "p99", "max", "mean")
+LATENCY_METRICS = ("in_p50", "in_p99")
+
+
+def _games(count=GAME_COUNT):
+    regions = ("USA", "Europe", "Japan", "World")
+    return [
+        {
+            "name": f"Synthetic Game {i:05d} ({regions[i % 4]})",
+            "filename": f"Synthetic Game {i:05d} ({regions[i % 4]}).zip",
+            "size": 1024 * (i % 4096 + 1),
+        }
+        for i in range(count)
+    ]
+
+
+def _placeholder(size):
+    """Opaque gradient standing in for decoded box art."""
+    import pygame
+
+    surface = pygame.Surface(size)
+    width, height = size
+    for y in range(height):
+        shade = 40 + 160 * y // height
+        pygame.draw.line(surface, (0, shade, shade // 3), (0, y), (width, y))
+    return surface.convert()
+
+
+def setup_root_menu(app):
+    app.state.mode = "systems"
+
+
+def setup_games_list(app):
+    app.settings["view_type"] = "list"
+    app.state.mode = "games"
+    app.state.game_list = _games()
+
+
+def setup_games_grid(app):
+    app.settings["view_type"] = "grid"
+    app.settings["enable_boxart"] = True
+    app.state.mode = "games"
+    app.state.game_list = _games()
+
+
+def setup_game_details(app):
+    setup_games_list(app)
+    app.state.highlighted = 1234
+
+
+def setup_search_modal(app):
+    setup_games_list(app)
+    app.state.input_mode = "gamepad"
+
+
+def setup_download_queue(app):
+    from state import DownloadQueueItem
+
+    app.state.mode = "downloads"
+    app.state.download_queue.active = True
+    for game in _games(QUEUE_SIZE):
+        app.state.download_queue.items.append(
+            DownloadQueueItem(
+                game=game,
+                system_data={},
+                system_name="Synthetic System",
+                status="downloading",
+                total_size=700 * 1024 * 1024,
+                speed=3.5 * 1024 * 1024,
+            )
+        )
+
+
+# name -> (fixture, script). A script is a list of (step, count); a step is
+# a key name replayed through the app's key handler, "tick" to advance
+# every active download, or "marquee" to scroll the highlighted row's text,
+# both without input.
+SCENARIOS = {
+    "root_menu": (setup_root_menu, [("down", 40), ("up", 40)]),
+    "games_list_50k": (
+        setup_games_list,
+        [("down", 300), ("up", 100), ("right", 20), ("left", 20)],
+    ),
+    "games_list_marquee": (setup_games_list, [("marquee", 200)]),
+    "games_grid_50k": (
+        setup_games_grid,
+        [("right", 100), ("down", 150), ("up", 50)],
+    ),
+    "game_details_modal": (
+        setup_game_details,
+        [("d", 1), ("escape", 1)] * 40,
+    ),
+    "search_modal": (
+        setup_search_modal,
+        [("s", 1), ("right", 40), ("down", 20), ("left", 40)],
+    ),
+    "download_queue": (setup_download_queue, [("tick", 150), ("down", 40)]),
+}
+
+
+def create_app(window=None):
+    """Build the app with network-backed images and the web companion off."""
+    sys.path.insert(0, SRC_DIR)
+    # The bundled nsz tool parses sys.argv when imported
+    argv, sys.argv[1:] = sys.argv[1:], []
+    import app as app_module
+
+    sys.argv[1:] = argv
+    app = app_module.ConsoleUtilitiesApp()
+    app.needs_mapping = False
+    if app.web_companion:
+        app.web_companion.stop()
+        app.web_companion = None
+    thumbnail = _placeholder((120, 160))
+    hires = _placeholder((300, 400))
+    app._get_thumbnail = lambda game, system_data=None: thumbnail
+    app._get_hires_image = lambda game: hires
+    app.data = [{"name": "Synthetic System", "boxarts": ""}]
+    if window:
+        app._handle_resize(*window)
+    return app
+
+
+def reset_state(app):
+    from state import AppState
+
+    app.state = AppState()
+    app.state.input_mode = "keyboard"
+    app.settings["view_type"] = "list"
+
+
+def run_scenario(app, name):
+    """
+    Replay one scenario and return its per-frame render times and the
+    input latency of its key steps, in ms.
+    """
+    import pygame
+    from ui import damage
+
+    setup, script = SCENARIOS[name]
+    reset_state(app)
+    setup(app)
+
+    def frame(pressed=None):
+        damage.reset()
+        start = time.perf_counter()
+        app._render_frame()
+        app._present()
+        end = time.perf_counter()
+        times.append((end - start) * 1000)
+        if pressed is not None:
+            latencies.append((end - pressed) * 1000)
+
+    times = []
+    latencies = []
+    frame()
+    for step, count in script:
+        for _ in range(count):
+            pressed = None
+            if step == "tick":
+                for item in app.state.download_queue.items:
+                    item.progress = (item.progress + 0.004) % 1.0
+                    item.downloaded = int(item.progress * item.total_size)
+            elif step == "marquee":
+                app.state.text_scroll_offset += 2
+            else:
+                key = pygame.key.key_code(step)
+                pressed = time.perf_counter()
+                app._handle_key_event(
+                    pygame.event.Event(
+                        pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0
+                    )
+                )
+            frame(pressed)
+    return times, latencies
+
+
+def summarize(runs):
+    """
+    Percentiles over all runs of a scenario. The first frame of a run
+    (cold caches, screen built on first access) is reported on its own.
+    """
+    times = [ms for run, _ in runs for ms in run[1:]]
+    ordered = sorted(times)
+
+    def pick(values, fraction):
+        return values[min(len(values) - 1, int(fraction * len(values)))]
+
+    summary = {
+        "frames": len(times),
+        "first": round(runs[0][0][0], 3),
+        "p50": round(pick(ordered, 0.5), 3),
+        "p90": round(pick(ordered, 0.9), 3),
+        "p99": round(pick(ordered, 0.99), 3),
+        "max": round(ordered[-1], 3),
+        "mean": round(sum(times) / len(times), 3),
+    }
+    latencies = sorted(ms for _, run in runs for ms in run)
+    if latencies:
+        summary["in_p50"] = round(pick(latencies, 0.5), 3)
+        summary["in_p99"] = round(pick(latencies, 0.99), 3)
+    return summary
+
+
+def _commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=SCRIPT_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def compare(results, baseline, threshold):
+    """Print the change against a baseline; True if nothing regressed."""
+    ok = True
+    print(f"\n{'scenario':<20}{'metric':<7}{'base':>9}{'now':>9}{'change':>9}")
+    for name, now in results["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if base is None:
+            continue
+        for metric in ("p50", "p99") + LATENCY_METRICS:
+            if metric not in now or metric not in base:
+                continue
+            change = (now[metric] - base[metric]) / base[metric] * 100
+            flag = ""
+            if change > threshold:
+                flag = "  REGRESSION"
+                ok = False
+            print(
+                f"{name:<20}{metric:<7}{base[metric]:>9.2f}{now[metric]:>9.2f}"
+                f"{change:>+8.1f}%{flag}"
+            )
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="scenario to run (repeatable; default all)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="runs per scenario, frames pooled"
+    )
+    parser.add_argument("--window", help="window size as WxH (default 800x600)")
+    parser.add_argument("--out", help="write results as a JSON baseline")
+    parser.add_argument("--compare", help="baseline JSON to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=15.0,
+        help="allowed p50/p99 slowdown in percent (default 15)",
+    )
+    args = parser.parse_args()
+    window = None
+    if args.window:
+        window = tuple(int(part) for part in args.window.lower().split("x"))
+
+    app = create_app(window)
+    import pygame
+
+    width, height = app.window.get_size()
+    results = {
+        "meta": {
+            "commit": _commit(),
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "machine": platform.machine(),
+            "screen": [width, height],
+            "render": list(app.screen.get_size()),
+            "repeat": args.repeat,
+        },
+        "scenarios": {},
+    }
+
+    columns = METRICS + LATENCY_METRICS
+    print(f"{'scenario':<20}{'frames':>7}" + "".join(f"{m:>8}" for m in columns))
+    for name in args.scenario or SCENARIOS:
+        runs = [run_scenario(app, name) for _ in range(args.repeat)]
+        summary = summarize(runs)
+        results["scenarios"][name] = summary
+        print(
+            f"{name:<20}{summary['frames']:>7}"
+            + "".join(
+                f"{summary[m]:>8.2f}" if m in summary else f"{'-':>8}" for m in columns
+            )
+        )
+    pygame.quit()
+
+    if args.out:
+        directory = os.path.dirname(args.out)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nwrote {args.out}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if not compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
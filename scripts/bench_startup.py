@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Measure cold-start time of the app: how long ``import app`` takes and the
+time from interpreter start to the first frame on screen.
+
+Every run is a fresh interpreter with SDL's dummy video driver and
+DEV_MODE=true (config and logs go to workdir/). The medians of all runs
+are printed.
+
+Usage:
+    python scripts/bench_startup.py [--runs N] [--json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(SCRIPT_DIR, "..", "src")
+
+
+def child(started):
+    """Start the app, stop at the first flip and print the timings as JSON."""
+    sys.path.insert(0, SRC_DIR)
+    import_start = time.perf_counter()
+    import pygame
+    import app
+
+    import_s = time.perf_counter() - import_start
+    modules = len(sys.modules)
+
+    real_flip = pygame.display.flip
+
+    def flip():
+        real_flip()
+        first_frame_s = time.time() - started
+        print(
+            json.dumps(
+                {
+                    "import_s": import_s,
+                    "first_frame_s": first_frame_s,
+                    "modules": modules,
+                    "modules_at_first_frame": len(sys.modules),
+                }
+            )
+        )
+        sys.stdout.flush()
+        os._exit(0)
+
+    pygame.display.flip = flip
+    instance = app.ConsoleUtilitiesApp()
+    instance.needs_mapping = False
+    instance.run()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="print JSON")
+    parser.add_argument("--child", type=float, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        # The bundled nsz tool parses sys.argv when imported
+        del sys.argv[1:]
+        child(args.child)
+        return
+
+    env = dict(
+        os.environ,
+        SDL_VIDEODRIVER="dummy",
+        SDL_AUDIODRIVER="dummy",
+        DEV_MODE="true",
+        PYGAME_HIDE_SUPPORT_PROMPT="1",
+    )
+    runs = []
+    for _ in range(args.runs):
+        out = subprocess.run(
+            [sys.executable, __file__, "--child", repr(time.time())],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        runs.append(json.loads(out.strip().splitlines()[-1]))
+
+    result = {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+    print(f"runs:                 {len(runs)}")
+    print(f"import app:           {result['import_s'] * 1000:.0f} ms")
+    print(f"first frame:          {result['first_frame_s'] * 1000:.0f} ms")
+    print(f"modules after import: {result['modules']:.0f}")
+    print(f"modules at 1st frame: {result['modules_at_first_frame']:.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,7 @@ all components: state, settings, services, input, and UI.
 import pygame
 import os
 import sys
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 
 from constants import (
     BEZEL_INSET,
@@ -17,6 +17,12 @@ from constants import (
     ADDED_SYSTEMS_FILE,
     DEV_MODE,
     FPS,
+    FRAME_TRACE_FILE,
+    FULL_REDRAW_INTERVAL,
+    PRELOAD_SCREENS,
+    PROFILE_FRAMES,
+    RENDER_RESOLUTION,
+    RENDER_SMOOTH,
     SCREEN_WIDTH,
     SCREEN_HEIGHT,
     FONT_SIZE,
@@ -70,8 +76,13 @@ from services import file_explorer_service
 from input.navigation import NavigationHandler
 from input.controller import ControllerHandler
 from input.touch import TouchHandler
+from ui import damage, fonts
+from ui.layers import layer_cache
 from ui.theme import Theme
 from ui.screens.screen_manager import ScreenManager
+from utils.frame_pacing import INPUT_EVENTS, FramePacer
+from utils.frame_profiler import FrameProfiler
+from utils.render_scaler import RenderScaler, parse_resolution
 from utils.logging import log_error, init_log_file
 
 
@@ -121,37 +132,49 @@ class ConsoleUtilitiesApp:
         pygame.init()
         pygame.display.set_caption("Console Utilities")
 
+        # Optional fixed render resolution, scaled to the window per frame
+        render_size = parse_resolution(RENDER_RESOLUTION)
+        if RENDER_RESOLUTION and render_size is None:
+            log_error(f"Ignoring invalid RENDER_RESOLUTION: {RENDER_RESOLUTION!r}")
+        self.render_scaler = None
+        if render_size:
+            self.render_scaler = RenderScaler(render_size, smooth=RENDER_SMOOTH)
+
         # Create display - auto-detect native resolution on console/Android
         if DEV_MODE:
-            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self._set_display_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         elif BUILD_TARGET == "android":
             display_info = pygame.display.Info()
             native_w, native_h = display_info.current_w, display_info.current_h
             if native_h > native_w:
                 # Portrait: use fixed 800x600 scaled to fit
-                self.screen = pygame.display.set_mode(
+                self._set_display_mode(
                     (SCREEN_WIDTH, SCREEN_HEIGHT),
                     pygame.SCALED | pygame.FULLSCREEN,
                 )
             else:
                 # Landscape: use native resolution
-                self.screen = pygame.display.set_mode(
+                self._set_display_mode(
                     (native_w, native_h),
                     pygame.SCALED | pygame.FULLSCREEN,
                 )
         else:
             display_info = pygame.display.Info()
-            self.screen = pygame.display.set_mode(
+            self._set_display_mode(
                 (display_info.current_w, display_info.current_h),
                 pygame.FULLSCREEN,
             )
-        self.clock = pygame.time.Clock()
+        self.pacer = FramePacer(FPS)
+        self.clock = self.pacer.clock
+        self.profiler = FrameProfiler(enabled=PROFILE_FRAMES)
+        self._profiler_lines: List[str] = []
+        self._profiler_lines_at = 0
         font_path = os.path.join(SCRIPT_DIR, "assets", "fonts", "VT323-Regular.ttf")
         if not os.path.exists(font_path):
             font_path = os.path.normpath(
                 os.path.join(SCRIPT_DIR, "..", "assets", "fonts", "VT323-Regular.ttf")
             )
-        self.font = pygame.font.Font(font_path, FONT_SIZE)
+        self.font = fonts.get_font(font_path, FONT_SIZE)
 
         # Initialize joystick
         pygame.joystick.init()
@@ -163,21 +186,8 @@ class ConsoleUtilitiesApp:
         # Initialize theme
         self.theme = Theme()
 
-        # CRT scanline overlay (use actual screen size)
-        sw, sh = self.screen.get_size()
-        self.scanline_surface = None
-        if self.theme.crt_scanlines:
-            self.scanline_surface = pygame.Surface((sw, sh), pygame.SRCALPHA)
-            for y in range(0, sh, 3):
-                pygame.draw.line(
-                    self.scanline_surface,
-                    (0, 0, 0, 40),
-                    (0, y),
-                    (sw, y),
-                )
-
-        # CRT bezel overlay (physical monitor frame)
-        self.bezel_surface = self._create_crt_bezel()
+        # CRT background, scanline and bezel layers (use actual screen size)
+        self._create_crt_layers()
 
         # Initialize state
         self.state = AppState()
@@ -204,8 +214,11 @@ class ConsoleUtilitiesApp:
         # Initialize screen manager
         self.screen_manager = ScreenManager(self.theme)
 
-        # Initialize image cache service
-        self.image_cache = ImageCache()
+        # Initialize image cache service (its decode pool starts here,
+        # before any background thread)
+        self.image_cache = ImageCache(
+            decode_processes=self.settings.get("image_decode_processes", 0)
+        )
 
         # Initialize download manager (Android-native or desktop)
         self._init_download_manager()
@@ -224,9 +237,6 @@ class ConsoleUtilitiesApp:
         ):
             self._start_web_companion()
 
-        # CRT vignette overlay (edge darkening)
-        self.vignette_surface = self._create_vignette()
-
         # Check if controller mapping needed
         self.needs_mapping = needs_controller_mapping()
 
@@ -343,7 +353,7 @@ class ConsoleUtilitiesApp:
             # Only show skip button after a touch/click is detected
             if touch_detected:
                 skip_text = "Use Touch - Skip Map"
-                skip_font = pygame.font.Font(
+                skip_font = fonts.get_font(
                     self.theme.font_path, self.theme.font_size_md
                 )
                 skip_surf = skip_font.render(skip_text, True, self.theme.background)
@@ -359,13 +369,13 @@ class ConsoleUtilitiesApp:
                     (skip_btn_rect.x + pad, skip_btn_rect.y + pad // 2),
                 )
 
-            if self.scanline_surface:
-                self.screen.blit(self.scanline_surface, (0, 0))
-            self.screen.blit(self.bezel_surface, (0, 0))
-            pygame.display.flip()
+            self._draw_crt_overlay()
+            self._present()
 
             # Handle events
             for event in pygame.event.get():
+                if self.screen is not self.window:
+                    event = self.render_scaler.map_event(event)
                 if event.type == pygame.QUIT:
                     return False
 
@@ -420,9 +430,72 @@ class ConsoleUtilitiesApp:
         return True
 
     def _draw_background(self):
-        """Draw the CRT monitor background."""
-        self.screen.fill(BACKGROUND)
-        self.screen.blit(self.vignette_surface, (0, 0))
+        """Draw the CRT monitor background (pre-flattened fill + vignette)."""
+        self.screen.blit(self.crt_background, (0, 0))
+
+    def _draw_crt_overlay(self, rects: Optional[List[pygame.Rect]] = None):
+        """
+        Apply the scanline and bezel layers over the rendered frame.
+
+        Args:
+            rects: Only apply over these screen regions (None = whole frame).
+                Regions must have been fully redrawn this frame, otherwise
+                scanlines would be multiplied in twice.
+        """
+        inner = self._crt_inner_rect
+        if self.crt_scanlines is not None:
+            areas = [inner] if rects is None else [r.clip(inner) for r in rects]
+            for area in areas:
+                if area.w and area.h:
+                    self.screen.blit(
+                        self.crt_scanlines,
+                        area,
+                        area,
+                        special_flags=pygame.BLEND_RGB_MULT,
+                    )
+        for strip in self._crt_bezel_strips:
+            if rects is None or strip.collidelist(rects) != -1:
+                self.screen.blit(self.crt_bezel, strip, strip)
+
+    def _create_crt_layers(self):
+        """
+        Pre-composite the static CRT layers for the current screen size.
+
+        The background fill and vignette are flattened into one opaque
+        surface, scanlines become an opaque multiply layer, and the bezel
+        (opaque everywhere it draws) is blitted as four edge strips. A frame
+        therefore needs no full-screen per-pixel alpha blend.
+        """
+        sw, sh = self.screen.get_size()
+        # Cached layers hold the old background (and theme) underneath
+        layer_cache.clear()
+
+        background = pygame.Surface((sw, sh)).convert()
+        background.fill(BACKGROUND)
+        background.blit(self._create_vignette(), (0, 0))
+        self.crt_background = background
+
+        self.crt_scanlines = None
+        if self.theme.crt_scanlines:
+            scanlines = pygame.Surface((sw, sh)).convert()
+            scanlines.fill((255, 255, 255))
+            # Multiplying by 215/255 matches a black line at alpha 40
+            for y in range(0, sh, 3):
+                pygame.draw.line(scanlines, (215, 215, 215), (0, y), (sw, y))
+            self.crt_scanlines = scanlines
+
+        bezel = pygame.Surface((sw, sh)).convert()
+        bezel.blit(self._create_crt_bezel(), (0, 0))
+        self.crt_bezel = bezel
+
+        inset = min(BEZEL_INSET, sw // 2, sh // 2)
+        self._crt_inner_rect = pygame.Rect(inset, inset, sw - 2 * inset, sh - 2 * inset)
+        self._crt_bezel_strips = [
+            pygame.Rect(0, 0, sw, inset),
+            pygame.Rect(0, sh - inset, sw, inset),
+            pygame.Rect(0, inset, inset, sh - 2 * inset),
+            pygame.Rect(sw - inset, inset, inset, sh - 2 * inset),
+        ]
 
     def _create_crt_bezel(self) -> pygame.Surface:
         """
@@ -558,26 +631,38 @@ class ConsoleUtilitiesApp:
         except Exception:
             pass
 
+    def _set_display_mode(self, size: Tuple[int, int], flags: int = 0):
+        """
+        Create the window. With a fixed render resolution the UI draws to
+        the scaler's logical surface, otherwise (or when the window already
+        has that size) straight to the window.
+        """
+        self.window = pygame.display.set_mode(size, flags)
+        scaler = self.render_scaler
+        if scaler and self.window.get_size() != scaler.size:
+            scaler.resize(self.window)
+            self.screen = scaler.surface
+        else:
+            self.screen = self.window
+
+    def _present(self, rects: Optional[List[pygame.Rect]] = None):
+        """Show the drawn frame, or just the given regions of it."""
+        if self.screen is not self.window:
+            self.render_scaler.present(rects)
+        elif rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+
     def _restore_android_display(self):
         """Restore display after returning from an external activity (SAF picker etc)."""
         try:
             self._set_android_immersive_mode()
-            w, h = self.screen.get_size()
-            self.screen = pygame.display.set_mode(
-                (w, h), pygame.SCALED | pygame.FULLSCREEN
-            )
+            w, h = self.window.get_size()
+            self._set_display_mode((w, h), pygame.SCALED | pygame.FULLSCREEN)
 
             # Recreate overlay surfaces (GPU textures are lost on context restore)
-            self.scanline_surface = None
-            if self.theme.crt_scanlines:
-                self.scanline_surface = pygame.Surface((w, h), pygame.SRCALPHA)
-                for y in range(0, h, 3):
-                    pygame.draw.line(
-                        self.scanline_surface, (0, 0, 0, 40), (0, y), (w, y)
-                    )
-
-            self.bezel_surface = self._create_crt_bezel()
-            self.vignette_surface = self._create_vignette()
+            self._create_crt_layers()
 
             # Invalidate image cache (stale GPU-side data)
             self.image_cache.clear()
@@ -595,56 +680,41 @@ class ConsoleUtilitiesApp:
         is_portrait = new_h > new_w
         if is_portrait:
             # Portrait: use fixed 800x600 with SCALED to fit
-            self.screen = pygame.display.set_mode(
+            self._set_display_mode(
                 (SCREEN_WIDTH, SCREEN_HEIGHT),
                 pygame.SCALED | pygame.FULLSCREEN,
             )
         else:
             # Landscape: use native resolution
-            self.screen = pygame.display.set_mode(
-                (new_w, new_h), pygame.SCALED | pygame.FULLSCREEN
-            )
+            self._set_display_mode((new_w, new_h), pygame.SCALED | pygame.FULLSCREEN)
+        if self.render_scaler:
+            # UI size unchanged: theme, overlays and images stay valid
+            return
 
         # Recreate theme and overlays
         self.theme = Theme()
-        self.scanline_surface = None
-        if self.theme.crt_scanlines:
-            sw, sh = self.screen.get_size()
-            self.scanline_surface = pygame.Surface((sw, sh), pygame.SRCALPHA)
-            for y in range(0, sh, 3):
-                pygame.draw.line(self.scanline_surface, (0, 0, 0, 40), (0, y), (sw, y))
-        self.bezel_surface = self._create_crt_bezel()
-        self.vignette_surface = self._create_vignette()
+        self._create_crt_layers()
         self.image_cache.clear()
 
     def _handle_resize(self, new_w: int, new_h: int):
         """Handle screen resize (Android orientation change)."""
-        self.screen = pygame.display.set_mode((new_w, new_h), pygame.RESIZABLE)
+        self._set_display_mode((new_w, new_h), pygame.RESIZABLE)
+        if self.render_scaler:
+            # The UI keeps its logical size; only its place in the window moved
+            return
 
         # Recreate theme
         self.theme = Theme()
 
-        # Recreate scanline overlay
-        self.scanline_surface = None
-        if self.theme.crt_scanlines:
-            self.scanline_surface = pygame.Surface((new_w, new_h), pygame.SRCALPHA)
-            for y in range(0, new_h, 3):
-                pygame.draw.line(
-                    self.scanline_surface,
-                    (0, 0, 0, 40),
-                    (0, y),
-                    (new_w, y),
-                )
-
-        # Recreate bezel overlay
-        self.bezel_surface = self._create_crt_bezel()
+        # Recreate CRT background, scanline and bezel layers
+        self._create_crt_layers()
 
         # Recreate screen manager so all screens pick up new theme
         self.screen_manager = ScreenManager(self.theme)
 
         # Recreate font for controller mapping screen
         font_path = self.theme.font_path
-        self.font = pygame.font.Font(font_path, self.theme.font_size_md)
+        self.font = fonts.get_font(font_path, self.theme.font_size_md)
 
     def _get_thumbnail(
         self, game: Any, system_data: Optional[dict] = None
@@ -802,10 +872,8 @@ class ConsoleUtilitiesApp:
             get_thumbnail=self._get_thumbnail,
             get_hires_image=self._get_hires_image,
         )
-        if self.scanline_surface:
-            self.screen.blit(self.scanline_surface, (0, 0))
-        self.screen.blit(self.bezel_surface, (0, 0))
-        pygame.display.flip()
+        self._draw_crt_overlay()
+        self._present()
         # Process events to prevent freezing
         pygame.event.pump()
 
@@ -850,9 +918,38 @@ class ConsoleUtilitiesApp:
             self.needs_mapping = False
 
         _dirty = True  # First frame always draws
+        # Full redraw needed (input, navigation, new images); otherwise a
+        # dirty frame only redraws the live progress regions
+        _full_redraw = True
+        _live_rects: List[pygame.Rect] = []
+        _last_layout = None
+        _last_full_redraw = 0
+        # State version shown by the last frame, and whether that frame
+        # had a spinner or other animation that needs the next one
+        _drawn_version = -1
+        _animating = False
+        profiler = self.profiler
+        pacer = self.pacer
 
         while running:
-            self.clock.tick(FPS)
+            # Full rate while the user interacts or something animates;
+            # otherwise poll for input at a low rate, waking early for
+            # background results
+            pacer.wait(
+                active=(
+                    (_dirty and not self._is_backgrounded)
+                    or _animating
+                    or self.navigation.any_pressed()
+                    or bool(self.state.text_scroll_offset)
+                    or bool(
+                        self.web_companion
+                        and self.web_companion._running
+                        and self.web_companion.frame_pending
+                    )
+                ),
+                pending=self.state.busy or self.state.changed_since(_drawn_version),
+            )
+            profiler.begin_frame()
 
             # Update navigation state
             self.navigation.update()
@@ -860,7 +957,9 @@ class ConsoleUtilitiesApp:
             # Handle continuous navigation
             if not self.needs_mapping:
                 if self.navigation.handle_continuous(self._on_navigate):
-                    _dirty = True
+                    profiler.note_input()
+                    _dirty = _full_redraw = True
+            profiler.lap("navigation")
 
             # Check for IA auth failures in download queue
             if not self.state.confirm_modal.show:
@@ -868,7 +967,7 @@ class ConsoleUtilitiesApp:
                     if item.error == "ia_auth_required":
                         item.error = "Login required"
                         self._show_ia_login_required_modal()
-                        _dirty = True
+                        _dirty = _full_redraw = True
                         break
 
             # Manage Android soft keyboard show/hide
@@ -881,9 +980,20 @@ class ConsoleUtilitiesApp:
                     pygame.key.stop_text_input()
                 self._text_modal_open = text_modal_is_open
 
-            # Process events — any input event dirties the frame
-            for event in pygame.event.get():
-                _dirty = True
+            # Process events — any input event dirties the frame; handlers
+            # may edit lists and settings in place, so count it as a change.
+            # Navigation presses queued up during a slow frame are capped.
+            events = self.navigation.coalesce(
+                pygame.event.get(), self._navigation_direction
+            )
+            for event in events:
+                if self.screen is not self.window:
+                    event = self.render_scaler.map_event(event)
+                if event.type in INPUT_EVENTS:
+                    pacer.note_input()
+                    profiler.note_input()
+                _dirty = _full_redraw = True
+                self.state.mark_changed()
                 if event.type == pygame.QUIT:
                     running = False
 
@@ -938,7 +1048,7 @@ class ConsoleUtilitiesApp:
                             self._restore_android_display()
                         else:
                             # Only handle actual orientation changes, not keyboard/navbar resize
-                            cur_w, cur_h = self.screen.get_size()
+                            cur_w, cur_h = self.window.get_size()
                             was_portrait = cur_h > cur_w
                             is_portrait = event.h > event.w
                             if was_portrait != is_portrait:
@@ -985,37 +1095,46 @@ class ConsoleUtilitiesApp:
                                 type(e).__name__,
                                 traceback.format_exc(),
                             )
+            profiler.lap("events")
 
             # Update image cache (process loaded images from background threads)
             if self.image_cache.update():
-                _dirty = True
+                _dirty = _full_redraw = True
 
             # Poll auto-detect ROM downloads for completion
             self._poll_auto_detect_downloads()
 
-            # Mark dirty when downloads or async operations are active
-            if (
-                self.state.download_queue.active
-                or self.state.loading.show
-                or self.state.scraper_queue.active
-                or self.state.text_scroll_offset
-                or self.state.confirm_modal.loading
-                or getattr(self.state.active_patcher, "is_fetching", False)
-                or getattr(self.state.active_patcher, "is_patching", False)
-                or self.state.dedupe_wizard.step
-                in ("scanning", "processing")
-                or self.state.rename_wizard.step
-                in ("scanning", "processing")
-                or self.state.ghost_cleaner_wizard.step
-                in ("scanning", "cleaning")
+            # Redraw when background work changed the state, at most every
+            # BACKGROUND_INTERVAL unless the screen switched, or the last
+            # frame animates; busy screens also refresh once a second in
+            # case work edited lists in place
+            if self.state.changed_since(_drawn_version) and (
+                pacer.background_due() or self._layout_signature() != _last_layout
+            ):
+                _dirty = True
+            if _animating or (
+                self.state.busy
+                and pygame.time.get_ticks() - _last_full_redraw >= FULL_REDRAW_INTERVAL
             ):
                 _dirty = True
 
+            # Scrolling text animates anywhere on screen
+            if self.state.text_scroll_offset:
+                _dirty = _full_redraw = True
+
+            profiler.lap("background")
+
             # Web companion: process incoming actions + push state
             if self.web_companion and self.web_companion._running:
-                self.web_companion.process_actions(self.state)
+                if self.web_companion.process_actions(self.state):
+                    pacer.note_input()
+                    _dirty = _full_redraw = True
+                    self.state.mark_changed()
                 self.web_companion.push_state(self.state, self.settings, self.data)
-                _dirty = True
+                # Redraw once more if the last frame's capture was throttled
+                if self.web_companion.frame_pending:
+                    _dirty = True
+                profiler.lap("web_state")
 
             # Deferred display restore: wait until surface is recreated by SDL
             if self._needs_display_restore and pygame.display.get_surface() is not None:
@@ -1029,67 +1148,223 @@ class ConsoleUtilitiesApp:
             )
             if _surface_ok and _dirty:
                 _dirty = False
+                pacer.note_drawn()
+                # Read before rendering: changes made meanwhile show next frame
+                _drawn_version = self.state.version
+                # Progress-only frames redraw just the live regions, unless
+                # the layout moved or the periodic full redraw is due
+                layout = self._layout_signature()
+                now = pygame.time.get_ticks()
+                if (
+                    not _live_rects
+                    or layout != _last_layout
+                    or now - _last_full_redraw >= FULL_REDRAW_INTERVAL
+                ):
+                    _full_redraw = True
                 try:
-                    self._draw_background()
-
-                    # Pre-compute filtered systems for system picker rendering
-                    if (
-                        self.state.scraper_wizard.show
-                        and self.state.scraper_wizard.system_picker_active
-                    ):
-                        self.screen_manager.scraper_wizard_modal.system_picker_systems = (
-                            self._get_filtered_systems()
-                        )
-
-                    # Render current screen
-                    rects = self.screen_manager.render(
-                        self.screen,
-                        self.state,
-                        self.settings,
-                        self.data,
-                        get_thumbnail=self._get_thumbnail,
-                        get_hires_image=self._get_hires_image,
-                    )
-
-                    # Store rects for click handling
-                    self.state.ui_rects.menu_items = rects.get("item_rects", [])
-                    self.state.ui_rects.back_button = rects.get("back")
-                    self.state.ui_rects.download_button = rects.get("download_button")
-                    self.state.ui_rects.close_button = rects.get("close")
-                    self.state.ui_rects.modal_char_rects = rects.get("char_rects", [])
-                    self.state.ui_rects.scroll_offset = rects.get("scroll_offset", 0)
-                    self.state.ui_rects.folder_select_button = rects.get(
-                        "select_button"
-                    )
-                    self.state.ui_rects.folder_cancel_button = rects.get(
-                        "cancel_button"
-                    )
-                    self.state.ui_rects.confirm_ok_button = rects.get("confirm_ok")
-                    self.state.ui_rects.confirm_cancel_button = rects.get(
-                        "confirm_cancel"
-                    )
-                    self.state.ui_rects.rects = rects
+                    if not _full_redraw:
+                        self._render_regions(_live_rects)
+                        if self.web_companion and self.web_companion._running:
+                            self.web_companion.capture_frame(self.screen)
+                            profiler.lap("capture")
+                        profiler.end_frame()
+                        continue
 
-                    if self.scanline_surface:
-                        self.screen.blit(self.scanline_surface, (0, 0))
-                    self.screen.blit(self.bezel_surface, (0, 0))
-                    pygame.display.flip()
+                    _full_redraw = False
+                    _last_layout = layout
+                    _last_full_redraw = now
+                    damage.reset()
+                    self._render_frame()
+                    _animating = damage.animating()
+                    _live_rects = damage.collect()
+                    if profiler.enabled:
+                        self._draw_profiler_overlay()
+                        profiler.lap("overlay")
+                    self._present()
+                    profiler.lap("flip")
 
                     # Web companion: capture frame for MJPEG thumbnail
                     if self.web_companion and self.web_companion._running:
                         self.web_companion.capture_frame(self.screen)
+                        profiler.lap("capture")
+                    profiler.end_frame()
                 except pygame.error:
                     # Surface was destroyed mid-frame (Android lifecycle race)
                     self._is_backgrounded = True
+            elif _surface_ok and PRELOAD_SCREENS:
+                # Nothing to draw: build a screen the user may open next
+                self.screen_manager.preload_next(self.state.mode)
 
         # Cleanup
         if self.web_companion:
             self.web_companion.stop()
+        self.image_cache.flush()
+        if profiler.enabled:
+            try:
+                profiler.export_trace(FRAME_TRACE_FILE)
+            except OSError as e:
+                log_error(f"Failed to write frame trace: {e}")
         pygame.quit()
 
-    def _on_navigate(self, direction: str, hat: tuple):
+    def _render_frame(self):
+        """
+        Draw a complete frame into the back buffer: background, current
+        screen and CRT layers. Interactive rects are stored for input.
+        """
+        profiler = self.profiler
+        self._draw_background()
+        profiler.lap("crt")
+
+        # Pre-compute filtered systems for system picker rendering
+        if (
+            self.state.scraper_wizard.show
+            and self.state.scraper_wizard.system_picker_active
+        ):
+            self.screen_manager.scraper_wizard_modal.system_picker_systems = (
+                self._get_filtered_systems()
+            )
+
+        # Render current screen
+        rects = self.screen_manager.render(
+            self.screen,
+            self.state,
+            self.settings,
+            self.data,
+            get_thumbnail=self._get_thumbnail,
+            get_hires_image=self._get_hires_image,
+        )
+
+        # Store rects for click handling
+        self.state.ui_rects.menu_items = rects.get("item_rects", [])
+        self.state.ui_rects.back_button = rects.get("back")
+        self.state.ui_rects.download_button = rects.get("download_button")
+        self.state.ui_rects.close_button = rects.get("close")
+        self.state.ui_rects.modal_char_rects = rects.get("char_rects", [])
+        self.state.ui_rects.scroll_offset = rects.get("scroll_offset", 0)
+        self.state.ui_rects.folder_select_button = rects.get("select_button")
+        self.state.ui_rects.folder_cancel_button = rects.get("cancel_button")
+        self.state.ui_rects.confirm_ok_button = rects.get("confirm_ok")
+        self.state.ui_rects.confirm_cancel_button = rects.get("confirm_cancel")
+        self.state.ui_rects.rects = rects
+        profiler.lap("render")
+
+        self._draw_crt_overlay()
+        profiler.lap("crt")
+
+    def _layout_signature(self) -> tuple:
+        """
+        Fingerprint of state that changes what is on screen beyond progress.
+
+        Background work can switch modals or reorder queue items without any
+        input event; a changed signature forces a full redraw.
+        """
+        state = self.state
+        patcher = state.active_patcher
+        return (
+            state.mode,
+            state.loading.show,
+            bool(state.loading.progress),
+            state.confirm_modal.show,
+            getattr(patcher, "active_modal", None),
+            getattr(patcher, "is_fetching", False),
+            getattr(patcher, "patch_complete", False),
+            bool(getattr(patcher, "patch_error", None)),
+            state.scraper_wizard.step,
+            state.dedupe_wizard.step,
+            state.rename_wizard.step,
+            state.ghost_cleaner_wizard.step,
+            tuple(item.status for item in state.download_queue.items),
+            tuple(item.status for item in state.scraper_queue.items),
+        )
+
+    def _render_regions(self, rects: List[pygame.Rect]):
+        """
+        Redraw and push only the given screen regions.
+
+        The frame is rendered once with the surface clipped to the
+        bounding box of the regions, so fills and blits outside it cost
+        nothing while the screen's Python render runs a single time. The
+        rest of the back buffer keeps the previous frame.
+        """
+        profiler = self.profiler
+        rects = [rects[0].unionall(rects[1:])]
+        self.screen.set_clip(rects[0])
+        self._draw_background()
+        self.screen_manager.render(
+            self.screen,
+            self.state,
+            self.settings,
+            self.data,
+            get_thumbnail=self._get_thumbnail,
+            get_hires_image=self._get_hires_image,
+        )
+        self.screen.set_clip(None)
+        damage.reset()
+        profiler.lap("render")
+        self._draw_crt_overlay(rects)
+        profiler.lap("crt")
+        if profiler.enabled:
+            rects = rects + [self._draw_profiler_overlay()]
+            profiler.lap("overlay")
+        self._present(rects)
+        profiler.lap("flip")
+
+    def _draw_profiler_overlay(self) -> pygame.Rect:
+        """
+        Draw the rolling p50/p99 time of each frame phase in the top-left
+        corner of the screen.
+
+        Returns:
+            Rect covered by the overlay
+        """
+        now = pygame.time.get_ticks()
+        # Percentiles are re-sorted twice a second, not every frame
+        if not self._profiler_lines or now - self._profiler_lines_at >= 500:
+            self._profiler_lines_at = now
+            self._profiler_lines = ["phase        p50   p99 ms"] + [
+                f"{phase:<11}{p50:5.1f} {p99:5.1f}"
+                for phase, (p50, p99) in self.profiler.stats().items()
+            ]
+        atlas = fonts.get_atlas(
+            self.theme.font_path, self.theme.font_size_xs, TEXT_PRIMARY
+        )
+        lines = self._profiler_lines
+        padding = 4
+        rect = pygame.Rect(
+            self._crt_inner_rect.topleft,
+            (
+                max(atlas.size(line)[0] for line in lines) + 2 * padding,
+                atlas.height * len(lines) + 2 * padding,
+            ),
+        )
+        self.screen.fill(BACKGROUND, rect)
+        for i, line in enumerate(lines):
+            atlas.render(
+                self.screen,
+                line,
+                (rect.x + padding, rect.y + padding + i * atlas.height),
+            )
+        return rect
+
+    def _on_navigate(self, direction: str, hat: tuple, steps: int = 1):
         """Handle navigation from held direction."""
-        self._move_highlight(direction)
+        for _ in range(steps):
+            self._move_highlight(direction)
+
+    def _navigation_direction(self, event: pygame.event.Event) -> Optional[str]:
+        """Direction an arrow key or D-pad press navigates in, or None."""
+        if event.type == pygame.KEYDOWN:
+            return {
+                pygame.K_UP: "up",
+                pygame.K_DOWN: "down",
+                pygame.K_LEFT: "left",
+                pygame.K_RIGHT: "right",
+            }.get(event.key)
+        if event.type in (pygame.JOYBUTTONDOWN, pygame.JOYHATMOTION):
+            action = self.controller.get_action_for_event(event)
+            if action in NavigationHandler.DIRECTIONS:
+                return action
+        return None
 
     def _move_highlight(self, direction: str):
         """Move highlight in the given direction."""
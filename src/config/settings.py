@@ -59,6 +59,8 @@ class Settings:
     )
     # Web Companion
     web_companion_enabled: bool = True
+    # Performance
+    image_decode_processes: int = 0  # box-art decode worker processes (0 = threads)
     # Syncthing Save Sync
     syncthing_enabled: bool = False
     syncthing_role: str = ""  # "host" or "console"
@@ -130,6 +132,10 @@ def get_default_settings() -> Dict[str, Any]:
     return Settings().to_dict()
 
 
+# Contents of the config file as last read or written
+_saved_text: Optional[str] = None
+
+
 def load_settings() -> Dict[str, Any]:
     """
     Load settings from config file.
@@ -137,14 +143,17 @@ def load_settings() -> Dict[str, Any]:
     Returns:
         Dictionary of settings with defaults for missing values
     """
+    global _saved_text
     default_settings = get_default_settings()
 
     try:
         if os.path.exists(CONFIG_FILE):
             with open(CONFIG_FILE, "r") as f:
-                loaded_settings = json.load(f)
-                # Merge with defaults to handle new settings
-                default_settings.update(loaded_settings)
+                text = f.read()
+            loaded_settings = json.loads(text)
+            _saved_text = text
+            # Merge with defaults to handle new settings
+            default_settings.update(loaded_settings)
         else:
             # Create config file with defaults
             save_settings(default_settings)
@@ -164,20 +173,29 @@ def save_settings(settings_to_save: Dict[str, Any]) -> bool:
     """
     Save settings to config file.
 
+    The file is only rewritten when its contents would change; handlers
+    save after every toggle, and SD card writes are slow.
+
     Args:
         settings_to_save: Dictionary of settings to save
 
     Returns:
         True if successful, False otherwise
     """
+    global _saved_text
     try:
+        text = json.dumps(settings_to_save, indent=2)
+        if text == _saved_text:
+            return True
+
         # Create directory if it doesn't exist
         config_dir = os.path.dirname(CONFIG_FILE)
         if config_dir:
             os.makedirs(config_dir, exist_ok=True)
 
         with open(CONFIG_FILE, "w") as f:
-            json.dump(settings_to_save, f, indent=2)
+            f.write(text)
+        _saved_text = text
         return True
     except Exception as e:
         from utils.logging import log_error
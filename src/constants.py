@@ -17,6 +17,9 @@ BUILD_TARGET = "source"
 #                       Environment Detection                        #
 # **************************************************************** #
 DEV_MODE = os.getenv("DEV_MODE", "false").lower() == "true"
+# Time each main-loop phase, show a p50/p99 overlay and export a
+# Chrome trace (FRAME_TRACE_FILE) on exit
+PROFILE_FRAMES = os.getenv("PROFILE_FRAMES", "false").lower() == "true"
 
 # Detect if running from a zip bundle (e.g., .pygame file)
 _raw_script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -52,6 +55,7 @@ else:
 
 os.makedirs(TEMP_LOG_DIR, exist_ok=True)
 LOG_FILE = os.path.join(TEMP_LOG_DIR, "error.log")
+FRAME_TRACE_FILE = os.path.join(TEMP_LOG_DIR, "frame_trace.json")
 
 # WE Patcher cache directory
 if DEV_MODE:
@@ -73,8 +77,15 @@ else:
 #                       Display Settings                             #
 # **************************************************************** #
 FPS = 20
+FULL_REDRAW_INTERVAL = 1000  # ms; max age of a frame drawn with partial updates
+PRELOAD_SCREENS = True  # build likely next screens during idle frames
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
+# Fixed "WxH" resolution to draw the UI at, scaled to the window once per
+# frame (e.g. "800x600" on 4K displays); empty draws at the window size
+RENDER_RESOLUTION = os.getenv("RENDER_RESOLUTION", "")
+# Filter non-integer render scaling (smoother, ~3x the cost of nearest)
+RENDER_SMOOTH = os.getenv("RENDER_SMOOTH", "false").lower() == "true"
 FONT_SIZE = 28
 
 # **************************************************************** #
@@ -133,6 +144,7 @@ NAVIGATION_INITIAL_DELAY = 100  # ms before repeating starts
 NAVIGATION_START_RATE = 350  # ms between repeats when starting (slow)
 NAVIGATION_MAX_RATE = 40  # ms between repeats at maximum speed (fast)
 NAVIGATION_ACCELERATION = 0.85  # Acceleration factor per repeat (lower = faster ramp)
+NAVIGATION_MAX_STEPS = 4  # max moves per direction per frame (bounds overshoot)
 
 # **************************************************************** #
 #                       Touch/Mouse Settings                         #
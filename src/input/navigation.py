@@ -1,16 +1,38 @@
 """
 Navigation state and continuous navigation handling for Console Utilities.
 Manages D-pad/keyboard navigation with acceleration for held buttons.
+
+Held-direction repeats follow a time schedule rather than the frame rate:
+a slow frame yields the repeats that fell due during it, at most
+NAVIGATION_MAX_STEPS, so scrolling speed doesn't drop with frame time.
+The same bound applies to queued navigation presses (key autorepeat from
+gamepad-to-keyboard mappers, held web companion buttons): ``coalesce``
+drops those beyond it, so a slow frame doesn't overshoot after release.
 """
 
 import pygame
-from typing import Dict, Optional, Callable, Any
+from typing import Dict, Optional, Callable, Any, List
 
 from constants import (
     NAVIGATION_INITIAL_DELAY,
     NAVIGATION_START_RATE,
     NAVIGATION_MAX_RATE,
     NAVIGATION_ACCELERATION,
+    NAVIGATION_MAX_STEPS,
+)
+
+# Input events that act on their own; a non-navigation one ends a run of
+# navigation presses. Releases and motion don't.
+_PRESS_EVENTS = frozenset(
+    (
+        pygame.KEYDOWN,
+        pygame.TEXTINPUT,
+        pygame.JOYBUTTONDOWN,
+        pygame.CONTROLLERBUTTONDOWN,
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEWHEEL,
+        pygame.FINGERDOWN,
+    )
 )
 
 
@@ -31,8 +53,8 @@ class NavigationHandler:
         # Time when button was first pressed
         self._start_time: Dict[str, int] = {d: 0 for d in self.DIRECTIONS}
 
-        # Time of last navigation repeat
-        self._last_repeat: Dict[str, int] = {d: 0 for d in self.DIRECTIONS}
+        # Time the last navigation repeat was due
+        self._last_repeat: Dict[str, float] = {d: 0 for d in self.DIRECTIONS}
 
         # Current velocity (ms between repeats)
         self._velocity: Dict[str, float] = {d: 0 for d in self.DIRECTIONS}
@@ -43,6 +65,9 @@ class NavigationHandler:
         # Controller mapping for button-based D-pad
         self._controller_mapping: Dict[str, Any] = {}
 
+        # Navigation presses dropped by coalesce() (for measurements)
+        self.coalesced = 0
+
     def set_joystick(self, joystick: Optional[pygame.joystick.JoystickType]) -> None:
         """Set the joystick to use for input."""
         self._joystick = joystick
@@ -132,49 +157,56 @@ class NavigationHandler:
         """Check if a direction is currently pressed."""
         return self._state.get(direction, False)
 
+    def any_pressed(self) -> bool:
+        """Check if any direction is currently pressed."""
+        return any(self._state.values())
+
     def is_held(self, direction: str) -> bool:
         """Check if a direction is being held (for continuous navigation)."""
         return (
             self._state.get(direction, False) and self._start_time.get(direction, 0) > 0
         )
 
-    def should_navigate(self, direction: str) -> bool:
+    def repeats_due(self, direction: str) -> int:
         """
-        Check if navigation should be triggered for held direction.
+        Count the navigation repeats due for a held direction.
 
         Uses progressive acceleration - starts slow and speeds up
-        the longer the button is held.
+        the longer the button is held. Repeats are due on a fixed
+        schedule, so a slow frame gets several of them.
 
         Args:
             direction: Direction to check
 
         Returns:
-            True if navigation should trigger this frame
+            Number of moves to make this frame (at most NAVIGATION_MAX_STEPS)
         """
         if not self._state[direction]:
-            return False
+            return 0
 
         current_time = pygame.time.get_ticks()
         start_time = self._start_time[direction]
         last_repeat = self._last_repeat[direction]
-        current_velocity = self._velocity[direction]
+        velocity = self._velocity[direction]
 
         # Don't trigger before initial delay
         if current_time - start_time < NAVIGATION_INITIAL_DELAY:
-            return False
-
-        # Check if enough time has passed for the next repeat
-        time_since_last = current_time - last_repeat
-        if time_since_last >= current_velocity:
-            self._last_repeat[direction] = current_time
-
+            return 0
+
+        steps = 0
+        while current_time - last_repeat >= velocity:
+            if steps == NAVIGATION_MAX_STEPS:
+                # Stalled for a while: drop the backlog instead of catching up
+                last_repeat = current_time
+                break
+            last_repeat += velocity
+            steps += 1
             # Accelerate for next repeat (but don't go below minimum rate)
-            new_velocity = current_velocity * NAVIGATION_ACCELERATION
-            self._velocity[direction] = max(new_velocity, NAVIGATION_MAX_RATE)
+            velocity = max(velocity * NAVIGATION_ACCELERATION, NAVIGATION_MAX_RATE)
 
-            return True
-
-        return False
+        self._last_repeat[direction] = last_repeat
+        self._velocity[direction] = velocity
+        return steps
 
     def get_hat_value(self, direction: str) -> tuple:
         """
@@ -194,23 +226,64 @@ class NavigationHandler:
         }
         return mapping.get(direction, (0, 0))
 
-    def handle_continuous(self, on_navigate: Callable[[str, tuple], None]) -> bool:
+    def handle_continuous(self, on_navigate: Callable[[str, tuple, int], None]) -> bool:
         """
         Handle continuous navigation for all held directions.
 
         Args:
-            on_navigate: Callback function(direction, hat_value) for navigation
+            on_navigate: Callback function(direction, hat_value, steps) for
+                navigation; steps is the number of moves due this frame
 
         Returns:
             True if navigation occurred (screen needs redraw).
         """
         for direction in self.DIRECTIONS:
-            if self.should_navigate(direction):
+            steps = self.repeats_due(direction)
+            if steps:
                 hat = self.get_hat_value(direction)
-                on_navigate(direction, hat)
+                on_navigate(direction, hat, steps)
                 return True  # Only process one direction per frame
         return False
 
+    def coalesce(
+        self,
+        events: List[pygame.event.Event],
+        direction_of: Callable[[pygame.event.Event], Optional[str]],
+    ) -> List[pygame.event.Event]:
+        """
+        Drop queued navigation presses beyond NAVIGATION_MAX_STEPS.
+
+        A run is a sequence of presses in one direction, uninterrupted by
+        presses in another direction or by other actions; releases don't
+        end it. Events keep their order.
+
+        Args:
+            events: Events fetched this frame
+            direction_of: Direction an event navigates in, or None
+
+        Returns:
+            The events to handle
+        """
+        kept = []
+        run_direction = None
+        run_length = 0
+        for event in events:
+            direction = direction_of(event)
+            if direction is None:
+                if event.type in _PRESS_EVENTS:
+                    run_direction = None
+                kept.append(event)
+                continue
+            if direction == run_direction:
+                run_length += 1
+            else:
+                run_direction, run_length = direction, 1
+            if run_length > NAVIGATION_MAX_STEPS:
+                self.coalesced += 1
+                continue
+            kept.append(event)
+        return kept
+
     def reset(self) -> None:
         """Reset all navigation state."""
         for direction in self.DIRECTIONS:
@@ -1,6 +1,10 @@
 """
 Image caching service for Console Utilities.
 Handles async image loading, caching, and queue management for thumbnails.
+
+Background threads download and decode images into raw RGBA buffers at
+their display size; the main thread only wraps finished buffers into
+surfaces in update(), within a per-frame time budget.
 """
 
 import collections
@@ -8,17 +12,19 @@ import hashlib
 import json
 import os
 import re
+import time
 import traceback
-from io import BytesIO
 from queue import Queue, Empty
-from threading import Thread, Lock, Event
-from typing import Dict, Any, Optional, Tuple
+from threading import Thread, Lock, Event, Timer
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from urllib.parse import quote, urljoin, unquote
 
 import pygame
 import requests
 
+from utils.frame_pacing import WakeQueue, wake
 from utils.logging import log_error
+from utils.image_decode import ImageDecoder, raw_to_surface, surface_to_raw
 from constants import THUMBNAIL_SIZE, HIRES_IMAGE_SIZE, SYSTEMS_CACHE_DIR
 
 
@@ -44,18 +50,142 @@ def _clean_name_for_matching(name: str) -> str:
     return name.strip().lower()
 
 
+# Tokens ignored when comparing names ("&" vs "and", leading/trailing "The")
+_STOPWORD_TOKENS = frozenset({"the", "a", "an", "and"})
+# Single letters ("Mega Man X", "Mega Man V") are titles, not numerals,
+# and are never folded
+_ROMAN_NUMERALS = {
+    "ii": "2",
+    "iii": "3",
+    "iv": "4",
+    "vi": "6",
+    "vii": "7",
+    "viii": "8",
+    "ix": "9",
+}
+
+
+def _name_tokens(name: str) -> Tuple[List[str], frozenset]:
+    """Split a game/thumbnail name into normalized comparison tokens.
+
+    Builds on _clean_name_for_matching, then treats all punctuation as
+    separators (libretro thumbnails replace "&", ":" etc. with "_"),
+    drops apostrophes, maps roman numerals to digits and removes
+    stopwords.
+
+    Returns:
+        The folded tokens in order, and the set of folded plus raw
+        tokens used for similarity
+    """
+    cleaned = _clean_name_for_matching(name).replace("'", "")
+    raw = [
+        t for t in re.split(r"[^0-9a-z]+", cleaned) if t and t not in _STOPWORD_TOKENS
+    ]
+    folded = [_ROMAN_NUMERALS.get(t, t) for t in raw]
+    return folded, frozenset(folded) | frozenset(raw)
+
+
+class _ListingIndex:
+    """Name index over the image filenames of one thumbnail listing.
+
+    Resolves a game name in three steps: the exact cleaned key, a
+    normalized key (punctuation, articles and numerals folded), and
+    finally a token-similarity search over an inverted token index.
+    Candidates come from the posting lists of the query tokens, so a
+    lookup costs O(tokens) rather than O(listing size).
+    """
+
+    # Minimum Dice similarity between token sets for a near match
+    MATCH_THRESHOLD = 0.85
+    # Posting lists longer than this are too common to seed candidates
+    COMMON_TOKEN_LIMIT = 500
+
+    def __init__(self, filenames: Iterable[str] = ()):
+        # cleaned name -> original filename (also the on-disk format)
+        self.exact: Dict[str, str] = {}
+        # normalized token key -> original filename
+        self._normalized: Dict[str, str] = {}
+        # entry id -> (original filename, token set, numbers in the name)
+        self._entries: List[Tuple[str, frozenset, frozenset]] = []
+        # token -> entry ids
+        self._postings: Dict[str, List[int]] = {}
+        for filename in filenames:
+            self.add(filename)
+
+    def __len__(self) -> int:
+        return len(self.exact)
+
+    def add(self, filename: str):
+        """Index a server filename."""
+        cleaned = _clean_name_for_matching(filename)
+        if not cleaned or cleaned in self.exact:
+            return
+        self.exact[cleaned] = filename
+
+        tokens, token_set = _name_tokens(filename)
+        if not tokens:
+            return
+        self._normalized.setdefault(" ".join(tokens), filename)
+
+        entry_id = len(self._entries)
+        numbers = frozenset(t for t in tokens if t.isdigit())
+        self._entries.append((filename, token_set, numbers))
+        for token in token_set:
+            self._postings.setdefault(token, []).append(entry_id)
+
+    def match(self, name: str) -> Optional[str]:
+        """Return the best matching filename for a game name, or None."""
+        cleaned = _clean_name_for_matching(name)
+        found = self.exact.get(cleaned)
+        if found:
+            return found
+
+        tokens, query = _name_tokens(name)
+        if not tokens:
+            return None
+        found = self._normalized.get(" ".join(tokens))
+        if found:
+            return found
+
+        seeds = [
+            t
+            for t in query
+            if len(self._postings.get(t, ())) <= self.COMMON_TOKEN_LIMIT
+        ] or list(query)
+        counts: Dict[int, int] = {}
+        for token in seeds:
+            for entry_id in self._postings.get(token, ()):
+                counts[entry_id] = counts.get(entry_id, 0) + 1
+
+        query_numbers = frozenset(t for t in tokens if t.isdigit())
+        best_score = 0.0
+        best: Optional[str] = None
+        for entry_id in counts:
+            filename, entry_tokens, entry_numbers = self._entries[entry_id]
+            # "NHL 94" must never match "NHL 95"
+            if entry_numbers != query_numbers:
+                continue
+            score = 2 * len(query & entry_tokens) / (len(query) + len(entry_tokens))
+            if score > best_score:
+                best_score = score
+                best = filename
+        if best_score >= self.MATCH_THRESHOLD:
+            return best
+        return None
+
+
 class _ThumbnailListingCache:
     """Caches parsed directory listings from thumbnail servers.
 
     Fetches the HTML listing for a boxart base URL once, parses
-    all available filenames, and builds a cleaned-name lookup dict
-    so game names can be fuzzy-matched to thumbnail filenames.
+    all available filenames, and builds a _ListingIndex so game
+    names can be fuzzy-matched to thumbnail filenames.
     """
 
     def __init__(self):
         self._lock = Lock()
-        # boxart_url -> {cleaned_name: original_filename}
-        self._listings: Dict[str, Dict[str, str]] = {}
+        # boxart_url -> name index over the listing
+        self._listings: Dict[str, _ListingIndex] = {}
         # boxart_url -> Event (set when fetch completes)
         self._events: Dict[str, Event] = {}
         # boxart_url -> True if fetch has been started
@@ -86,7 +216,9 @@ class _ThumbnailListingCache:
                 if os.path.exists(disk_path):
                     try:
                         with open(disk_path, "r", encoding="utf-8") as f:
-                            self._listings[boxart_url] = json.load(f)
+                            self._listings[boxart_url] = _ListingIndex(
+                                json.load(f).values()
+                            )
                         self._started[boxart_url] = True
                         event = Event()
                         event.set()
@@ -111,9 +243,19 @@ class _ThumbnailListingCache:
         if event:
             event.wait(timeout=30)
 
-        lookup = self._listings.get(boxart_url, {})
-        cleaned = _clean_name_for_matching(game_base_name)
-        return lookup.get(cleaned)
+        index = self._listings.get(boxart_url)
+        if not index:
+            return None
+        return index.match(game_base_name)
+
+    def has_listing(self, boxart_url: str) -> bool:
+        """Return True if a non-empty listing is loaded for the URL.
+
+        A loaded listing is authoritative: a game that doesn't match it
+        has no art on the server, so extension guessing can be skipped.
+        """
+        with self._lock:
+            return bool(self._listings.get(boxart_url))
 
     def clear(self):
         """Clear all cached listings."""
@@ -140,22 +282,16 @@ class _ThumbnailListingCache:
                 re.IGNORECASE,
             )
 
-            lookup: Dict[str, str] = {}
-            for href in hrefs:
-                # Decode URL-encoded filename
-                filename = unquote(href)
-                cleaned = _clean_name_for_matching(filename)
-                if cleaned and cleaned not in lookup:
-                    lookup[cleaned] = filename
-
-            self._listings[boxart_url] = lookup
+            # Decode URL-encoded filenames
+            index = _ListingIndex(unquote(href) for href in hrefs)
+            self._listings[boxart_url] = index
 
             # Persist to disk cache
             try:
                 disk_path = self._get_listing_cache_path(boxart_url)
                 os.makedirs(os.path.dirname(disk_path), exist_ok=True)
                 with open(disk_path, "w", encoding="utf-8") as f:
-                    json.dump(lookup, f, ensure_ascii=False)
+                    json.dump(index.exact, f, ensure_ascii=False)
             except Exception:
                 pass
 
@@ -165,7 +301,7 @@ class _ThumbnailListingCache:
                 type(e).__name__,
                 str(e),
             )
-            self._listings[boxart_url] = {}
+            self._listings[boxart_url] = _ListingIndex()
         finally:
             event = self._events.get(boxart_url)
             if event:
@@ -176,6 +312,135 @@ class _ThumbnailListingCache:
 _listing_cache = _ThumbnailListingCache()
 
 
+class _MissingArtCache:
+    """Persists box-art misses so known-missing art costs no network.
+
+    Misses are stored per boxart base URL as {base_name: timestamp} in a
+    JSON file next to the thumbnail listings. Entries expire after
+    ``TTL_SECONDS`` so art added to the server later is picked up again.
+    Writes are batched; at most one save per ``SAVE_INTERVAL`` seconds,
+    with changes made inside the interval saved once it is up.
+    """
+
+    TTL_SECONDS = 7 * 24 * 60 * 60
+    SAVE_INTERVAL = 5.0
+
+    def __init__(self):
+        self._lock = Lock()
+        # boxart_url -> {base_name: miss timestamp}
+        self._misses: Dict[str, Dict[str, float]] = {}
+        self._dirty: set = set()
+        self._last_save = 0.0
+        # Deferred save for changes made inside SAVE_INTERVAL
+        self._save_timer: Optional[Timer] = None
+
+    @staticmethod
+    def _get_cache_path(boxart_url: str) -> str:
+        """Return disk cache path for the misses of a boxart URL."""
+        url_hash = hashlib.md5(boxart_url.encode()).hexdigest()
+        return os.path.join(SYSTEMS_CACHE_DIR, "thumbnail_misses", f"{url_hash}.json")
+
+    def _get_entries(self, boxart_url: str) -> Dict[str, float]:
+        """Return the miss entries for a URL, loading from disk once. Lock held."""
+        entries = self._misses.get(boxart_url)
+        if entries is None:
+            entries = {}
+            disk_path = self._get_cache_path(boxart_url)
+            if os.path.exists(disk_path):
+                try:
+                    with open(disk_path, "r", encoding="utf-8") as f:
+                        entries = json.load(f)
+                except Exception:
+                    entries = {}
+            self._misses[boxart_url] = entries
+        return entries
+
+    def is_missing(self, boxart_url: str, base_name: str) -> bool:
+        """Return True if the art is recorded as missing and not yet expired."""
+        with self._lock:
+            entries = self._get_entries(boxart_url)
+            stamp = entries.get(base_name)
+            if stamp is None:
+                return False
+            if time.time() - stamp > self.TTL_SECONDS:
+                del entries[base_name]
+                self._dirty.add(boxart_url)
+                return False
+            return True
+
+    def mark_missing(self, boxart_url: str, base_name: str):
+        """Record that no art exists for this game on this server."""
+        with self._lock:
+            self._get_entries(boxart_url)[base_name] = time.time()
+            self._dirty.add(boxart_url)
+        self.flush(force=False)
+
+    def clear_missing(self, boxart_url: str, base_name: str):
+        """Forget a recorded miss (art was found after all)."""
+        with self._lock:
+            entries = self._get_entries(boxart_url)
+            if entries.pop(base_name, None) is None:
+                return
+            self._dirty.add(boxart_url)
+        self.flush(force=False)
+
+    def flush(self, force: bool = True):
+        """Write dirty miss files to disk.
+
+        Args:
+            force: Save even if the last save was less than
+                ``SAVE_INTERVAL`` seconds ago.
+        """
+        with self._lock:
+            now = time.time()
+            if not self._dirty:
+                return
+            wait = self.SAVE_INTERVAL - (now - self._last_save)
+            if not force and wait > 0:
+                if self._save_timer is None:
+                    self._save_timer = Timer(wait, self._flush_later)
+                    self._save_timer.daemon = True
+                    self._save_timer.start()
+                return
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            pending = {url: dict(self._misses.get(url, {})) for url in self._dirty}
+            self._dirty.clear()
+            self._last_save = now
+
+        for boxart_url, entries in pending.items():
+            try:
+                disk_path = self._get_cache_path(boxart_url)
+                os.makedirs(os.path.dirname(disk_path), exist_ok=True)
+                tmp_path = disk_path + ".tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(entries, f, ensure_ascii=False)
+                os.replace(tmp_path, disk_path)
+            except Exception:
+                pass
+
+    def _flush_later(self):
+        """Save changes held back by SAVE_INTERVAL (timer thread)."""
+        with self._lock:
+            self._save_timer = None
+        self.flush()
+
+    def clear(self):
+        """Drop in-memory state (disk files are kept)."""
+        self.flush()
+        with self._lock:
+            self._misses.clear()
+            self._dirty.clear()
+
+
+# Module-level singleton for persisted box-art misses
+_missing_art = _MissingArtCache()
+
+# Queue marker for art known to be missing (cached as None without retries)
+_KNOWN_MISSING = object()
+
+
 class ImageCache:
     """
     Manages image loading and caching for thumbnails and high-resolution images.
@@ -186,14 +451,25 @@ class ImageCache:
 
     MAX_THUMBNAILS = 200
     MAX_HIRES = 20
+    HIRES_MAX_DIMENSION = 800
+    # Main-thread time allowed per frame for turning buffers into surfaces
+    UPDATE_BUDGET_MS = 4.0
 
-    def __init__(self):
-        """Initialize the image cache."""
+    def __init__(self, decode_processes: int = 0):
+        """
+        Initialize the image cache.
+
+        Args:
+            decode_processes: Worker processes for image decoding
+                (0 decodes in the loader threads)
+        """
+        self._decoder = ImageDecoder(decode_processes)
         self._thumbnail_cache: collections.OrderedDict = collections.OrderedDict()
-        self._thumbnail_queue: Queue = Queue()
+        # Loader threads wake an idle main loop when an image is ready
+        self._thumbnail_queue: Queue = WakeQueue()
 
         self._hires_cache: collections.OrderedDict = collections.OrderedDict()
-        self._hires_queue: Queue = Queue()
+        self._hires_queue: Queue = WakeQueue()
 
         self._retry_counts: Dict[str, int] = {}
         self._max_retries = 2
@@ -340,11 +616,21 @@ class ImageCache:
         Process loaded images from background threads.
         Should be called from main thread each frame.
 
+        Stops after UPDATE_BUDGET_MS so a burst of completions is spread
+        over several frames instead of causing a hitch; leftovers stay
+        queued for the next call.
+
         Returns:
             True if any new images were processed (screen needs redraw).
         """
-        a = self._process_queue(self._thumbnail_queue, self._thumbnail_cache, self.MAX_THUMBNAILS)
-        b = self._process_queue(self._hires_queue, self._hires_cache, self.MAX_HIRES)
+        deadline = time.perf_counter() + self.UPDATE_BUDGET_MS / 1000.0
+        # Hi-res first: only one is shown at a time and the user is waiting on it
+        a = self._process_queue(
+            self._hires_queue, self._hires_cache, self.MAX_HIRES, deadline
+        )
+        b = self._process_queue(
+            self._thumbnail_queue, self._thumbnail_cache, self.MAX_THUMBNAILS, deadline
+        )
         return a or b
 
     def clear(self):
@@ -352,11 +638,17 @@ class ImageCache:
         self._thumbnail_cache.clear()
         self._hires_cache.clear()
         self._retry_counts.clear()
+        _missing_art.flush()
 
         # Drain queues
         self._drain_queue(self._thumbnail_queue)
         self._drain_queue(self._hires_queue)
 
+    def flush(self):
+        """Persist pending box-art misses and stop decode workers (call on shutdown)."""
+        _missing_art.flush()
+        self._decoder.shutdown()
+
     def _extract_game_name(self, game_item: Any) -> str:
         """Extract game name from item."""
         if isinstance(game_item, str):
@@ -408,6 +700,18 @@ class ImageCache:
             return urljoin(base_url, quote(matched, safe=""))
         return None
 
+    def _fetch_and_decode(
+        self,
+        url: str,
+        timeout: float,
+        target_size: Optional[Tuple[int, int]] = None,
+        max_dimension: Optional[int] = None,
+    ):
+        """Download an image and decode it to a raw RGBA buffer (worker thread)."""
+        response = requests.get(url, timeout=timeout)
+        response.raise_for_status()
+        return self._decoder.decode(response.content, target_size, max_dimension)
+
     def _load_image_async(
         self,
         url: str,
@@ -418,14 +722,7 @@ class ImageCache:
     ):
         """Load image in background thread."""
         try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-
-            image_data = BytesIO(response.content)
-            image = pygame.image.load(image_data).convert_alpha()
-            scaled_image = pygame.transform.smoothscale(image, target_size)
-
-            queue.put((cache_key, scaled_image))
+            queue.put((cache_key, self._fetch_and_decode(url, 10, target_size)))
 
         except Exception as e:
             log_error(
@@ -445,41 +742,59 @@ class ImageCache:
         target_size: Tuple[int, int],
         queue: Queue,
     ):
-        """Try loading image using listing-based matching, then format fallback."""
+        """Try loading image using listing-based matching, then format fallback.
+
+        Misses are persisted per server, so known-missing art is
+        resolved without any network request on later runs.
+        """
         # First try listing-based fuzzy match
         matched_url = self._resolve_thumbnail_url(base_url, base_name)
         if matched_url:
             try:
-                response = requests.get(matched_url, timeout=5)
-                response.raise_for_status()
-
-                image_data = BytesIO(response.content)
-                image = pygame.image.load(image_data).convert_alpha()
-                scaled_image = pygame.transform.smoothscale(image, target_size)
-
-                queue.put((cache_key, scaled_image))
+                decoded = self._fetch_and_decode(matched_url, 5, target_size)
+                _missing_art.clear_missing(base_url, base_name)
+                queue.put((cache_key, decoded))
                 return
             except Exception:
-                pass
+                if _listing_cache.has_listing(base_url):
+                    # Guessing names the listing doesn't have won't help;
+                    # leave it to the normal retry path
+                    queue.put((cache_key, None))
+                    return
+        elif _missing_art.is_missing(base_url, base_name):
+            queue.put((cache_key, _KNOWN_MISSING))
+            return
+        elif _listing_cache.has_listing(base_url):
+            # The listing is authoritative, guessing extensions won't help
+            _missing_art.mark_missing(base_url, base_name)
+            queue.put((cache_key, _KNOWN_MISSING))
+            return
 
         # Fall back to trying exact name with different extensions
+        all_not_found = True
         for fmt in formats:
             try:
                 image_url = urljoin(base_url, quote(f"{base_name}{fmt}", safe=""))
                 response = requests.get(image_url, timeout=5)
+                if response.status_code in (403, 404, 410):
+                    continue
+                all_not_found = False
                 response.raise_for_status()
 
-                image_data = BytesIO(response.content)
-                image = pygame.image.load(image_data).convert_alpha()
-                scaled_image = pygame.transform.smoothscale(image, target_size)
-
-                queue.put((cache_key, scaled_image))
+                decoded = self._decoder.decode(response.content, target_size)
+                queue.put((cache_key, decoded))
                 return
 
             except Exception:
+                all_not_found = False
                 continue
 
-        # All attempts failed
+        # All attempts failed; only persist clean "not found" answers so
+        # network errors are retried next session
+        if all_not_found and not matched_url:
+            _missing_art.mark_missing(base_url, base_name)
+            queue.put((cache_key, _KNOWN_MISSING))
+            return
         queue.put((cache_key, None))
 
     def _load_hires_with_fallback(
@@ -493,28 +808,18 @@ class ImageCache:
         """Try loading high-resolution image with listing match then extension fallback."""
         # First try listing-based fuzzy match
         matched_url = self._resolve_thumbnail_url(base_url, base_name)
+        if not matched_url and (
+            _missing_art.is_missing(base_url, base_name)
+            or _listing_cache.has_listing(base_url)
+        ):
+            # Known missing art; skip straight to the thumbnail fallback
+            formats = []
         if matched_url:
             try:
-                response = requests.get(matched_url, timeout=10)
-                response.raise_for_status()
-
-                image_data = BytesIO(response.content)
-                image = pygame.image.load(image_data)
-
-                original_size = image.get_size()
-                max_dimension = max(original_size)
-
-                if max_dimension > 800:
-                    scale_factor = 800 / max_dimension
-                    new_width = int(original_size[0] * scale_factor)
-                    new_height = int(original_size[1] * scale_factor)
-                    scaled_image = pygame.transform.smoothscale(
-                        image, (new_width, new_height)
-                    )
-                else:
-                    scaled_image = image
-
-                self._hires_queue.put((cache_key, scaled_image))
+                decoded = self._fetch_and_decode(
+                    matched_url, 10, max_dimension=self.HIRES_MAX_DIMENSION
+                )
+                self._hires_queue.put((cache_key, decoded))
                 return
             except Exception:
                 pass
@@ -526,27 +831,11 @@ class ImageCache:
                     base_url if base_url.endswith("/") else base_url + "/",
                     quote(f"{base_name}{fmt}", safe=""),
                 )
-                response = requests.get(url, timeout=10)
-                response.raise_for_status()
-
-                image_data = BytesIO(response.content)
-                image = pygame.image.load(image_data)
-
                 # Only scale down if extremely large
-                original_size = image.get_size()
-                max_dimension = max(original_size)
-
-                if max_dimension > 800:
-                    scale_factor = 800 / max_dimension
-                    new_width = int(original_size[0] * scale_factor)
-                    new_height = int(original_size[1] * scale_factor)
-                    scaled_image = pygame.transform.smoothscale(
-                        image, (new_width, new_height)
-                    )
-                else:
-                    scaled_image = image
-
-                self._hires_queue.put((cache_key, scaled_image))
+                decoded = self._fetch_and_decode(
+                    url, 10, max_dimension=self.HIRES_MAX_DIMENSION
+                )
+                self._hires_queue.put((cache_key, decoded))
                 return
 
             except Exception:
@@ -554,23 +843,50 @@ class ImageCache:
 
         # Try to use thumbnail as fallback
         thumbnail_key = cache_key.replace("hires_", "")
-        if thumbnail_key in self._thumbnail_cache:
-            thumbnail = self._thumbnail_cache[thumbnail_key]
-            if thumbnail and thumbnail != "loading":
-                upscaled = pygame.transform.smoothscale(thumbnail, HIRES_IMAGE_SIZE)
+        thumbnail = self._thumbnail_cache.get(thumbnail_key)
+        if thumbnail and thumbnail != "loading":
+            try:
+                upscaled = surface_to_raw(thumbnail, HIRES_IMAGE_SIZE)
                 self._hires_queue.put((cache_key, upscaled))
                 return
+            except Exception:
+                pass
 
         self._hires_queue.put((cache_key, None))
 
-    def _process_queue(self, queue: Queue, cache: collections.OrderedDict, max_size: int) -> bool:
-        """Process items from queue into cache, evicting LRU entries if over max_size. Returns True if any items processed."""
+    def _process_queue(
+        self,
+        queue: Queue,
+        cache: collections.OrderedDict,
+        max_size: int,
+        deadline: Optional[float] = None,
+    ) -> bool:
+        """Process items from queue into cache, evicting LRU entries if over max_size.
+
+        Decoded raw buffers are wrapped into surfaces here, on the main
+        thread. Stops early once ``deadline`` (a perf_counter value) passes.
+
+        Returns True if any items processed.
+        """
         processed = False
         while not queue.empty():
+            if deadline is not None and processed and time.perf_counter() > deadline:
+                # The rest waits for the next frame; don't sleep on it
+                wake()
+                break
             try:
                 cache_key, image = queue.get_nowait()
                 processed = True
-                if image is not None:
+                if isinstance(image, tuple):
+                    try:
+                        image = raw_to_surface(image)
+                    except (pygame.error, ValueError):
+                        image = None
+                if image is _KNOWN_MISSING:
+                    # Persisted miss, retrying won't find anything
+                    self._retry_counts.pop(cache_key, None)
+                    cache[cache_key] = None
+                elif image is not None:
                     cache[cache_key] = image
                     cache.move_to_end(cache_key)
                     self._retry_counts.pop(cache_key, None)
@@ -1,13 +1,65 @@
 """
 Application state management for Console Utilities.
 Centralizes all global state into a single AppState class for better maintainability.
+
+State classes derived from Tracked bump a global state version whenever
+a public field is assigned a different value, so the main loop, the web
+companion and other consumers can skip work while ``AppState.version``
+is unchanged. In-place edits of lists, dicts and sets are not seen;
+call ``AppState.mark_changed()`` after them.
+
+Fields a class lists in ``_LIST_FIELDS`` also advance the list
+generation when they change, giving the games list an identity that
+survives until it is replaced (``AppState.list_generation``).
 """
 
+import itertools
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Set, Dict, Optional, Any, Tuple
 import pygame
 
+_clock = itertools.count(1)
+_version = 0
+_list_generation = 0
+_MISSING = object()
+# Values compared by equality; others (lists, objects) change on reassignment
+_SCALARS = frozenset({bool, int, float, str, type(None)})
+
+
+def _bump() -> None:
+    """Advance the state version."""
+    global _version
+    # next() is atomic, so concurrent writers never share a version; a
+    # late store may briefly move _version back, which only causes one
+    # redundant redraw for consumers comparing with !=
+    _version = next(_clock)
+
+
+def _bump_list_generation() -> None:
+    """Advance the list generation."""
+    global _list_generation
+    _list_generation = next(_clock)
+
+
+class Tracked:
+    """Mixin bumping the state version when a public field changes."""
+
+    __slots__ = ()
+    # Fields whose change also replaces the list on the games screen
+    _LIST_FIELDS = frozenset()
+
+    def __setattr__(self, name, value):
+        old = self.__dict__.get(name, _MISSING)
+        object.__setattr__(self, name, value)
+        if name[0] == "_" or old is value:
+            return
+        if type(old) in _SCALARS and type(value) in _SCALARS and old == value:
+            return
+        if name in self._LIST_FIELDS:
+            _bump_list_generation()
+        _bump()
+
 
 @dataclass
 class NavigationState:
@@ -55,9 +107,11 @@ class TouchState:
 
 
 @dataclass
-class SearchState:
+class SearchState(Tracked):
     """State for search functionality."""
 
+    _LIST_FIELDS = frozenset({"mode", "filtered_list"})
+
     mode: bool = False
     query: str = ""
     input_text: str = ""
@@ -68,7 +122,7 @@ class SearchState:
 
 
 @dataclass
-class CharSelectorState:
+class CharSelectorState(Tracked):
     """State for character selector UI."""
 
     active: bool = False
@@ -77,7 +131,7 @@ class CharSelectorState:
 
 
 @dataclass
-class FolderBrowserState:
+class FolderBrowserState(Tracked):
     """State for folder browser modal."""
 
     show: bool = False
@@ -92,7 +146,7 @@ class FolderBrowserState:
 
 
 @dataclass
-class FolderNameInputState:
+class FolderNameInputState(Tracked):
     """State for folder name input modal."""
 
     show: bool = False
@@ -103,7 +157,7 @@ class FolderNameInputState:
 
 
 @dataclass
-class UrlInputState:
+class UrlInputState(Tracked):
     """State for URL input modal."""
 
     show: bool = False
@@ -114,7 +168,7 @@ class UrlInputState:
 
 
 @dataclass
-class GameDetailsState:
+class GameDetailsState(Tracked):
     """State for game details modal."""
 
     show: bool = False
@@ -124,7 +178,7 @@ class GameDetailsState:
 
 
 @dataclass
-class LoadingState:
+class LoadingState(Tracked):
     """State for loading/download progress."""
 
     show: bool = False
@@ -133,7 +187,7 @@ class LoadingState:
 
 
 @dataclass
-class DownloadQueueItem:
+class DownloadQueueItem(Tracked):
     """State for a single download queue item."""
 
     game: Any  # Game dict/object
@@ -150,7 +204,7 @@ class DownloadQueueItem:
 
 
 @dataclass
-class DownloadQueueState:
+class DownloadQueueState(Tracked):
     """State for download queue."""
 
     items: List[DownloadQueueItem] = field(default_factory=list)
@@ -159,7 +213,7 @@ class DownloadQueueState:
 
 
 @dataclass
-class ConfirmModalState:
+class ConfirmModalState(Tracked):
     """State for confirmation modal."""
 
     show: bool = False
@@ -179,7 +233,7 @@ class ConfirmModalState:
 
 
 @dataclass
-class IALoginState:
+class IALoginState(Tracked):
     """State for Internet Archive login modal."""
 
     show: bool = False
@@ -192,7 +246,7 @@ class IALoginState:
 
 
 @dataclass
-class IADownloadWizardState:
+class IADownloadWizardState(Tracked):
     """State for Internet Archive download wizard modal."""
 
     show: bool = False
@@ -214,7 +268,7 @@ class IADownloadWizardState:
 
 
 @dataclass
-class IACollectionWizardState:
+class IACollectionWizardState(Tracked):
     """State for Internet Archive collection wizard modal."""
 
     show: bool = False
@@ -240,7 +294,7 @@ class IACollectionWizardState:
 
 
 @dataclass
-class ScraperLoginState:
+class ScraperLoginState(Tracked):
     """State for scraper login modal (ScreenScraper/TheGamesDB)."""
 
     show: bool = False
@@ -255,7 +309,7 @@ class ScraperLoginState:
 
 
 @dataclass
-class ScraperWizardState:
+class ScraperWizardState(Tracked):
     """State for game image scraper wizard modal."""
 
     show: bool = False
@@ -304,7 +358,7 @@ class ScraperWizardState:
 
 
 @dataclass
-class DedupeWizardState:
+class DedupeWizardState(Tracked):
     """State for dedupe games wizard modal."""
 
     show: bool = False
@@ -337,7 +391,7 @@ class DedupeWizardState:
 
 
 @dataclass
-class RenameWizardState:
+class RenameWizardState(Tracked):
     """State for game file rename wizard modal."""
 
     show: bool = False
@@ -356,7 +410,7 @@ class RenameWizardState:
 
 
 @dataclass
-class ScraperQueueItem:
+class ScraperQueueItem(Tracked):
     """State for a single scraper queue item."""
 
     name: str  # ROM display name
@@ -369,7 +423,7 @@ class ScraperQueueItem:
 
 
 @dataclass
-class ScraperQueueState:
+class ScraperQueueState(Tracked):
     """State for background batch scraping queue."""
 
     items: List[ScraperQueueItem] = field(default_factory=list)
@@ -386,7 +440,7 @@ class ScraperQueueState:
 
 
 @dataclass
-class GhostCleanerWizardState:
+class GhostCleanerWizardState(Tracked):
     """State for ghost file cleaner wizard modal."""
 
     show: bool = False
@@ -403,7 +457,7 @@ class GhostCleanerWizardState:
 
 
 @dataclass
-class SteamShortcutState:
+class SteamShortcutState(Tracked):
     """State for Steam shortcut creator."""
 
     show: bool = False
@@ -421,7 +475,7 @@ class SteamShortcutState:
 
 
 @dataclass
-class ColorPickerState:
+class ColorPickerState(Tracked):
     """State for the team color picker modal."""
 
     team_index: int = 0
@@ -430,7 +484,7 @@ class ColorPickerState:
 
 
 @dataclass
-class ISSPatcherState:
+class ISSPatcherState(Tracked):
     """State for the ISS SNES Patcher feature."""
 
     # League selection
@@ -480,7 +534,7 @@ class ISSPatcherState:
 
 
 @dataclass
-class WePatcherState:
+class WePatcherState(Tracked):
     """State for the WE Patcher feature."""
 
     # League selection
@@ -531,7 +585,7 @@ class WePatcherState:
 
 
 @dataclass
-class NHL07PSPPatcherState:
+class NHL07PSPPatcherState(Tracked):
     """State for the NHL 07 PSP Patcher feature."""
 
     # Season (start year: 2024 = 2024-25 season)
@@ -580,7 +634,7 @@ class NHL07PSPPatcherState:
 
 
 @dataclass
-class NHL05PS2PatcherState:
+class NHL05PS2PatcherState(Tracked):
     """State for the NHL 05 PS2 Patcher feature."""
 
     selected_season: int = field(
@@ -625,7 +679,7 @@ class NHL05PS2PatcherState:
 
 
 @dataclass
-class NHL94GenesisPatcherState:
+class NHL94GenesisPatcherState(Tracked):
     """State for the NHL94 Genesis Patcher feature."""
 
     # Season (start year: 2024 = 2024-25 season)
@@ -674,7 +728,7 @@ class NHL94GenesisPatcherState:
 
 
 @dataclass
-class KGJMLBPatcherState:
+class KGJMLBPatcherState(Tracked):
     """State for the KGJ MLB Patcher feature."""
 
     # MLB season year (e.g. 2025 = 2025 season)
@@ -717,7 +771,7 @@ class KGJMLBPatcherState:
 
 
 @dataclass
-class NBALive95PatcherState:
+class NBALive95PatcherState(Tracked):
     """State for the NBA Live 95 (Genesis) Patcher feature."""
 
     # NBA season (start year: 2025 = 2025-26 season)
@@ -767,7 +821,7 @@ class NBALive95PatcherState:
 
 
 @dataclass
-class MVPPSPPatcherState:
+class MVPPSPPatcherState(Tracked):
     """State for the MVP Baseball PSP Patcher feature."""
 
     # MLB season year (e.g. 2025 = 2025 season)
@@ -810,7 +864,7 @@ class MVPPSPPatcherState:
 
 
 @dataclass
-class NHL94SNESPatcherState:
+class NHL94SNESPatcherState(Tracked):
     """State for the NHL94 SNES Patcher feature."""
 
     # Season (start year: 2024 = 2024-25 season)
@@ -860,7 +914,7 @@ class NHL94SNESPatcherState:
 
 
 @dataclass
-class PES6PS2PatcherState:
+class PES6PS2PatcherState(Tracked):
     """State for the PES6 PS2 Patcher feature."""
 
     selected_season: int = field(default_factory=lambda: datetime.now().year)
@@ -912,7 +966,7 @@ class PES6PS2PatcherState:
 
 
 @dataclass
-class AuthTokenInputState:
+class AuthTokenInputState(Tracked):
     """State for auth token input modal."""
 
     show: bool = False
@@ -925,7 +979,7 @@ class AuthTokenInputState:
 
 
 @dataclass
-class SyncthingState:
+class SyncthingState(Tracked):
     """State for Syncthing save sync screen."""
 
     step: str = (
@@ -973,7 +1027,7 @@ class SyncthingState:
 
 
 @dataclass
-class FileExplorerState:
+class FileExplorerState(Tracked):
     """State for the file explorer screen."""
 
     current_path: str = ""
@@ -1042,14 +1096,19 @@ class UIRects:
     rects: Dict[str, Any] = field(default_factory=dict)
 
 
-class AppState:
+class AppState(Tracked):
     """
     Centralized application state for Console Utilities.
 
     This class replaces all global variables with organized state management.
     State is grouped by related functionality for better organization.
+
+    Input bookkeeping (navigation, touch) and the UI rects written back
+    after each render are not tracked, so they never dirty a frame.
     """
 
+    _LIST_FIELDS = frozenset({"game_list", "selected_system"})
+
     def __init__(self):
         # ---- Core Application Data ---- #
         self.data: List[Dict[str, Any]] = []  # System configurations
@@ -1172,6 +1231,49 @@ class AppState:
         self.running: bool = True
         self.movement_occurred: bool = False
 
+    @property
+    def version(self) -> int:
+        """Current state version; differs from an earlier one after any change."""
+        return _version
+
+    def changed_since(self, version: int) -> bool:
+        """True if any tracked state changed since ``version`` was read."""
+        return _version != version
+
+    @property
+    def list_generation(self) -> int:
+        """Identity of the games list; changes whenever it is replaced."""
+        return _list_generation
+
+    @staticmethod
+    def mark_changed() -> None:
+        """Mark state changed after editing a list, dict or set in place."""
+        _bump()
+
+    @property
+    def busy(self) -> bool:
+        """
+        True while background work updates state.
+
+        Such work may edit lists in place without touching the state, so
+        the main loop still refreshes the screen now and then while busy.
+        """
+        return bool(
+            self.download_queue.active
+            or self.loading.show
+            or self.scraper_queue.active
+            or self.confirm_modal.loading
+            or getattr(self.active_patcher, "is_fetching", False)
+            or getattr(self.active_patcher, "is_patching", False)
+            or self.dedupe_wizard.step in ("scanning", "processing")
+            or self.rename_wizard.step in ("scanning", "processing")
+            or (
+                # The wizard's step defaults to "scanning" while closed
+                self.ghost_cleaner_wizard.show
+                and self.ghost_cleaner_wizard.step in ("scanning", "cleaning")
+            )
+        )
+
     @property
     def active_patcher(self):
         """Return the active patcher state based on current mode.
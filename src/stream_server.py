@@ -7,22 +7,28 @@ frames without requiring any changes to app.py.
 
 Everything runs on a single HTTP port (7654) using multipart MJPEG for
 frame delivery and POST for input relay. No extra dependencies needed.
+The browser acknowledges each frame it shows; the acks drive per-client
+JPEG quality, scale and frame rate, and the end-to-end latency overlay.
 
 Usage: make stream
 """
 
-import io
 import json
 import os
 import socket
 import threading
 import time
+import urllib.parse
+import weakref
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from socketserver import ThreadingMixIn
 
 import pygame
 
 from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from utils.frame_encoder import FrameEncoder
+from utils.stream_hub import StreamHub, MJPEGSubscriber
+from utils.stream_rate import RateController
 
 PORT = 7654
 TARGET_FPS = 15
@@ -48,21 +54,171 @@ html, body { width: 100%; height: 100%; background: #000; overflow: hidden; touc
     background: #f44; transition: background 0.3s;
 }
 #status.connected { background: #4f4; }
+#stats {
+    position: fixed; bottom: 6px; left: 8px; z-index: 10;
+    background: rgba(0,0,0,0.6); color: #4f4; border-radius: 4px; padding: 3px 8px;
+    font: 11px monospace; pointer-events: none;
+}
+#stats:empty { display: none; }
 </style>
 </head>
 <body>
 <div id="status"></div>
 <button id="reload" style="position:fixed;top:6px;left:8px;z-index:10;background:rgba(0,0,0,0.6);color:#4f4;border:1px solid #4f4;border-radius:4px;padding:4px 10px;font-size:12px;font-family:monospace;cursor:pointer">Reload</button>
-<div id="wrap"><img id="screen" src="/mjpeg"></div>
+<div id="stats"></div>
+<div id="wrap"><img id="screen"></div>
 <script>
 const wrap = document.getElementById('wrap');
 const img = document.getElementById('screen');
 const status = document.getElementById('status');
+const statsEl = document.getElementById('stats');
+
+// ---- Adaptive MJPEG: frames are read with fetch so each one can be
+// acknowledged; the server sizes and paces frames from the acks ----
+const CLIENT_ID = Math.random().toString(36).slice(2);
+let streamCtrl = null;
+let shownUrl = null;
+let decoding = false;
+let queuedFrame = null;
+let clockOffset = 0;   // server clock minus client clock, ms
+let bestAckRtt = Infinity;
+let latency = null;
+
+function startStream() {
+    if (streamCtrl) streamCtrl.abort();
+    if (!window.ReadableStream || !window.AbortController) {
+        img.onload = () => { status.className = 'connected'; };
+        img.onerror = () => { status.className = ''; };
+        img.src = '/mjpeg?' + Date.now();
+        return;
+    }
+    const ctrl = new AbortController();
+    streamCtrl = ctrl;
+    fetch('/mjpeg?client=' + CLIENT_ID, {signal: ctrl.signal, cache: 'no-store'})
+        .then(res => readParts(res.body.getReader()))
+        .catch(() => {})
+        .then(() => {
+            if (streamCtrl !== ctrl) return;
+            status.className = '';
+            setTimeout(startStream, 1000);
+        });
+}
+
+function headerEnd(buf) {
+    for (let i = 0; i + 3 < buf.length; i++) {
+        if (buf[i] === 13 && buf[i + 1] === 10 && buf[i + 2] === 13 && buf[i + 3] === 10) return i;
+    }
+    return -1;
+}
+
+function parseHeaders(text) {
+    const headers = {};
+    for (const line of text.split(String.fromCharCode(10))) {
+        const i = line.indexOf(':');
+        if (i > 0) headers[line.slice(0, i).trim().toLowerCase()] = line.slice(i + 1).trim();
+    }
+    return {
+        length: parseInt(headers['content-length'], 10),
+        seq: parseInt(headers['x-frame-seq'], 10),
+        captured: parseInt(headers['x-capture-time'], 10)
+    };
+}
+
+async function readParts(reader) {
+    const decoder = new TextDecoder();
+    let buf = new Uint8Array(0);
+    let meta = null;
+    for (;;) {
+        const {value, done} = await reader.read();
+        if (done) return;
+        const joined = new Uint8Array(buf.length + value.length);
+        joined.set(buf);
+        joined.set(value, buf.length);
+        buf = joined;
+        for (;;) {
+            if (!meta) {
+                const end = headerEnd(buf);
+                if (end < 0) break;
+                meta = parseHeaders(decoder.decode(buf.subarray(0, end)));
+                buf = buf.subarray(end + 4);
+            }
+            // Part body is followed by CRLF
+            if (buf.length < meta.length + 2) break;
+            showFrame(buf.slice(0, meta.length), meta);
+            buf = buf.subarray(meta.length + 2);
+            meta = null;
+        }
+    }
+}
+
+function showFrame(bytes, meta) {
+    if (decoding) {
+        // Only the newest frame waits for the decoder
+        queuedFrame = [bytes, meta];
+        return;
+    }
+    decoding = true;
+    const url = URL.createObjectURL(new Blob([bytes], {type: 'image/jpeg'}));
+    img.onload = () => {
+        if (shownUrl) URL.revokeObjectURL(shownUrl);
+        shownUrl = url;
+        status.className = 'connected';
+        ackFrame(meta);
+        nextFrame();
+    };
+    img.onerror = () => {
+        URL.revokeObjectURL(url);
+        nextFrame();
+    };
+    img.src = url;
+}
+
+function nextFrame() {
+    decoding = false;
+    if (queuedFrame) {
+        const [bytes, meta] = queuedFrame;
+        queuedFrame = null;
+        showFrame(bytes, meta);
+    }
+}
+
+function ackFrame(meta) {
+    const shown = Date.now();
+    fetch('/ack', {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify({client: CLIENT_ID, seq: meta.seq})
+    }).then(r => r.json()).then(stats => {
+        const back = Date.now();
+        // Server clock read mid-request; trust the fastest round trips
+        bestAckRtt += 1;
+        if (back - shown <= bestAckRtt) {
+            bestAckRtt = back - shown;
+            clockOffset = stats.time - (shown + back) / 2;
+        }
+        if (meta.captured) {
+            const sample = shown + clockOffset - meta.captured;
+            latency = latency === null ? sample : latency * 0.8 + sample * 0.2;
+        }
+        drawStats(stats);
+    }).catch(() => {});
+}
+
+function drawStats(stats) {
+    const parts = [];
+    if (latency !== null) parts.push('latency ' + Math.max(0, Math.round(latency)) + ' ms');
+    if (stats.fps) parts.push(stats.fps + ' fps');
+    if (stats.scale) parts.push(Math.round(stats.scale * 100) + '% q' + stats.quality);
+    if (stats.rtt_ms !== null && stats.rtt_ms !== undefined) parts.push('rtt ' + stats.rtt_ms + ' ms');
+    if (stats.rate_kbps) parts.push(stats.rate_kbps + ' kbps');
+    statsEl.textContent = parts.join(' · ');
+}
 
 document.getElementById('reload').addEventListener('click', () => {
     img.src = '';
-    setTimeout(() => { img.src = '/mjpeg?' + Date.now(); }, 100);
+    setTimeout(startStream, 100);
 });
+startStream();
 
 const GAME_W = {width};
 const GAME_H = {height};
@@ -80,9 +236,6 @@ function resize() {
 window.addEventListener('resize', resize);
 resize();
 
-img.onload = () => { status.className = 'connected'; };
-img.onerror = () => { status.className = ''; };
-
 function canvasCoords(clientX, clientY) {
     const rect = wrap.getBoundingClientRect();
     return {
@@ -189,12 +342,11 @@ class StreamServer:
     def __init__(self, width, height):
         self.width = width
         self.height = height
-        self._frame = None
-        self._frame_lock = threading.Lock()
-        self._frame_event = threading.Event()
-        self._frame_interval = 1.0 / TARGET_FPS
-        self._last_capture_time = 0.0
-        self._capture_buf = io.BytesIO()
+        self._encoder = FrameEncoder(fps=TARGET_FPS, quality=80)
+        self._hub = StreamHub()
+        self._encoder.add_listener(self._hub.notify)
+        # Adaptive clients by id; entries go away with their stream
+        self._rates = weakref.WeakValueDictionary()
         self._html_bytes = (
             CLIENT_HTML.replace("{width}", str(width))
             .replace("{height}", str(height))
@@ -210,25 +362,8 @@ class StreamServer:
         thread.start()
 
     def capture_frame(self, surface):
-        """Capture the current pygame surface as JPEG bytes (throttled, buffer-reused)."""
-        now = time.monotonic()
-        if now - self._last_capture_time < self._frame_interval:
-            return
-        self._last_capture_time = now
-
-        buf = self._capture_buf
-        buf.seek(0)
-        buf.truncate(0)
-        try:
-            pygame.image.save(surface, buf, "frame.jpg")
-        except Exception:
-            buf.seek(0)
-            buf.truncate(0)
-            pygame.image.save(surface, buf, "frame.png")
-
-        with self._frame_lock:
-            self._frame = buf.getvalue()
-        self._frame_event.set()
+        """Hand the current pygame surface to the encoder thread (throttled)."""
+        self._encoder.capture(surface)
 
     def _run_http(self):
         """Run the HTTP server."""
@@ -238,7 +373,7 @@ class StreamServer:
             protocol_version = "HTTP/1.1"
 
             def do_GET(self):
-                if self.path == "/mjpeg":
+                if self.path.split("?")[0] == "/mjpeg":
                     self._handle_mjpeg()
                 else:
                     self._handle_page()
@@ -246,6 +381,8 @@ class StreamServer:
             def do_POST(self):
                 if self.path == "/input":
                     self._handle_input()
+                elif self.path == "/ack":
+                    self._handle_ack()
                 else:
                     self.send_error(404)
 
@@ -259,7 +396,6 @@ class StreamServer:
                 self.wfile.write(body)
 
             def _handle_mjpeg(self):
-                boundary = b"--frame"
                 self.send_response(200)
                 self.send_header(
                     "Content-Type",
@@ -268,31 +404,42 @@ class StreamServer:
                 self.send_header("Cache-Control", "no-cache, no-store")
                 self.send_header("Connection", "keep-alive")
                 self.end_headers()
-
-                interval = 1.0 / TARGET_FPS
+                # Frames are sent from the hub's event loop, not this thread
+                self.close_connection = True
+                query = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
+                client_id = query.get("client", [""])[0]
+                rate = None
+                if client_id:
+                    # The client acknowledges frames, so adapt to its link
+                    rate = RateController(TARGET_FPS)
+                    server_ref._rates[client_id] = rate
+                subscriber = MJPEGSubscriber(server_ref._encoder, rate)
+                server_ref._hub.attach(self.connection, subscriber)
+
+            def _handle_ack(self):
+                """POST /ack {client, seq} - Frame shown; returns link stats."""
+                now = time.monotonic()
+                length = int(self.headers.get("Content-Length", 0))
                 try:
-                    while True:
-                        server_ref._frame_event.wait(timeout=1.0)
-                        server_ref._frame_event.clear()
-
-                        with server_ref._frame_lock:
-                            frame = server_ref._frame
-
-                        if frame:
-                            self.wfile.write(
-                                boundary + b"\r\n"
-                                b"Content-Type: image/jpeg\r\n"
-                                b"Content-Length: "
-                                + str(len(frame)).encode()
-                                + b"\r\n\r\n"
-                                + frame
-                                + b"\r\n"
-                            )
-                            self.wfile.flush()
-
-                        time.sleep(interval)
-                except (BrokenPipeError, ConnectionResetError):
-                    pass
+                    data = json.loads(self.rfile.read(length))
+                    rate = server_ref._rates.get(str(data["client"]))
+                    seq = int(data["seq"])
+                except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                    rate = None
+                stats = {}
+                if rate is not None:
+                    rate.acked(seq, now)
+                    stats = rate.stats()
+                    # A window slot opened up
+                    server_ref._hub.notify()
+                # Server clock for the client's latency estimate
+                stats["time"] = time.time() * 1000
+                body = json.dumps(stats).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
 
             def _handle_input(self):
                 length = int(self.headers.get("Content-Length", 0))
@@ -387,8 +534,9 @@ class StreamServer:
 
 
 def _patch_flip(server):
-    """Monkey-patch pygame.display.flip to capture frames after each flip."""
+    """Monkey-patch pygame.display.flip/update to capture frames after each."""
     _original_flip = pygame.display.flip
+    _original_update = pygame.display.update
 
     def patched_flip():
         _original_flip()
@@ -396,7 +544,15 @@ def _patch_flip(server):
         if surface:
             server.capture_frame(surface)
 
+    def patched_update(*args):
+        # Progress-only frames are pushed with partial updates
+        _original_update(*args)
+        surface = pygame.display.get_surface()
+        if surface:
+            server.capture_frame(surface)
+
     pygame.display.flip = patched_flip
+    pygame.display.update = patched_update
 
 
 if __name__ == "__main__":
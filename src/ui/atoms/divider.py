@@ -5,6 +5,7 @@ Divider atom - Line separator rendering.
 import pygame
 from typing import Tuple, Optional
 
+from ui import fonts
 from ui.theme import Theme, Color, default_theme
 
 
@@ -108,9 +109,8 @@ class Divider:
         if text_color is None:
             text_color = self.theme.text_disabled
 
-        font = pygame.font.Font(
-            getattr(self.theme, "font_path", None),
-            self.theme.font_size_sm,
+        font = fonts.get_font(
+            getattr(self.theme, "font_path", None), self.theme.font_size_sm
         )
         text_surface = font.render(label, True, text_color)
         text_rect = text_surface.get_rect(centery=y, centerx=(x_start + x_end) // 2)
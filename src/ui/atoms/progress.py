@@ -5,6 +5,7 @@ Progress bar atom - Basic progress bar rendering.
 import pygame
 from typing import Tuple, Optional
 
+from ui import fonts
 from ui.theme import Theme, Color, default_theme
 
 
@@ -111,14 +112,15 @@ class ProgressBar:
             screen, rect, progress, track_color=track_color, fill_color=fill_color
         )
 
-        # Draw text
-        font = pygame.font.Font(
+        # Draw text from cached glyphs; the percentage changes every frame
+        atlas = fonts.get_atlas(
             getattr(self.theme, "font_path", None),
             self.theme.font_size_sm,
+            text_color,
         )
-        text_surface = font.render(text, True, text_color)
-        text_rect = text_surface.get_rect(center=rect.center)
-        screen.blit(text_surface, text_rect)
+        text_rect = pygame.Rect((0, 0), atlas.size(text))
+        text_rect.center = rect.center
+        atlas.render(screen, text, text_rect.topleft)
 
         return rect
 
@@ -8,6 +8,7 @@ import time
 from typing import Tuple, Optional
 
 from ui.theme import Theme, Color, default_theme
+from ui.damage import mark_live
 
 
 class Spinner:
@@ -45,6 +46,16 @@ class Spinner:
 
         radius = size // 2
         cx, cy = center
+        # Animated: redraw this area on progress-only frames
+        mark_live(
+            pygame.Rect(
+                cx - radius - thickness,
+                cy - radius - thickness,
+                (radius + thickness) * 2,
+                (radius + thickness) * 2,
+            ),
+            animated=True,
+        )
 
         # Calculate rotation based on time
         rotation = (time.time() * speed * 2 * math.pi) % (2 * math.pi)
@@ -134,6 +145,11 @@ class Spinner:
 
         radius = size // 2
         cx, cy = center
+        # Animated: redraw this area on progress-only frames
+        mark_live(
+            pygame.Rect(cx - radius - 3, cy - radius - 3, size + 6, size + 6),
+            animated=True,
+        )
 
         # Calculate rotation based on time
         rotation = (time.time() * 2 * math.pi) % (2 * math.pi)
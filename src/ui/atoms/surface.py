@@ -5,6 +5,7 @@ Surface atom - Card and panel surface rendering.
 import pygame
 from typing import Tuple, Optional
 
+from ui import fonts
 from ui.theme import Theme, Color, default_theme
 
 
@@ -159,9 +160,8 @@ class Surface:
 
         # Draw title if provided
         if title:
-            font = pygame.font.Font(
-                getattr(self.theme, "font_path", None),
-                self.theme.font_size_lg,
+            font = fonts.get_font(
+                getattr(self.theme, "font_path", None), self.theme.font_size_lg
             )
             title_surface = font.render(title, True, self.theme.text_primary)
             title_rect = title_surface.get_rect(
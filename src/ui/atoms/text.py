@@ -2,46 +2,64 @@
 Text atom - Basic text rendering component.
 """
 
+import collections
 import pygame
 from typing import Tuple, Optional
 
+from ui import fonts
+from ui.text_cache import text_cache
 from ui.theme import Theme, Color, default_theme
 
+# Fonts are shared process-wide, so measurements can be too:
+# (font, text) -> size and (font, text, max_width, suffix) -> fitted text
+_sizes: "collections.OrderedDict[tuple, Tuple[int, int]]" = collections.OrderedDict()
+_fitted: "collections.OrderedDict[tuple, str]" = collections.OrderedDict()
+# Entries per memo; the least recently used one is evicted beyond this
+MAX_MEMO = 4096
+
+
+def _size(font: pygame.font.Font, text: str) -> Tuple[int, int]:
+    """Memoized ``font.size(text)``."""
+    key = (font, text)
+    size = _sizes.get(key)
+    if size is not None:
+        _sizes.move_to_end(key)
+        return size
+    size = _sizes[key] = font.size(text)
+    if len(_sizes) > MAX_MEMO:
+        _sizes.popitem(last=False)
+    return size
+
 
 class Text:
     """
     Basic text rendering atom.
 
     Handles text rendering with various styles, truncation,
-    and alignment options.
+    and alignment options. Rendered strings go to the shared text
+    cache; instances drawing screen chrome (headers, button labels)
+    pin theirs so list content can't evict them.
     """
 
-    _TEXT_CACHE_MAX = 512
-
-    def __init__(self, theme: Theme = default_theme):
+    def __init__(self, theme: Theme = default_theme, pinned: bool = False):
         self.theme = theme
-        self._font_cache: dict = {}
-        self._text_surface_cache: dict = {}
+        self.pinned = pinned
 
     def get_font(self, size: int) -> pygame.font.Font:
-        """Get or create a font of the given size."""
-        if size not in self._font_cache:
-            font_path = getattr(self.theme, "font_path", None)
-            self._font_cache[size] = pygame.font.Font(font_path, size)
-        return self._font_cache[size]
+        """Get the shared theme font of the given size."""
+        return fonts.get_font(getattr(self.theme, "font_path", None), size)
 
     def _get_text_surface(
         self, text: str, size: int, color: Color, antialias: bool = True
     ) -> pygame.Surface:
         """Get a cached text surface, rendering only on cache miss."""
-        key = (text, size, color, antialias)
-        surface = self._text_surface_cache.get(key)
+        font_path = getattr(self.theme, "font_path", None)
+        key = (font_path, text, size, color, antialias)
+        surface = text_cache.get(key, self.pinned)
         if surface is None:
-            if len(self._text_surface_cache) >= self._TEXT_CACHE_MAX:
-                self._text_surface_cache.clear()
             font = self.get_font(size)
             surface = font.render(text, antialias, color)
-            self._text_surface_cache[key] = surface
+            text_cache.put(key, surface, self.pinned)
         return surface
 
     def render(
@@ -99,6 +117,41 @@ class Text:
         screen.blit(surface, rect)
         return rect
 
+    def render_dynamic(
+        self,
+        screen: pygame.Surface,
+        text: str,
+        position: Tuple[int, int],
+        color: Optional[Color] = None,
+        size: Optional[int] = None,
+        align: str = "left",
+        max_width: Optional[int] = None,
+    ) -> pygame.Rect:
+        """
+        Render text that changes from frame to frame (percentages, speeds).
+
+        Composed from cached glyphs, so new values don't render or cache
+        a surface per string. Same arguments as ``render``, always
+        antialiased.
+
+        Returns:
+            Rect of rendered text
+        """
+        if color is None:
+            color = self.theme.text_primary
+        if size is None:
+            size = self.theme.font_size_md
+
+        if max_width:
+            text = self._truncate(text, self.get_font(size), max_width)
+
+        atlas = fonts.get_atlas(getattr(self.theme, "font_path", None), size, color)
+        x, y = position
+        if align != "left":
+            width = atlas.size(text)[0]
+            x -= width // 2 if align == "center" else width
+        return atlas.render(screen, text, (x, y))
+
     def render_multiline(
         self,
         screen: pygame.Surface,
@@ -166,8 +219,7 @@ class Text:
         if size is None:
             size = self.theme.font_size_md
 
-        font = self.get_font(size)
-        return font.size(text)
+        return _size(self.get_font(size), text)
 
     def render_rainbow(
         self,
@@ -286,8 +338,7 @@ class Text:
         if size is None:
             size = self.theme.font_size_md
 
-        font = self.get_font(size)
-        text_width, text_height = font.size(text)
+        text_width, text_height = _size(self.get_font(size), text)
 
         # If text fits, render normally (no scrolling needed)
         if text_width <= max_width:
@@ -326,22 +377,31 @@ class Text:
         Returns:
             Truncated text
         """
-        if font.size(text)[0] <= max_width:
-            return text
-
-        suffix_width = font.size(suffix)[0]
-        available_width = max_width - suffix_width
-
-        # Binary search for optimal truncation point
-        low, high = 0, len(text)
-        while low < high:
-            mid = (low + high + 1) // 2
-            if font.size(text[:mid])[0] <= available_width:
-                low = mid
-            else:
-                high = mid - 1
-
-        return text[:low] + suffix
+        key = (font, text, max_width, suffix)
+        fitted = _fitted.get(key)
+        if fitted is not None:
+            _fitted.move_to_end(key)
+            return fitted
+
+        if _size(font, text)[0] <= max_width:
+            fitted = text
+        else:
+            available_width = max_width - _size(font, suffix)[0]
+
+            # Binary search for optimal truncation point
+            low, high = 0, len(text)
+            while low < high:
+                mid = (low + high + 1) // 2
+                if font.size(text[:mid])[0] <= available_width:
+                    low = mid
+                else:
+                    high = mid - 1
+            fitted = text[:low] + suffix
+
+        _fitted[key] = fitted
+        if len(_fitted) > MAX_MEMO:
+            _fitted.popitem(last=False)
+        return fitted
 
 
 # Default instance
@@ -0,0 +1,92 @@
+"""
+Damage tracking - Live screen regions for partial redraws.
+
+Widgets whose content changes without user input (progress bars, speed
+labels, spinners, loading messages) register their rects while they
+render. On frames where only background progress moved, the app renders
+once clipped to the bounding box of those regions and pushes just that
+box with ``pygame.display.update`` instead of recomposing the whole
+screen.
+"""
+
+import pygame
+from typing import List
+
+# Beyond this many separate regions a single bounding rect is cheaper
+MAX_REGIONS = 4
+
+_live_rects: List[pygame.Rect] = []
+# Whether a registered region animates with time rather than with state
+_animating = False
+
+
+def mark_live(rect: pygame.Rect, animated: bool = False) -> None:
+    """
+    Register a region that changes on its own between full redraws.
+
+    Args:
+        rect: Screen region
+        animated: The region changes every frame (spinners), not only
+            when the state it shows changes
+    """
+    global _animating
+    _live_rects.append(pygame.Rect(rect))
+    _animating = _animating or animated
+
+
+def animating() -> bool:
+    """True if a region registered since the last reset animates."""
+    return _animating
+
+
+def reset() -> None:
+    """Forget regions registered so far (call before a render pass)."""
+    global _animating
+    _live_rects.clear()
+    _animating = False
+
+
+def _area(rect: pygame.Rect) -> int:
+    return rect.width * rect.height
+
+
+def _find_mergeable(rect: pygame.Rect, regions: List[pygame.Rect]) -> int:
+    """Index of a region to merge with ``rect``, or -1."""
+    for index, other in enumerate(regions):
+        if rect.inflate(2, 2).colliderect(other):
+            return index
+        # Merge when the bounding rect wastes less than the regions cover
+        if _area(rect.union(other)) <= 2 * (_area(rect) + _area(other)):
+            return index
+    return -1
+
+
+def collect() -> List[pygame.Rect]:
+    """
+    Return the registered live regions, merged, and reset the registry.
+
+    Overlapping, touching or close rects are merged; if more than
+    MAX_REGIONS remain they are collapsed into one bounding rect.
+
+    Returns:
+        List of non-overlapping rects (empty if nothing registered)
+    """
+    merged: List[pygame.Rect] = []
+    for rect in _live_rects:
+        if rect.width <= 0 or rect.height <= 0:
+            continue
+        rect = rect.copy()
+        # Absorb every region this one touches or sits close to, repeat
+        # until stable; each region is pushed to the display separately,
+        # so nearby ones are cheaper as one
+        while True:
+            index = _find_mergeable(rect, merged)
+            if index == -1:
+                break
+            rect.union_ip(merged.pop(index))
+        merged.append(rect)
+    _live_rects.clear()
+
+    if len(merged) > MAX_REGIONS:
+        return [merged[0].unionall(merged[1:])]
+    return merged
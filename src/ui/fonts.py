@@ -0,0 +1,170 @@
+"""
+Font registry - Shared fonts and glyph atlases for all UI components.
+
+Opening a TTF file and parsing it is far more expensive than rendering
+with it, so every component gets its fonts here: one ``pygame.font.Font``
+per (path, size, style) for the whole process.
+
+Text that changes every frame (percentages, speeds, ETAs, counters)
+would otherwise produce a new ``font.render`` surface per frame and
+flood the text caches. A GlyphAtlas renders each character once per
+color into a shared sheet and composes strings by blitting glyphs
+straight to the target surface.
+"""
+
+import pygame
+from typing import Dict, List, Optional, Tuple
+
+from ui.theme import Color
+
+# Glyph sheet width and maximum height in pixels; a full sheet is reset
+ATLAS_WIDTH = 512
+ATLAS_MAX_HEIGHT = 2048
+
+_fonts: Dict[tuple, pygame.font.Font] = {}
+_atlases: Dict[tuple, "GlyphAtlas"] = {}
+
+
+def get_font(
+    path: Optional[str], size: int, bold: bool = False, italic: bool = False
+) -> pygame.font.Font:
+    """
+    Get the shared font for a file, size and style.
+
+    Args:
+        path: TTF file path (None for pygame's default font)
+        size: Point size
+        bold: Synthesized bold
+        italic: Synthesized italic
+
+    Returns:
+        Font object; don't change its style, it is shared
+    """
+    key = (path, size, bold, italic)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.Font(path, size)
+        font.set_bold(bold)
+        font.set_italic(italic)
+        _fonts[key] = font
+    return font
+
+
+def get_atlas(path: Optional[str], size: int, color: Color) -> "GlyphAtlas":
+    """Get the shared glyph atlas for a font and text color."""
+    key = (path, size, tuple(color))
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = GlyphAtlas(get_font(path, size), color)
+        _atlases[key] = atlas
+    return atlas
+
+
+def clear() -> None:
+    """Drop all fonts and atlases (e.g. before pygame.font.quit())."""
+    _fonts.clear()
+    _atlases.clear()
+
+
+class GlyphAtlas:
+    """
+    Antialiased glyphs of one font and color, packed into a single sheet.
+
+    Strings are laid out glyph by glyph without kerning, which is what
+    frequently changing labels want anyway: digits keep their positions
+    as the value changes.
+    """
+
+    def __init__(self, font: pygame.font.Font, color: Color):
+        self.font = font
+        self.color = color
+        self.height = font.get_height()
+        self._sheet: Optional[pygame.Surface] = None
+        # char -> area of the glyph in the sheet
+        self._glyphs: Dict[str, pygame.Rect] = {}
+        self._cursor = (0, 0)
+
+    def size(self, text: str) -> Tuple[int, int]:
+        """Width and height of ``text`` as composed by this atlas."""
+        areas = self._areas(text)
+        if areas is None:
+            return self.font.size(text)
+        return sum(area.width for area in areas), self.height
+
+    def render(
+        self, screen: pygame.Surface, text: str, position: Tuple[int, int]
+    ) -> pygame.Rect:
+        """
+        Blit ``text`` with its top-left corner at ``position``.
+
+        Returns:
+            Rect covered by the text
+        """
+        areas = self._areas(text)
+        if areas is None:
+            return screen.blit(self.font.render(text, True, self.color), position)
+        sheet = self._sheet
+        left, y = position
+        x = left
+        blits = []
+        for area in areas:
+            blits.append((sheet, (x, y), area))
+            x += area.width
+        if blits:
+            screen.blits(blits, doreturn=False)
+        return pygame.Rect(left, y, x - left, self.height)
+
+    def _areas(self, text: str) -> Optional[List[pygame.Rect]]:
+        """
+        Sheet areas of the glyphs of ``text``, adding missing ones; None
+        if the string has more distinct glyphs than the sheet holds.
+        """
+        glyphs = self._glyphs
+        # A full sheet is reset, possibly dropping glyphs added earlier in
+        # the same pass; the second pass adds those back
+        for _ in range(2):
+            try:
+                return [glyphs[char] for char in text]
+            except KeyError:
+                pass
+            for char in text:
+                if char not in glyphs:
+                    self._add(char)
+        try:
+            return [glyphs[char] for char in text]
+        except KeyError:
+            return None
+
+    def _add(self, char: str) -> pygame.Rect:
+        """Render a glyph into the sheet and return its area."""
+        glyph = self.font.render(char, True, self.color)
+        width, height = glyph.get_size()
+        x, y = self._cursor
+        if x + width > ATLAS_WIDTH:
+            x, y = 0, y + self.height
+        if self._sheet is None or y + height > self._sheet.get_height():
+            if not self._grow(y + height):
+                # Sheet full: start over with just this glyph
+                self._sheet = None
+                self._glyphs.clear()
+                x, y = 0, 0
+                self._grow(height)
+        # Max-blend onto the transparent sheet copies color and alpha as is
+        self._sheet.blit(glyph, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        area = pygame.Rect(x, y, width, height)
+        self._glyphs[char] = area
+        self._cursor = (x + width, y)
+        return area
+
+    def _grow(self, min_height: int) -> bool:
+        """Enlarge the sheet to at least ``min_height``; False if too tall."""
+        height = self._sheet.get_height() if self._sheet else self.height * 4
+        while height < min_height:
+            height *= 2
+        if self._sheet is not None and height > ATLAS_MAX_HEIGHT:
+            return False
+        sheet = pygame.Surface((ATLAS_WIDTH, height), pygame.SRCALPHA)
+        if self._sheet is not None:
+            sheet.blit(self._sheet, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        self._sheet = sheet
+        return True
@@ -0,0 +1,125 @@
+"""
+Layer cache - Static screen chrome drawn once and blitted back.
+
+Parts of a screen that rarely change (the header, list rows around the
+highlighted one, grid cells, modal panels and button rows) are drawn
+through ``LayerCache.draw``. When a layer is painted twice in a row with
+the same key, its region is copied off the screen. From then on a single
+opaque blit replaces all of its drawing until the key changes. Capturing
+on the second paint keeps fast scrolling, where keys change every frame,
+from paying for copies that are never reused.
+
+A layer is a snapshot of the screen region, so it also holds whatever
+was underneath when it was painted. Only regions painted over something
+that can't change under the same key may be layered: an opaque panel,
+or the app background for full-screen templates. The app clears the
+cache when it rebuilds the background (theme or window size change).
+"""
+
+import collections
+import pygame
+from typing import Callable, Dict, Hashable, List
+
+# Pixel bytes held by all layers together
+LAYER_CACHE_BUDGET = 16 * 1024 * 1024
+
+
+class LayerCache:
+    """Named screen-region snapshots in an LRU with a byte budget."""
+
+    def __init__(self, budget: int = LAYER_CACHE_BUDGET):
+        self.budget = budget
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.captures = 0
+        self.evictions = 0
+        # name -> [key, snapshot or None, snapshot bytes], least recently
+        # drawn first
+        self._layers: "collections.OrderedDict[Hashable, List]" = (
+            collections.OrderedDict()
+        )
+
+    def draw(
+        self,
+        screen: pygame.Surface,
+        name: Hashable,
+        rect: pygame.Rect,
+        key: Hashable,
+        paint: Callable[[], None],
+    ) -> bool:
+        """
+        Draw a layer from its snapshot, or paint it.
+
+        Args:
+            screen: Surface to draw to
+            name: Layer name, unique per owner (e.g. ``(id(self), "rows")``)
+            rect: Screen region that ``paint`` draws into
+            key: Everything the painted pixels depend on besides the region
+                and the screen size
+            paint: Draws the layer onto ``screen`` inside ``rect``
+
+        Returns:
+            True if the layer was blitted from its snapshot
+        """
+        rect = pygame.Rect(rect).clip(screen.get_rect())
+        key = (key, tuple(rect), screen.get_size())
+        entry = self._layers.get(name)
+        if entry is not None and entry[0] == key:
+            self._layers.move_to_end(name)
+            if entry[1] is not None:
+                screen.blit(entry[1], rect)
+                self.hits += 1
+                return True
+            # Same key twice in a row: worth keeping, unless this is a
+            # clipped partial redraw that paints only part of the region
+            capture = screen.get_clip() == screen.get_rect()
+        else:
+            capture = False
+
+        self.misses += 1
+        paint()
+        snapshot = None
+        size = rect.width * rect.height * screen.get_bytesize()
+        if capture and 0 < size <= self.budget:
+            snapshot = screen.subsurface(rect).copy()
+            self.captures += 1
+        self._store(name, key, snapshot, size if snapshot is not None else 0)
+        return False
+
+    def _store(self, name: Hashable, key: Hashable, snapshot, size: int) -> None:
+        self.discard(name)
+        self._layers[name] = [key, snapshot, size]
+        self.bytes += size
+        while self.bytes > self.budget:
+            _, (_, _, evicted) = self._layers.popitem(last=False)
+            self.bytes -= evicted
+            self.evictions += 1
+
+    def discard(self, name: Hashable) -> None:
+        """Forget a layer."""
+        entry = self._layers.pop(name, None)
+        if entry is not None:
+            self.bytes -= entry[2]
+
+    def clear(self) -> None:
+        """Forget all layers (background, theme or screen size changed)."""
+        self._layers.clear()
+        self.bytes = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Layer count, snapshot bytes, and hit/miss/capture counters."""
+        lookups = self.hits + self.misses
+        return {
+            "layers": len(self._layers),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "captures": self.captures,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Shared instance
+layer_cache = LayerCache()
@@ -21,7 +21,7 @@ class ActionButton:
     def __init__(self, theme: Theme = default_theme):
         self.theme = theme
         self.button = Button(theme)
-        self.text = Text(theme)
+        self.text = Text(theme, pinned=True)
 
     def render(
         self,
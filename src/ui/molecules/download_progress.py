@@ -72,7 +72,7 @@ class DownloadProgress:
 
         # Draw percentage in center of progress bar
         percent_text = f"{int(progress * 100)}%"
-        self.text.render(
+        self.text.render_dynamic(
             screen,
             percent_text,
             progress_rect.center,
@@ -86,7 +86,7 @@ class DownloadProgress:
 
         # Size stats (left)
         size_text = self._format_size_progress(downloaded, total_size)
-        self.text.render(
+        self.text.render_dynamic(
             screen,
             size_text,
             (rect.left, stats_y),
@@ -102,7 +102,7 @@ class DownloadProgress:
                 speed_text = f"{speed_text} - {eta_text}"
         else:
             speed_text = "-"
-        self.text.render(
+        self.text.render_dynamic(
             screen,
             speed_text,
             (rect.right, stats_y),
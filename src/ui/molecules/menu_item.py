@@ -47,7 +47,7 @@ class MenuItem:
             show_checkbox: Show selection checkbox
 
         Returns:
-            Item rect
+            Part of the item rect drawn into, from its left edge
         """
         # Calculate content areas
         padding = self.theme.padding_sm
@@ -146,7 +146,7 @@ class MenuItem:
             display_label = label
 
         if highlighted and text_scroll_offset > 0:
-            self.text.render_scrolled(
+            label_rect = self.text.render_scrolled(
                 screen,
                 display_label,
                 (content_left, rect.centery - self.theme.font_size_md // 4),
@@ -156,7 +156,7 @@ class MenuItem:
                 size=self.theme.font_size_md,
             )
         else:
-            self.text.render(
+            label_rect = self.text.render(
                 screen,
                 display_label,
                 (content_left, rect.centery - self.theme.font_size_md // 4),
@@ -165,7 +165,10 @@ class MenuItem:
                 max_width=max_text_width,
             )
 
-        return rect
+        # Checkbox and thumbnail sit left of the label, secondary text at
+        # the right edge
+        right = rect.right - padding if secondary_text else label_rect.right
+        return pygame.Rect(rect.left, rect.top, max(0, right - rect.left), rect.height)
 
     def render_divider(
         self, screen: pygame.Surface, rect: pygame.Rect, label: str
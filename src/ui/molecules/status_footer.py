@@ -11,6 +11,7 @@ from typing import Optional, List
 from ui.theme import Theme, Color, default_theme
 from ui.atoms.text import Text
 from ui.atoms.progress import ProgressBar
+from ui.damage import mark_live
 from constants import BEZEL_INSET
 
 
@@ -77,6 +78,7 @@ class StatusFooter:
             # Stack from bottom: last item is at very bottom, above bezel
             bar_y = screen_height - inset - (len(items) - i) * self.BAR_HEIGHT
             bar_rect = pygame.Rect(inset, bar_y, safe_width, self.BAR_HEIGHT)
+            mark_live(bar_rect)
 
             # Background with top border
             pygame.draw.rect(screen, self.theme.surface, bar_rect)
@@ -87,11 +89,13 @@ class StatusFooter:
                 (inset + safe_width, bar_rect.top),
             )
 
-            # Left side: status text (vertically centered in bar)
+            # Left side: status text (vertically centered in bar); it
+            # changes with every update, so compose it from glyphs rather
+            # than caching a surface per string
             font = self.text.get_font(self.theme.font_size_sm)
             text_h = font.get_height()
             text_y = bar_rect.centery - text_h // 2
-            self.text.render(
+            self.text.render_dynamic(
                 screen,
                 item.label,
                 (inset + self.theme.padding_md, text_y),
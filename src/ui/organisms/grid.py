@@ -3,7 +3,7 @@ Grid organism - Grid layout of thumbnails.
 """
 
 import pygame
-from typing import List, Set, Tuple, Optional, Any, Callable
+from typing import List, Set, Tuple, Optional, Any, Callable, Hashable
 
 from ui.theme import Theme, default_theme
 from ui.molecules.thumbnail import Thumbnail
@@ -34,6 +34,9 @@ class Grid:
         get_image: Optional[Callable[[Any], pygame.Surface]] = None,
         get_placeholder: Optional[Callable[[Any], str]] = None,
         fill_image: bool = False,
+        layer: Optional[
+            Callable[[pygame.Rect, Hashable, Callable[[], None]], bool]
+        ] = None,
     ) -> Tuple[List[pygame.Rect], int]:
         """
         Render a grid of items.
@@ -49,6 +52,9 @@ class Grid:
             get_label: Function to get label from item
             get_image: Function to get thumbnail from item
             get_placeholder: Function to get placeholder text
+            layer: Draws the cells other than the highlighted one as a
+                cached layer, given (rect, key, paint). Only for grids drawn
+                straight over the app background.
 
         Returns:
             Tuple of (list of item rects, scroll offset)
@@ -82,8 +88,8 @@ class Grid:
         highlighted_row = highlighted // columns
         scroll_row = self._calculate_scroll_row(highlighted_row, rows, visible_rows)
 
-        # Render visible cells
-        item_rects = []
+        # Collect visible cells: (index, rect, label, image, placeholder)
+        cells = []
         start_idx = scroll_row * columns
 
         y = rect.top + padding
@@ -98,35 +104,74 @@ class Grid:
                     break
 
                 item = items[idx]
-                cell_rect = pygame.Rect(x, y, cell_width, cell_height)
-
-                # Get item properties
-                label = get_label(item)
-                image = get_image(item) if get_image else None
-                placeholder = get_placeholder(item)
-
-                # Render thumbnail with label
-                is_selected = idx in selected
-                self.thumbnail.render_with_label(
-                    screen,
-                    cell_rect,
-                    label=label,
-                    image=image,
-                    placeholder_text=placeholder,
-                    selected=is_selected,
-                    highlighted=(idx == highlighted),
-                    fill=fill_image,
+                cells.append(
+                    (
+                        idx,
+                        pygame.Rect(x, y, cell_width, cell_height),
+                        get_label(item),
+                        get_image(item) if get_image else None,
+                        get_placeholder(item),
+                    )
                 )
-
-                # Draw checkbox overlay if selected
-                if is_selected:
-                    self._draw_checkbox(screen, cell_rect)
-
-                item_rects.append(cell_rect)
                 x += cell_width + padding
 
             y += cell_height + padding
 
+        def render_cell(idx, cell_rect, label, image, placeholder):
+            # Render thumbnail with label
+            is_selected = idx in selected
+            self.thumbnail.render_with_label(
+                screen,
+                cell_rect,
+                label=label,
+                image=image,
+                placeholder_text=placeholder,
+                selected=is_selected,
+                highlighted=(idx == highlighted),
+                fill=fill_image,
+            )
+
+            # Draw checkbox overlay if selected
+            if is_selected:
+                self._draw_checkbox(screen, cell_rect)
+
+        if layer is None:
+            for cell in cells:
+                render_cell(*cell)
+        else:
+            # Everything but the highlighted cell changes only when the grid
+            # scrolls, selection changes or an image arrives
+            static_cells = [cell for cell in cells if cell[0] != highlighted]
+            key = (
+                highlighted,
+                fill_image,
+                tuple(
+                    (
+                        idx,
+                        tuple(cell_rect),
+                        label,
+                        # The surface, not its id: the layer keeps it
+                        # alive, so the id can't come back with other art
+                        image,
+                        placeholder,
+                        idx in selected,
+                    )
+                    for idx, cell_rect, label, image, placeholder in static_cells
+                ),
+            )
+
+            def paint():
+                for cell in static_cells:
+                    render_cell(*cell)
+
+            # The last row may reach past the grid area
+            layer(rect.unionall([cell[1] for cell in cells]), key, paint)
+            for cell in cells:
+                if cell[0] == highlighted:
+                    render_cell(*cell)
+
+        item_rects = [cell[1] for cell in cells]
+
         # Draw scroll indicators
         self._draw_scroll_indicators(screen, rect, scroll_row, rows, visible_rows)
 
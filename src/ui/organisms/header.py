@@ -8,6 +8,7 @@ from typing import Tuple, Optional, Callable
 from ui.theme import Theme, default_theme
 from ui.atoms.text import Text
 from ui.atoms.button import Button
+from ui.layers import layer_cache
 from constants import BEZEL_INSET
 
 
@@ -21,7 +22,7 @@ class Header:
 
     def __init__(self, theme: Theme = default_theme):
         self.theme = theme
-        self.text = Text(theme)
+        self.text = Text(theme, pinned=True)
         self.button = Button(theme)
 
     def render(
@@ -51,11 +52,55 @@ class Header:
         Returns:
             Tuple of (header_rect, back_button_rect or None)
         """
-        screen_width = screen.get_width()
         inset = BEZEL_INSET
         if height == 0:
             height = self.theme.header_height
-        header_rect = pygame.Rect(inset, inset, screen_width - inset * 2, height)
+        header_rect = pygame.Rect(inset, inset, screen.get_width() - inset * 2, height)
+
+        back_button_rect = None
+        if show_back:
+            back_size = 36
+            back_button_rect = pygame.Rect(
+                inset + self.theme.padding_sm,
+                inset + (height - back_size) // 2,
+                back_size,
+                back_size,
+            )
+
+        # The header is opaque, so it is drawn from a cached layer
+        layer_cache.draw(
+            screen,
+            (id(self), "header"),
+            header_rect,
+            (title, subtitle, right_text, rainbow_title, center_title, show_back),
+            lambda: self._paint(
+                screen,
+                header_rect,
+                back_button_rect,
+                title,
+                subtitle,
+                right_text,
+                rainbow_title,
+                center_title,
+            ),
+        )
+        return header_rect, back_button_rect
+
+    def _paint(
+        self,
+        screen: pygame.Surface,
+        header_rect: pygame.Rect,
+        back_button_rect: Optional[pygame.Rect],
+        title: str,
+        subtitle: Optional[str],
+        right_text: Optional[str],
+        rainbow_title: bool,
+        center_title: bool,
+    ) -> None:
+        """Draw the header background, back button and texts."""
+        screen_width = screen.get_width()
+        inset = header_rect.top
+        height = header_rect.height
 
         # Draw background
         pygame.draw.rect(screen, self.theme.surface, header_rect)
@@ -69,20 +114,15 @@ class Header:
             (inset + header_rect.width, border_y),
         )
 
-        back_button_rect = None
         content_left = inset + self.theme.padding_md
 
         # Draw back button if needed
-        if show_back:
-            back_size = 36
-            back_button_rect = pygame.Rect(
-                inset + self.theme.padding_sm,
-                inset + (height - back_size) // 2,
-                back_size,
-                back_size,
-            )
+        if back_button_rect:
             self.button.render_icon_button(
-                screen, back_button_rect.center, back_size, icon_type="back"
+                screen,
+                back_button_rect.center,
+                back_button_rect.width,
+                icon_type="back",
             )
             content_left = back_button_rect.right + self.theme.padding_sm
 
@@ -142,8 +182,6 @@ class Header:
                 align="right",
             )
 
-        return header_rect, back_button_rect
-
     def get_content_area(
         self, screen: pygame.Surface, header_height: int = 0
     ) -> pygame.Rect:
@@ -1,12 +1,24 @@
 """
 Menu list organism - Scrollable list of menu items.
+
+Only the visible rows are drawn. Each row other than the highlighted one
+is drawn once into its own surface, kept in a shared LRU keyed by the
+row's content and width, so scrolling a long list re-renders just the
+rows it exposes and blits the others at their new positions.
 """
 
 import pygame
-from typing import List, Set, Tuple, Optional, Any, Callable
+from typing import List, Set, Tuple, Optional, Any, Callable, Hashable
 
 from ui.theme import Theme, default_theme
 from ui.molecules.menu_item import MenuItem
+from ui.text_cache import TextCache
+
+# Pixel bytes held by cached row surfaces
+ROW_CACHE_BUDGET = 8 * 1024 * 1024
+
+# Same byte-budget LRU as text surfaces
+row_cache = TextCache(budget=ROW_CACHE_BUDGET, max_pinned=0)
 
 
 class MenuList:
@@ -20,6 +32,8 @@ class MenuList:
     def __init__(self, theme: Theme = default_theme):
         self.theme = theme
         self.menu_item = MenuItem(theme)
+        # Rows are keyed by theme; hashing the theme per row adds up
+        self._theme_hash = hash(theme)
 
     def render(
         self,
@@ -36,6 +50,9 @@ class MenuList:
         divider_indices: Optional[Set[int]] = None,
         item_spacing: int = 0,
         text_scroll_offset: int = 0,
+        layer: Optional[
+            Callable[[pygame.Rect, Hashable, Callable[[], None]], bool]
+        ] = None,
     ) -> Tuple[List[pygame.Rect], int]:
         """
         Render a menu list.
@@ -52,6 +69,9 @@ class MenuList:
             get_secondary: Function to get secondary text
             show_checkbox: Show selection checkboxes
             divider_indices: Indices that are dividers
+            layer: Draws the rows other than the highlighted one as a
+                cached layer, given (rect, key, paint). Only for lists drawn
+                straight over the app background.
 
         Returns:
             Tuple of (list of item rects, scroll offset)
@@ -70,8 +90,8 @@ class MenuList:
         visible_count = rect.height // total_item_height
         scroll_offset = self._calculate_scroll(highlighted, len(items), visible_count)
 
-        # Render visible items
-        item_rects = []
+        # Collect visible items: (index, rect, label, thumbnail, secondary)
+        rows = []
         y = rect.top
 
         for i in range(
@@ -82,31 +102,82 @@ class MenuList:
 
             item = items[i]
             item_rect = pygame.Rect(rect.left, y, rect.width, item_height)
-
-            # Check if this is a divider
+            label = get_label(item)
             if i in divider_indices:
-                label = get_label(item)
-                self.menu_item.render_divider(screen, item_rect, label)
+                rows.append((i, item_rect, label, None, None))
             else:
-                # Get item properties
-                label = get_label(item)
-                thumbnail = get_thumbnail(item) if get_thumbnail else None
-                secondary = get_secondary(item) if get_secondary else None
+                rows.append(
+                    (
+                        i,
+                        item_rect,
+                        label,
+                        get_thumbnail(item) if get_thumbnail else None,
+                        get_secondary(item) if get_secondary else None,
+                    )
+                )
+            y += total_item_height
 
+        def render_row(i, item_rect, label, thumbnail, secondary):
+            if i == highlighted and i not in divider_indices:
+                # Drawn live: its label may scroll
                 self.menu_item.render(
                     screen,
                     item_rect,
                     label,
                     selected=(i in selected),
-                    highlighted=(i == highlighted),
+                    highlighted=True,
                     thumbnail=thumbnail,
                     secondary_text=secondary,
                     show_checkbox=show_checkbox,
-                    text_scroll_offset=text_scroll_offset if i == highlighted else 0,
+                    text_scroll_offset=text_scroll_offset,
                 )
-
-            item_rects.append(item_rect)
-            y += total_item_height
+                return
+            row = self._row_surface(
+                item_rect.size,
+                label,
+                thumbnail,
+                secondary,
+                i in selected,
+                show_checkbox,
+                i in divider_indices,
+            )
+            screen.blit(row, item_rect)
+
+        if layer is None:
+            for row in rows:
+                render_row(*row)
+        else:
+            # Everything but the highlighted row changes only when the list
+            # scrolls, its content changes or a thumbnail arrives
+            static_rows = [row for row in rows if row[0] != highlighted]
+            key = (
+                highlighted,
+                show_checkbox,
+                tuple(
+                    (
+                        i,
+                        tuple(item_rect),
+                        label,
+                        thumbnail,
+                        secondary,
+                        i in selected,
+                        i in divider_indices,
+                    )
+                    for i, item_rect, label, thumbnail, secondary in static_rows
+                ),
+            )
+
+            def paint():
+                for row in static_rows:
+                    render_row(*row)
+
+            # The last row may reach past the list area
+            layer(rect.unionall([row[1] for row in rows]), key, paint)
+            for row in rows:
+                if row[0] == highlighted:
+                    render_row(*row)
+
+        item_rects = [row[1] for row in rows]
 
         # Draw scroll indicators if needed
         self._draw_scroll_indicators(
@@ -115,6 +186,50 @@ class MenuList:
 
         return item_rects, scroll_offset
 
+    def _row_surface(
+        self,
+        size: Tuple[int, int],
+        label: str,
+        thumbnail: Optional[pygame.Surface],
+        secondary: Optional[str],
+        is_selected: bool,
+        show_checkbox: bool,
+        is_divider: bool,
+    ) -> pygame.Surface:
+        """Get a row drawn on a transparent surface, drawing it on a miss."""
+        key = (
+            self._theme_hash,
+            size,
+            label,
+            # The surface, not its id: the entry keeps it alive, so an
+            # evicted thumbnail's id can't come back with other art
+            thumbnail,
+            secondary,
+            is_selected,
+            show_checkbox,
+            is_divider,
+        )
+        surface = row_cache.get(key)
+        if surface is None:
+            row = pygame.Surface(size, pygame.SRCALPHA)
+            if is_divider:
+                drawn = self.menu_item.render_divider(row, row.get_rect(), label)
+            else:
+                drawn = self.menu_item.render(
+                    row,
+                    row.get_rect(),
+                    label,
+                    selected=is_selected,
+                    thumbnail=thumbnail,
+                    secondary_text=secondary,
+                    show_checkbox=show_checkbox,
+                )
+            # Keep only the drawn width: short labels leave most of it empty
+            width = max(1, min(drawn.right, size[0]))
+            surface = row.subsurface((0, 0, width, size[1])).copy()
+            row_cache.put(key, surface)
+        return surface
+
     def _default_get_label(self, item: Any) -> str:
         """Default label extraction."""
         if isinstance(item, dict):
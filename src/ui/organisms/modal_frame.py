@@ -9,6 +9,7 @@ from ui.theme import Theme, default_theme
 from ui.atoms.surface import Surface
 from ui.atoms.text import Text
 from ui.atoms.button import Button
+from ui.layers import layer_cache
 from constants import BEZEL_INSET
 
 
@@ -23,7 +24,7 @@ class ModalFrame:
     def __init__(self, theme: Theme = default_theme):
         self.theme = theme
         self.surface = Surface(theme)
-        self.text = Text(theme)
+        self.text = Text(theme, pinned=True)
         self.button = Button(theme)
 
     def render(
@@ -53,6 +54,55 @@ class ModalFrame:
         if with_backdrop:
             self.surface.render_modal_backdrop(screen, backdrop_alpha)
 
+        # Calculate header and content areas
+        header_height = 50 if title else 0
+        padding = self.theme.padding_lg
+
+        content_rect = pygame.Rect(
+            rect.left + padding,
+            rect.top + header_height + padding,
+            rect.width - padding * 2,
+            rect.height - header_height - padding * 2,
+        )
+
+        close_button_rect = None
+        if title and show_close:
+            close_size = 30
+            close_button_rect = pygame.Rect(
+                rect.right - padding - close_size,
+                rect.top + (header_height - close_size) // 2,
+                close_size,
+                close_size,
+            )
+
+        def paint():
+            self._paint(screen, rect, title, header_height, close_button_rect)
+
+        if self.theme.radius_lg:
+            # Rounded corners show what is underneath: no snapshot
+            paint()
+        else:
+            layer_cache.draw(
+                screen,
+                (id(self), "panel"),
+                rect,
+                (title, close_button_rect is not None),
+                paint,
+            )
+
+        return rect, content_rect, close_button_rect
+
+    def _paint(
+        self,
+        screen: pygame.Surface,
+        rect: pygame.Rect,
+        title: Optional[str],
+        header_height: int,
+        close_button_rect: Optional[pygame.Rect],
+    ) -> None:
+        """Draw the modal surface, border, title and close button."""
+        padding = self.theme.padding_lg
+
         # Draw modal surface with green border
         pygame.draw.rect(
             screen,
@@ -68,19 +118,6 @@ class ModalFrame:
             border_radius=self.theme.radius_lg,
         )
 
-        # Calculate header and content areas
-        header_height = 50 if title else 0
-        padding = self.theme.padding_lg
-
-        content_rect = pygame.Rect(
-            rect.left + padding,
-            rect.top + header_height + padding,
-            rect.width - padding * 2,
-            rect.height - header_height - padding * 2,
-        )
-
-        close_button_rect = None
-
         # Draw header if title provided
         if title:
             # Draw title text
@@ -102,23 +139,14 @@ class ModalFrame:
             )
 
             # Draw close button
-            if show_close:
-                close_size = 30
-                close_button_rect = pygame.Rect(
-                    rect.right - padding - close_size,
-                    rect.top + (header_height - close_size) // 2,
-                    close_size,
-                    close_size,
-                )
+            if close_button_rect:
                 self.button.render_icon_button(
                     screen,
                     close_button_rect.center,
-                    close_size,
+                    close_button_rect.width,
                     icon_type="close",
                 )
 
-        return rect, content_rect, close_button_rect
-
     def render_centered(
         self,
         screen: pygame.Surface,
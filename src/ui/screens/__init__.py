@@ -3,15 +3,21 @@ UI Screens - Full page components with data binding.
 The final layer of the atomic design hierarchy.
 """
 
-from .systems_screen import SystemsScreen
-from .games_screen import GamesScreen
-from .settings_screen import SettingsScreen
-from .utils_screen import UtilsScreen
-from .credits_screen import CreditsScreen
-from .add_systems_screen import AddSystemsScreen
-from .systems_settings_screen import SystemsSettingsScreen
-from .system_settings_screen import SystemSettingsScreen
-from .screen_manager import ScreenManager
+import importlib
+
+# Public name -> submodule; imported on first access so loading the
+# package doesn't import every screen
+_EXPORTS = {
+    "SystemsScreen": ".systems_screen",
+    "GamesScreen": ".games_screen",
+    "SettingsScreen": ".settings_screen",
+    "UtilsScreen": ".utils_screen",
+    "CreditsScreen": ".credits_screen",
+    "AddSystemsScreen": ".add_systems_screen",
+    "SystemsSettingsScreen": ".systems_settings_screen",
+    "SystemSettingsScreen": ".system_settings_screen",
+    "ScreenManager": ".screen_manager",
+}
 
 __all__ = [
     "SystemsScreen",
@@ -24,3 +30,12 @@ __all__ = [
     "SystemSettingsScreen",
     "ScreenManager",
 ]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -65,7 +65,7 @@ class CreditsScreen:
         # Set clipping rect for scrollable area
         clip_rect = pygame.Rect(0, content_top, screen.get_width(), visible_height)
         old_clip = screen.get_clip()
-        screen.set_clip(clip_rect)
+        screen.set_clip(clip_rect.clip(old_clip))
 
         # Draw content with scroll offset
         y = content_top - scroll_offset
@@ -9,6 +9,7 @@ from ui.theme import Theme, default_theme
 from ui.organisms.header import Header
 from ui.atoms.text import Text
 from ui.atoms.progress import ProgressBar
+from ui.damage import mark_live
 from state import DownloadQueueState, DownloadQueueItem
 from utils.button_hints import get_button_hint
 from constants import BEZEL_INSET
@@ -122,7 +123,8 @@ class DownloadsScreen:
 
         # Create a clipping surface
         clip_rect = content_rect
-        screen.set_clip(clip_rect)
+        old_clip = screen.get_clip()
+        screen.set_clip(clip_rect.clip(old_clip))
 
         for i, item in enumerate(queue.items):
             if i < scroll_offset:
@@ -144,7 +146,7 @@ class DownloadsScreen:
             )
             item_rects.append(item_rect)
 
-        screen.set_clip(None)
+        screen.set_clip(old_clip)
 
         # Draw scroll indicators if needed
         if scroll_offset > 0:
@@ -269,6 +271,10 @@ class DownloadsScreen:
         is_highlighted: bool,
     ):
         """Render the status area for an item."""
+        if item.status in ("downloading", "extracting", "moving", "processing"):
+            # Progress and speed change between full redraws
+            mark_live(rect)
+
         if item.status == "downloading":
             # Progress bar above center, speed+ETA below
             bar_rect = pygame.Rect(rect.left, rect.centery - 14, rect.width, 14)
@@ -289,7 +295,7 @@ class DownloadsScreen:
                     speed_text = f"{speed_text} - {eta_text}"
             else:
                 speed_text = "-"
-            self.text.render(
+            self.text.render_dynamic(
                 screen,
                 speed_text,
                 (rect.centerx, rect.centery + 8),
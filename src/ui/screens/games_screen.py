@@ -3,6 +3,7 @@ Games screen - Display games for a selected system.
 """
 
 import pygame
+from collections.abc import Sequence
 from typing import List, Dict, Any, Tuple, Optional, Set, Callable
 
 from ui.theme import Theme, default_theme
@@ -28,6 +29,32 @@ def get_grid_columns(screen_width: int) -> int:
         return 3
 
 
+# Extra list entry shown after the games when "Download All" is enabled
+DOWNLOAD_ALL_ITEM = {"_download_all": True, "name": "Download All Games"}
+
+
+class _WithExtraItem(Sequence):
+    """A list followed by one more item, without copying the list."""
+
+    def __init__(self, items: List[Any], extra: Any):
+        self._items = items
+        self._extra = extra
+
+    def __len__(self) -> int:
+        return len(self._items) + 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if index == len(self._items):
+            return self._extra
+        if not 0 <= index < len(self._items):
+            raise IndexError(index)
+        return self._items[index]
+
+
 class GamesScreen:
     """
     Games screen.
@@ -87,10 +114,11 @@ class GamesScreen:
         # Reserve footer space for status bar when games are selected
         footer_height = 40 if selected_games else 0
 
-        # Add "Download All" as an extra item if enabled
-        display_items = list(games)
+        # Add "Download All" as an extra item if enabled (the game list
+        # can hold tens of thousands of entries: don't copy it per frame)
+        display_items = games
         if show_download_all and games:
-            display_items.append({"_download_all": True, "name": "Download All Games"})
+            display_items = _WithExtraItem(games, DOWNLOAD_ALL_ITEM)
 
         # Adjust highlighted to not exceed display items
         display_highlighted = min(highlighted, len(display_items) - 1)
@@ -2,13 +2,19 @@
 UI Modal Screens - Modal dialog page components.
 """
 
-from .search_modal import SearchModal
-from .folder_browser_modal import FolderBrowserModal
-from .game_details_modal import GameDetailsModal
-from .loading_modal import LoadingModal
-from .error_modal import ErrorModal
-from .url_input_modal import UrlInputModal
-from .folder_name_modal import FolderNameModal
+import importlib
+
+# Public name -> submodule; imported on first access so loading the
+# package doesn't import every screen
+_EXPORTS = {
+    "SearchModal": ".search_modal",
+    "FolderBrowserModal": ".folder_browser_modal",
+    "GameDetailsModal": ".game_details_modal",
+    "LoadingModal": ".loading_modal",
+    "ErrorModal": ".error_modal",
+    "UrlInputModal": ".url_input_modal",
+    "FolderNameModal": ".folder_name_modal",
+}
 
 __all__ = [
     "SearchModal",
@@ -19,3 +25,12 @@ __all__ = [
     "UrlInputModal",
     "FolderNameModal",
 ]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
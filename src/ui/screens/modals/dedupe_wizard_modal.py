@@ -10,6 +10,7 @@ from ui.organisms.modal_frame import ModalFrame
 from ui.molecules.action_button import ActionButton
 from ui.atoms.text import Text
 from ui.atoms.progress import ProgressBar
+from ui.damage import mark_live
 from services.dedupe_service import format_size
 
 
@@ -246,6 +247,7 @@ class DedupeWizardModal:
             20,
         )
         self.progress_bar.render(screen, bar_rect, progress)
+        mark_live(content_rect)
 
         # File count
         self.text.render(
@@ -453,6 +455,7 @@ class DedupeWizardModal:
             20,
         )
         self.progress_bar.render(screen, bar_rect, progress)
+        mark_live(content_rect)
 
     def _render_complete(
         self,
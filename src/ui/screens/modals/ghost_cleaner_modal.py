@@ -9,6 +9,7 @@ from ui.theme import Theme, default_theme
 from ui.organisms.modal_frame import ModalFrame
 from ui.atoms.text import Text
 from ui.atoms.progress import ProgressBar
+from ui.damage import mark_live
 from services.ghost_cleaner import format_size, get_ghost_summary, get_total_size
 
 
@@ -117,6 +118,7 @@ class GhostCleanerModal:
             20,
         )
         self.progress_bar.render(screen, bar_rect, progress)
+        mark_live(content_rect)
 
         self.text.render(
             screen,
@@ -214,6 +216,7 @@ class GhostCleanerModal:
             20,
         )
         self.progress_bar.render(screen, bar_rect, progress)
+        mark_live(content_rect)
 
     def _render_complete(
         self,
@@ -8,6 +8,7 @@ from ui.organisms.modal_frame import ModalFrame
 from ui.organisms.char_keyboard import CharKeyboard
 from ui.atoms.text import Text
 from ui.atoms.progress import ProgressBar
+from ui.damage import mark_live
 
 
 class LeagueBrowserModal:
@@ -270,6 +271,7 @@ class LeagueBrowserModal:
                 20,
             )
             self.progress_bar.render(screen, bar_rect, we.fetch_progress)
+            mark_live(content_rect)
 
     def _render_error(self, screen, content_rect, error):
         self.text.render(
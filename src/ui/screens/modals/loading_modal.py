@@ -7,6 +7,7 @@ from typing import Optional
 
 from ui.theme import Theme, default_theme
 from ui.templates.modal_template import ModalTemplate
+from ui.damage import mark_live
 
 
 class LoadingModal:
@@ -76,6 +77,7 @@ class LoadingModal:
         )
 
         # Render progress
+        mark_live(content_rect)
         download_progress.render(
             screen,
             content_rect,
@@ -7,6 +7,7 @@ from ui.theme import Theme, default_theme
 from ui.organisms.modal_frame import ModalFrame
 from ui.atoms.text import Text
 from ui.atoms.progress import ProgressBar
+from ui.damage import mark_live
 
 
 class PatchProgressModal:
@@ -69,6 +70,7 @@ class PatchProgressModal:
             20,
         )
         self.progress_bar.render(screen, bar_rect, we.patch_progress)
+        mark_live(content_rect)
 
         pct = int(we.patch_progress * 100)
         self.text.render(
@@ -10,6 +10,7 @@ from ui.organisms.modal_frame import ModalFrame
 from ui.molecules.action_button import ActionButton
 from ui.atoms.text import Text
 from ui.atoms.progress import ProgressBar
+from ui.damage import mark_live
 
 
 class RenameWizardModal:
@@ -247,6 +248,7 @@ class RenameWizardModal:
             20,
         )
         self.progress_bar.render(screen, bar_rect, progress)
+        mark_live(content_rect)
 
         self.text.render(
             screen,
@@ -465,6 +467,7 @@ class RenameWizardModal:
             20,
         )
         self.progress_bar.render(screen, bar_rect, progress)
+        mark_live(content_rect)
 
     def _render_complete(
         self,
@@ -7,6 +7,7 @@ from ui.theme import Theme, default_theme
 from ui.organisms.modal_frame import ModalFrame
 from ui.atoms.text import Text
 from ui.atoms.progress import ProgressBar
+from ui.damage import mark_live
 
 
 class RosterPreviewModal:
@@ -66,6 +67,7 @@ class RosterPreviewModal:
                     20,
                 )
                 self.progress_bar.render(screen, bar_rect, progress)
+                mark_live(content_rect)
                 league_name = ""
                 if state.active_patcher.selected_league and hasattr(
                     state.active_patcher.selected_league, "name"
@@ -35,6 +35,7 @@ from ui.atoms.progress import ProgressBar
 from ui.molecules.action_button import ActionButton
 from utils.button_hints import get_combined_hints, get_button_hint
 from constants import BUILD_TARGET
+from ui.damage import mark_live
 
 THUMB_SIZE = (64, 64)
 IS_ANDROID = BUILD_TARGET == "android"
@@ -937,6 +938,7 @@ class ScraperWizardModal:
             20,
         )
         self.progress_bar.render(screen, bar_rect, progress)
+        mark_live(content_rect)
 
         self.text.render(
             screen,
@@ -1314,6 +1316,7 @@ class ScraperWizardModal:
             20,
         )
         self.progress_bar.render(screen, bar_rect, overall_progress)
+        mark_live(content_rect)
 
         y += 35
         self.text.render(
@@ -61,7 +61,7 @@ class SteamSearchModal:
 
         # Clip grid rendering to content area to prevent overflow onto bezels
         old_clip = screen.get_clip()
-        screen.set_clip(content_rect)
+        screen.set_clip(content_rect.clip(old_clip))
 
         item_rects, scroll_offset = self.grid.render(
             screen,
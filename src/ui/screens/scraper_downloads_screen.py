@@ -8,6 +8,7 @@ from typing import List, Tuple, Optional, Any
 from ui.theme import Theme, default_theme
 from ui.organisms.header import Header
 from ui.atoms.text import Text
+from ui.damage import mark_live
 from state import ScraperQueueState, ScraperQueueItem
 from utils.button_hints import get_button_hint
 from constants import BEZEL_INSET
@@ -114,7 +115,8 @@ class ScraperDownloadsScreen:
         visible_items = content_rect.height // self.ITEM_HEIGHT
 
         clip_rect = content_rect
-        screen.set_clip(clip_rect)
+        old_clip = screen.get_clip()
+        screen.set_clip(clip_rect.clip(old_clip))
 
         for i, item in enumerate(queue.items):
             if i < scroll_offset:
@@ -134,7 +136,7 @@ class ScraperDownloadsScreen:
             self._render_queue_item(screen, item_rect, item, i + 1, is_highlighted)
             item_rects.append(item_rect)
 
-        screen.set_clip(None)
+        screen.set_clip(old_clip)
 
         # Scroll indicators
         if scroll_offset > 0:
@@ -273,6 +275,7 @@ class ScraperDownloadsScreen:
         safe_width = screen_width - inset * 2
         bar_height = 40
         bar_y = screen_height - inset - bar_height
+        mark_live(pygame.Rect(inset, bar_y, safe_width, bar_height))
 
         # Semi-transparent background
         bar_surface = pygame.Surface((safe_width, bar_height), pygame.SRCALPHA)
@@ -2,124 +2,141 @@
 Screen manager - Coordinates screen rendering based on app state.
 """
 
+import importlib
 import pygame
 from typing import Dict, Any, Optional, Tuple, List
 
 from constants import BUILD_TARGET
+from ui.text_cache import text_cache
 from ui.theme import Theme, default_theme
-from .systems_screen import SystemsScreen
-from .games_screen import GamesScreen
-from .settings_screen import SettingsScreen
-from .utils_screen import UtilsScreen
-from .credits_screen import CreditsScreen
-from .add_systems_screen import AddSystemsScreen
-from .systems_settings_screen import SystemsSettingsScreen
-from .system_settings_screen import SystemSettingsScreen
-from .modals.search_modal import SearchModal
-from .modals.folder_browser_modal import FolderBrowserModal
-from .modals.game_details_modal import GameDetailsModal
-from .modals.loading_modal import LoadingModal
-from .modals.error_modal import ErrorModal
-from .modals.url_input_modal import UrlInputModal
-from .modals.folder_name_modal import FolderNameModal
-from .modals.confirm_modal import ConfirmModal
-from .modals.ia_login_modal import IALoginModal
-from .modals.ia_download_modal import IADownloadModal
-from .modals.ia_collection_modal import IACollectionModal
-from .modals.scraper_wizard_modal import ScraperWizardModal
-from .modals.scraper_login_modal import ScraperLoginModal
-from .modals.dedupe_wizard_modal import DedupeWizardModal
-from .modals.rename_wizard_modal import RenameWizardModal
-from .modals.ghost_cleaner_modal import GhostCleanerModal
-from .modals.league_browser_modal import LeagueBrowserModal
-from .modals.roster_preview_modal import RosterPreviewModal
-from .modals.patch_progress_modal import PatchProgressModal
-from .modals.color_picker_modal import ColorPickerModal
-from .modals.auth_token_modal import AuthTokenModal
-from .modals.steam_search_modal import SteamSearchModal
-from .scraper_menu_screen import ScraperMenuScreen
-from .sports_patcher_screen import SportsPatcherScreen
-from .we_patcher_screen import WePatcherScreen
-from .iss_patcher_screen import ISSPatcherScreen
-from .kgj_mlb_patcher_screen import KGJMLBPatcherScreen
-from .nbalive95_patcher_screen import NBALive95PatcherScreen
-from .mvp_psp_patcher_screen import MVPPSPPatcherScreen
-from .nhl94_snes_patcher_screen import NHL94SNESPatcherScreen
-from .nhl94_genesis_patcher_screen import NHL94GenesisPatcherScreen
-from .nhl07_psp_patcher_screen import NHL07PSPPatcherScreen
-from .nhl05_ps2_patcher_screen import NHL05PS2PatcherScreen
-from .pes6_ps2_patcher_screen import PES6PS2PatcherScreen
-from .syncthing_screen import SyncthingScreen
-from .downloads_screen import DownloadsScreen
-from .file_explorer_screen import FileExplorerScreen
-from .scraper_downloads_screen import ScraperDownloadsScreen
 from ui.molecules.status_footer import StatusFooter, StatusFooterItem
 
+# Screens and modals by attribute name: (module, class). Each is imported
+# and built on first access, so startup doesn't load every patcher.
+_SCREENS = {
+    "systems_screen": (".systems_screen", "SystemsScreen"),
+    "games_screen": (".games_screen", "GamesScreen"),
+    "settings_screen": (".settings_screen", "SettingsScreen"),
+    "utils_screen": (".utils_screen", "UtilsScreen"),
+    "credits_screen": (".credits_screen", "CreditsScreen"),
+    "add_systems_screen": (".add_systems_screen", "AddSystemsScreen"),
+    "systems_settings_screen": (".systems_settings_screen", "SystemsSettingsScreen"),
+    "system_settings_screen": (".system_settings_screen", "SystemSettingsScreen"),
+    "downloads_screen": (".downloads_screen", "DownloadsScreen"),
+    "scraper_downloads_screen": (".scraper_downloads_screen", "ScraperDownloadsScreen"),
+    "scraper_menu_screen": (".scraper_menu_screen", "ScraperMenuScreen"),
+    "sports_patcher_screen": (".sports_patcher_screen", "SportsPatcherScreen"),
+    "we_patcher_screen": (".we_patcher_screen", "WePatcherScreen"),
+    "iss_patcher_screen": (".iss_patcher_screen", "ISSPatcherScreen"),
+    "kgj_mlb_patcher_screen": (".kgj_mlb_patcher_screen", "KGJMLBPatcherScreen"),
+    "nbalive95_patcher_screen": (".nbalive95_patcher_screen", "NBALive95PatcherScreen"),
+    "mvp_psp_patcher_screen": (".mvp_psp_patcher_screen", "MVPPSPPatcherScreen"),
+    "nhl94_patcher_screen": (".nhl94_snes_patcher_screen", "NHL94SNESPatcherScreen"),
+    "nhl94_gen_patcher_screen": (
+        ".nhl94_genesis_patcher_screen",
+        "NHL94GenesisPatcherScreen",
+    ),
+    "nhl07_psp_patcher_screen": (".nhl07_psp_patcher_screen", "NHL07PSPPatcherScreen"),
+    "nhl05_ps2_patcher_screen": (".nhl05_ps2_patcher_screen", "NHL05PS2PatcherScreen"),
+    "pes6_ps2_patcher_screen": (".pes6_ps2_patcher_screen", "PES6PS2PatcherScreen"),
+    "syncthing_screen": (".syncthing_screen", "SyncthingScreen"),
+    "file_explorer_screen": (".file_explorer_screen", "FileExplorerScreen"),
+    "search_modal": (".modals.search_modal", "SearchModal"),
+    "folder_browser_modal": (".modals.folder_browser_modal", "FolderBrowserModal"),
+    "game_details_modal": (".modals.game_details_modal", "GameDetailsModal"),
+    "loading_modal": (".modals.loading_modal", "LoadingModal"),
+    "error_modal": (".modals.error_modal", "ErrorModal"),
+    "url_input_modal": (".modals.url_input_modal", "UrlInputModal"),
+    "folder_name_modal": (".modals.folder_name_modal", "FolderNameModal"),
+    "confirm_modal": (".modals.confirm_modal", "ConfirmModal"),
+    "ia_login_modal": (".modals.ia_login_modal", "IALoginModal"),
+    "ia_download_modal": (".modals.ia_download_modal", "IADownloadModal"),
+    "ia_collection_modal": (".modals.ia_collection_modal", "IACollectionModal"),
+    "scraper_login_modal": (".modals.scraper_login_modal", "ScraperLoginModal"),
+    "scraper_wizard_modal": (".modals.scraper_wizard_modal", "ScraperWizardModal"),
+    "dedupe_wizard_modal": (".modals.dedupe_wizard_modal", "DedupeWizardModal"),
+    "rename_wizard_modal": (".modals.rename_wizard_modal", "RenameWizardModal"),
+    "ghost_cleaner_modal": (".modals.ghost_cleaner_modal", "GhostCleanerModal"),
+    "league_browser_modal": (".modals.league_browser_modal", "LeagueBrowserModal"),
+    "roster_preview_modal": (".modals.roster_preview_modal", "RosterPreviewModal"),
+    "patch_progress_modal": (".modals.patch_progress_modal", "PatchProgressModal"),
+    "color_picker_modal": (".modals.color_picker_modal", "ColorPickerModal"),
+    "auth_token_modal": (".modals.auth_token_modal", "AuthTokenModal"),
+    "steam_search_modal": (".modals.steam_search_modal", "SteamSearchModal"),
+}
+
+# Screens likely to be opened next from a mode, built during idle frames
+_PRELOAD = {
+    "systems": (
+        "utils_screen",
+        "settings_screen",
+        "file_explorer_screen",
+        "downloads_screen",
+        "loading_modal",
+        "confirm_modal",
+    ),
+    "systems_list": ("games_screen", "loading_modal", "search_modal"),
+    "games": ("game_details_modal", "search_modal", "downloads_screen"),
+    "settings": (
+        "systems_settings_screen",
+        "add_systems_screen",
+        "folder_browser_modal",
+    ),
+    "utils": ("folder_browser_modal", "confirm_modal"),
+    "scraper_menu": ("scraper_wizard_modal", "scraper_downloads_screen"),
+}
+
 
 class ScreenManager:
     """
     Screen manager.
 
     Coordinates which screen to render based on
-    application state.
+    application state. Screens and modals are attributes
+    (``self.games_screen``) resolved on first access.
     """
 
     def __init__(self, theme: Theme = default_theme):
         self.theme = theme
 
-        # Initialize screens
-        self.systems_screen = SystemsScreen(theme)
-        self.games_screen = GamesScreen(theme)
-        self.settings_screen = SettingsScreen(theme)
-        self.utils_screen = UtilsScreen(theme)
-        self.credits_screen = CreditsScreen(theme)
-        self.add_systems_screen = AddSystemsScreen(theme)
-        self.systems_settings_screen = SystemsSettingsScreen(theme)
-        self.system_settings_screen = SystemSettingsScreen(theme)
-        self.downloads_screen = DownloadsScreen(theme)
-        self.scraper_downloads_screen = ScraperDownloadsScreen(theme)
-        self.scraper_menu_screen = ScraperMenuScreen(theme)
-        self.sports_patcher_screen = SportsPatcherScreen(theme)
-        self.we_patcher_screen = WePatcherScreen(theme)
-        self.iss_patcher_screen = ISSPatcherScreen(theme)
-        self.kgj_mlb_patcher_screen = KGJMLBPatcherScreen(theme)
-        self.nbalive95_patcher_screen = NBALive95PatcherScreen(theme)
-        self.mvp_psp_patcher_screen = MVPPSPPatcherScreen(theme)
-        self.nhl94_patcher_screen = NHL94SNESPatcherScreen(theme)
-        self.nhl94_gen_patcher_screen = NHL94GenesisPatcherScreen(theme)
-        self.nhl07_psp_patcher_screen = NHL07PSPPatcherScreen(theme)
-        self.nhl05_ps2_patcher_screen = NHL05PS2PatcherScreen(theme)
-        self.pes6_ps2_patcher_screen = PES6PS2PatcherScreen(theme)
-        self.syncthing_screen = SyncthingScreen(theme)
-        self.file_explorer_screen = FileExplorerScreen(theme)
-
-        # Initialize modals
-        self.search_modal = SearchModal(theme)
-        self.folder_browser_modal = FolderBrowserModal(theme)
-        self.game_details_modal = GameDetailsModal(theme)
-        self.loading_modal = LoadingModal(theme)
-        self.error_modal = ErrorModal(theme)
-        self.url_input_modal = UrlInputModal(theme)
-        self.folder_name_modal = FolderNameModal(theme)
-        self.confirm_modal = ConfirmModal(theme)
-        self.ia_login_modal = IALoginModal(theme)
-        self.ia_download_modal = IADownloadModal(theme)
-        self.ia_collection_modal = IACollectionModal(theme)
-        self.scraper_login_modal = ScraperLoginModal(theme)
-        self.scraper_wizard_modal = ScraperWizardModal(theme)
-        self.dedupe_wizard_modal = DedupeWizardModal(theme)
-        self.rename_wizard_modal = RenameWizardModal(theme)
-        self.ghost_cleaner_modal = GhostCleanerModal(theme)
-        self.league_browser_modal = LeagueBrowserModal(theme)
-        self.roster_preview_modal = RosterPreviewModal(theme)
-        self.patch_progress_modal = PatchProgressModal(theme)
-        self.color_picker_modal = ColorPickerModal(theme)
-        self.auth_token_modal = AuthTokenModal(theme)
-        self.steam_search_modal = SteamSearchModal(theme)
-
         # Initialize generic status footer
         self.status_footer = StatusFooter(theme)
 
+        # Screen whose chrome labels are pinned in the text cache
+        self._pinned_mode: Optional[str] = None
+
+    def __getattr__(self, name: str) -> Any:
+        """Import and build a registered screen or modal on first access."""
+        entry = _SCREENS.get(name)
+        if entry is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        module, class_name = entry
+        screen_class = getattr(importlib.import_module(module, __package__), class_name)
+        screen = screen_class(self.theme)
+        setattr(self, name, screen)
+        return screen
+
+    def is_loaded(self, name: str) -> bool:
+        """Whether a registered screen or modal has been built yet."""
+        return name in self.__dict__
+
+    def preload_next(self, mode: str) -> bool:
+        """
+        Build one screen likely to be opened next from ``mode``.
+
+        Meant for idle frames: each call loads at most one screen.
+
+        Returns:
+            True if a screen was loaded, False if none is left to load
+        """
+        for name in _PRELOAD.get(mode, ()):
+            if name not in self.__dict__:
+                getattr(self, name)
+                return True
+        return False
+
     def render(
         self,
         screen: pygame.Surface,
@@ -145,6 +162,11 @@ class ScreenManager:
         """
         rects = {}
 
+        # Chrome labels of the previous screen may be evicted again
+        if state.mode != self._pinned_mode:
+            text_cache.release_pins()
+            self._pinned_mode = state.mode
+
         # On Android, use "android" mode for text input modals:
         # native soft keyboard + touchable OK/Cancel buttons
         modal_input_mode = "android" if BUILD_TARGET == "android" else state.input_mode
@@ -2,10 +2,12 @@
 Grid screen template - Layout for grid-based screens.
 """
 
+import functools
 import pygame
 from typing import List, Set, Tuple, Optional, Any, Callable
 
 from ui.theme import Theme, default_theme
+from ui.layers import layer_cache
 from ui.organisms.header import Header
 from ui.organisms.grid import Grid
 from constants import BEZEL_INSET
@@ -89,6 +91,8 @@ class GridScreenTemplate:
             get_label=get_label,
             get_image=get_image,
             get_placeholder=get_placeholder,
+            # Drawn straight over the app background: cells can be layered
+            layer=functools.partial(layer_cache.draw, screen, (id(self), "cells")),
         )
 
         return back_button_rect, item_rects, scroll_offset
@@ -158,14 +162,26 @@ class GridScreenTemplate:
             )
 
             for i, label in enumerate(button_labels):
-                button_rect = pygame.Rect(
-                    start_x + i * (button_width + self.theme.padding_sm),
-                    button_y,
-                    button_width,
-                    button_height,
+                button_rects.append(
+                    pygame.Rect(
+                        start_x + i * (button_width + self.theme.padding_sm),
+                        button_y,
+                        button_width,
+                        button_height,
+                    )
                 )
-                action_button.render(screen, button_rect, label)
-                button_rects.append(button_rect)
+
+            def paint():
+                for button_rect, label in zip(button_rects, button_labels):
+                    action_button.render(screen, button_rect, label)
+
+            layer_cache.draw(
+                screen,
+                (id(self), "buttons"),
+                button_rects[0].unionall(button_rects),
+                tuple(button_labels),
+                paint,
+            )
 
         return back_rect, item_rects, scroll_offset, button_rects
 
@@ -2,10 +2,12 @@
 List screen template - Layout for list-based screens.
 """
 
+import functools
 import pygame
 from typing import List, Set, Tuple, Optional, Any, Callable
 
 from ui.theme import Theme, default_theme
+from ui.layers import layer_cache
 from ui.organisms.header import Header
 from ui.organisms.menu_list import MenuList
 from constants import BEZEL_INSET
@@ -108,6 +110,8 @@ class ListScreenTemplate:
             divider_indices=divider_indices,
             item_spacing=item_spacing,
             text_scroll_offset=text_scroll_offset,
+            # Drawn straight over the app background: rows can be layered
+            layer=functools.partial(layer_cache.draw, screen, (id(self), "rows")),
         )
 
         return back_button_rect, item_rects, scroll_offset
@@ -177,14 +181,26 @@ class ListScreenTemplate:
             )
 
             for i, label in enumerate(button_labels):
-                button_rect = pygame.Rect(
-                    start_x + i * (button_width + self.theme.padding_sm),
-                    button_y,
-                    button_width,
-                    button_height,
+                button_rects.append(
+                    pygame.Rect(
+                        start_x + i * (button_width + self.theme.padding_sm),
+                        button_y,
+                        button_width,
+                        button_height,
+                    )
                 )
-                action_button.render(screen, button_rect, label)
-                button_rects.append(button_rect)
+
+            def paint():
+                for button_rect, label in zip(button_rects, button_labels):
+                    action_button.render(screen, button_rect, label)
+
+            layer_cache.draw(
+                screen,
+                (id(self), "buttons"),
+                button_rects[0].unionall(button_rects),
+                tuple(button_labels),
+                paint,
+            )
 
         return back_rect, item_rects, scroll_offset, button_rects
 
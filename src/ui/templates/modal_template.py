@@ -8,6 +8,8 @@ from typing import Tuple, Optional, List
 from ui.theme import Theme, default_theme
 from ui.organisms.modal_frame import ModalFrame
 from ui.molecules.action_button import ActionButton
+from ui.damage import mark_live
+from ui.layers import layer_cache
 
 
 class ModalTemplate:
@@ -73,25 +75,36 @@ class ModalTemplate:
             start_x = modal_rect.centerx - total_buttons_width // 2
             button_y = modal_rect.bottom - button_area_height + self.theme.padding_md
 
-            for i, (label, style) in enumerate(buttons):
-                button_rect = pygame.Rect(
-                    start_x + i * (button_width + self.theme.padding_sm),
-                    button_y,
-                    button_width,
-                    button_height,
+            for i in range(len(buttons)):
+                button_rects.append(
+                    pygame.Rect(
+                        start_x + i * (button_width + self.theme.padding_sm),
+                        button_y,
+                        button_width,
+                        button_height,
+                    )
                 )
 
-                # Choose style
-                if style == "success":
-                    self.action_button.render_success(screen, button_rect, label)
-                elif style == "danger":
-                    self.action_button.render_danger(screen, button_rect, label)
-                elif style == "secondary":
-                    self.action_button.render_secondary(screen, button_rect, label)
-                else:
-                    self.action_button.render(screen, button_rect, label)
-
-                button_rects.append(button_rect)
+            def paint():
+                for button_rect, (label, style) in zip(button_rects, buttons):
+                    # Choose style
+                    if style == "success":
+                        self.action_button.render_success(screen, button_rect, label)
+                    elif style == "danger":
+                        self.action_button.render_danger(screen, button_rect, label)
+                    elif style == "secondary":
+                        self.action_button.render_secondary(screen, button_rect, label)
+                    else:
+                        self.action_button.render(screen, button_rect, label)
+
+            # The buttons sit on the opaque modal panel
+            layer_cache.draw(
+                screen,
+                (id(self), "buttons"),
+                button_rects[0].unionall(button_rects),
+                tuple(buttons),
+                paint,
+            )
 
         return modal_rect, content_rect, close_rect, button_rects
 
@@ -166,6 +179,8 @@ class ModalTemplate:
         modal_rect, content_rect, _, _ = self.render(
             screen, width, height, show_close=False
         )
+        # Message and progress change while the modal stays up
+        mark_live(content_rect)
 
         if progress is not None:
             # Show message at top
@@ -0,0 +1,145 @@
+"""
+Text cache - Shared LRU of rendered text surfaces.
+
+All Text atoms share one cache bounded by the pixel bytes it holds, so
+scrolling a long list evicts the least recently drawn names one by one
+instead of flushing everything (and re-rendering the whole screen) when
+an entry count is reached.
+
+Screen chrome (header titles, button labels) is pinned: list content
+can't evict it. Pins are released when the screen changes, and the
+oldest pins fall back to plain LRU entries past MAX_PINNED_BYTES.
+"""
+
+import collections
+import pygame
+from typing import Any, Dict, Hashable, Optional
+
+# Pixel bytes held by the cache
+TEXT_CACHE_BUDGET = 16 * 1024 * 1024
+# Pixel bytes that may be pinned at once
+MAX_PINNED_BYTES = 1024 * 1024
+
+
+def _surface_bytes(surface: pygame.Surface) -> int:
+    return surface.get_pitch() * surface.get_height()
+
+
+class TextCache:
+    """LRU of text surfaces with a byte budget and pinned entries."""
+
+    def __init__(
+        self, budget: int = TEXT_CACHE_BUDGET, max_pinned: int = MAX_PINNED_BYTES
+    ):
+        self.budget = budget
+        self.max_pinned = max_pinned
+        self.bytes = 0
+        self.pinned_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Unpinned entries, least recently used first
+        self._lru: "collections.OrderedDict[Hashable, pygame.Surface]" = (
+            collections.OrderedDict()
+        )
+        # Pinned entries, oldest pin first
+        self._pinned: "collections.OrderedDict[Hashable, pygame.Surface]" = (
+            collections.OrderedDict()
+        )
+
+    def get(self, key: Hashable, pin: bool = False) -> Optional[pygame.Surface]:
+        """
+        Look up a surface, marking it most recently used.
+
+        Args:
+            key: Cache key
+            pin: Pin the entry if found
+
+        Returns:
+            Cached surface or None
+        """
+        surface = self._pinned.get(key)
+        if surface is not None:
+            self._pinned.move_to_end(key)
+            self.hits += 1
+            return surface
+        surface = self._lru.get(key)
+        if surface is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        if pin:
+            del self._lru[key]
+            self._pin(key, surface)
+        else:
+            self._lru.move_to_end(key)
+        return surface
+
+    def put(self, key: Hashable, surface: pygame.Surface, pin: bool = False) -> None:
+        """Add a surface, evicting least recently used entries over budget."""
+        self.discard(key)
+        self.bytes += _surface_bytes(surface)
+        if pin:
+            self._pin(key, surface)
+        else:
+            self._lru[key] = surface
+        self._evict()
+
+    def discard(self, key: Hashable) -> None:
+        """Remove an entry if present."""
+        surface = self._lru.pop(key, None)
+        if surface is None:
+            surface = self._pinned.pop(key, None)
+            if surface is None:
+                return
+            self.pinned_bytes -= _surface_bytes(surface)
+        self.bytes -= _surface_bytes(surface)
+
+    def release_pins(self) -> None:
+        """Turn pinned entries into ordinary ones (e.g. on screen change)."""
+        # Least recently pinned are also least recently used
+        for key, surface in self._pinned.items():
+            self._lru[key] = surface
+        self._pinned.clear()
+        self.pinned_bytes = 0
+        self._evict()
+
+    def clear(self) -> None:
+        """Drop every entry; counters are kept."""
+        self._lru.clear()
+        self._pinned.clear()
+        self.bytes = self.pinned_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry counts, bytes and hit rate for diagnostics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._lru) + len(self._pinned),
+            "pinned": len(self._pinned),
+            "bytes": self.bytes,
+            "pinned_bytes": self.pinned_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _pin(self, key: Hashable, surface: pygame.Surface) -> None:
+        self._pinned[key] = surface
+        self.pinned_bytes += _surface_bytes(surface)
+        while self.pinned_bytes > self.max_pinned and len(self._pinned) > 1:
+            old_key, old = self._pinned.popitem(last=False)
+            self.pinned_bytes -= _surface_bytes(old)
+            self._lru[old_key] = old
+            # Demoted pins were just in use; keep them over older entries
+            self._lru.move_to_end(old_key)
+
+    def _evict(self) -> None:
+        while self.bytes > self.budget and self._lru:
+            _, surface = self._lru.popitem(last=False)
+            self.bytes -= _surface_bytes(surface)
+            self.evictions += 1
+
+
+# Shared by all Text atoms
+text_cache = TextCache()
@@ -0,0 +1,258 @@
+"""
+Background JPEG encoding for MJPEG preview streams.
+
+The render thread only blits the display into a reused snapshot surface;
+an encoder thread downscales and JPEG-encodes it, skipping frames whose
+pixels did not change. While no client is subscribed, capture returns
+immediately and the encoder thread exits.
+
+Subscribers may ask for a variant, a (scale, quality) pair, so adaptive
+streams can get smaller frames; each captured frame is encoded once per
+variant in use.
+"""
+
+import collections
+import threading
+import time
+import zlib
+from io import BytesIO
+from typing import Optional, Tuple
+
+import pygame
+
+try:
+    from PIL import Image
+
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+_tobytes = getattr(pygame.image, "tobytes", None) or pygame.image.tostring
+
+
+class FrameEncoder:
+    """Encodes captured frames to JPEG on a worker thread for MJPEG clients."""
+
+    def __init__(
+        self,
+        fps: float = 15,
+        quality: int = 80,
+        max_size: Optional[Tuple[int, int]] = None,
+    ):
+        """
+        Initialize the encoder.
+
+        Args:
+            fps: Maximum frames captured per second
+            quality: JPEG quality (1-95); needs Pillow, else SDL's default
+            max_size: Downscale frames to fit this (width, height), if set
+        """
+        self.quality = quality
+        self.max_size = max_size
+        self._interval = 1.0 / fps
+        self._cond = threading.Condition()
+        self._variants = collections.Counter()
+        self._thread = None
+        # Snapshot surfaces: one waiting for the encoder, spares to reuse
+        self._pending = None
+        self._pending_time = 0.0
+        self._spare = []
+        self._frames = {}
+        self._frame_time = 0.0
+        self._seq = 0
+        self._checksum = None
+        self._last_capture = 0.0
+        self._capture_due = False
+        self._listeners = []
+
+    @property
+    def default_variant(self) -> Tuple[float, int]:
+        """Full-size frames at the configured quality."""
+        return (1.0, self.quality)
+
+    @property
+    def active(self) -> bool:
+        """True while at least one client is subscribed."""
+        return bool(self._variants)
+
+    @property
+    def frame_pending(self) -> bool:
+        """True when a subscriber waits on a frame that a redraw would provide."""
+        return (
+            bool(self._variants)
+            and self._capture_due
+            and time.monotonic() - self._last_capture >= self._interval
+        )
+
+    def add_listener(self, callback):
+        """Call ``callback()`` from the encoder thread after each new frame."""
+        self._listeners.append(callback)
+
+    def subscribe(self, variant=None):
+        """Register a client; starts the encoder thread if needed."""
+        with self._cond:
+            self._variants[variant or self.default_variant] += 1
+            self._capture_due = True
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def unsubscribe(self, variant=None):
+        """Unregister a client; the last one stops capturing and encoding."""
+        with self._cond:
+            variant = variant or self.default_variant
+            self._variants[variant] -= 1
+            if self._variants[variant] <= 0:
+                del self._variants[variant]
+            if not self._variants:
+                # Keep the last frame to show new clients right away
+                self._pending = None
+                self._spare.clear()
+            self._cond.notify_all()
+
+    def set_variant(self, old, new):
+        """Move a subscriber to another variant, used from the next frame."""
+        if old == new:
+            return
+        with self._cond:
+            self._variants[new] += 1
+            self._variants[old] -= 1
+            if self._variants[old] <= 0:
+                del self._variants[old]
+            self._capture_due = True
+
+    def capture(self, surface: pygame.Surface):
+        """
+        Snapshot ``surface`` for encoding. Cheap; call after each redraw.
+
+        Does nothing without subscribers, and at most ``fps`` times a
+        second; a throttled capture sets ``frame_pending``.
+        """
+        if not self._variants:
+            return
+        now = time.monotonic()
+        if now - self._last_capture < self._interval:
+            self._capture_due = True
+            return
+        self._last_capture = now
+        self._capture_due = False
+
+        with self._cond:
+            # Overwrite a snapshot the encoder hasn't picked up yet
+            snapshot = self._pending or (self._spare.pop() if self._spare else None)
+            self._pending = None
+        if snapshot is None or snapshot.get_size() != surface.get_size():
+            snapshot = pygame.Surface(surface.get_size(), 0, surface)
+        snapshot.blit(surface, (0, 0))
+        with self._cond:
+            self._pending = snapshot
+            self._pending_time = time.time()
+            self._cond.notify_all()
+
+    def latest(self, variant=None):
+        """
+        Return (seq, jpeg bytes or None, capture time) of the newest frame.
+
+        The capture time is wall-clock seconds, for latency reporting.
+        """
+        with self._cond:
+            frame = self._frames.get(variant or self.default_variant)
+            return self._seq, frame, self._frame_time
+
+    def wait_frame(self, last_seq: int, timeout: float = 1.0, variant=None):
+        """
+        Wait for a frame newer than ``last_seq``.
+
+        Returns:
+            (seq, jpeg bytes or None); seq equals last_seq on timeout
+        """
+        with self._cond:
+            self._cond.wait_for(lambda: self._seq != last_seq, timeout)
+            return self._seq, self._frames.get(variant or self.default_variant)
+
+    def _run(self):
+        """Encoder thread: encode snapshots until no client is subscribed."""
+        while True:
+            with self._cond:
+                while self._pending is None:
+                    if not self._variants:
+                        self._thread = None
+                        return
+                    self._cond.wait(timeout=1.0)
+                snapshot, self._pending = self._pending, None
+                captured_at = self._pending_time
+                variants = list(self._variants)
+
+            try:
+                frames, changed = self._encode_variants(snapshot, variants)
+            except (pygame.error, OSError, ValueError):
+                frames, changed = None, False
+
+            with self._cond:
+                if len(self._spare) < 2:
+                    self._spare.append(snapshot)
+                if frames is not None:
+                    self._frames = frames
+                if changed:
+                    self._frame_time = captured_at
+                    self._seq += 1
+                    self._cond.notify_all()
+            if frames is not None:
+                for callback in self._listeners:
+                    callback()
+
+    def _encode_variants(self, snapshot: pygame.Surface, variants):
+        """
+        Encode ``snapshot`` for each variant.
+
+        Returns:
+            (frames by variant, or None if nothing was encoded; whether
+            the pixels changed since the previous frame)
+        """
+        checksum = (
+            zlib.crc32(snapshot.get_buffer()),
+            snapshot.get_size(),
+            self.max_size,
+        )
+        changed = checksum != self._checksum
+        self._checksum = checksum
+        frames = {} if changed else dict(self._frames)
+        missing = [variant for variant in variants if variant not in frames]
+        if not missing:
+            return None, False
+
+        surface = snapshot
+        if self.max_size:
+            surface = _fit(surface, self.max_size[0], self.max_size[1])
+        for scale, quality in missing:
+            scaled = surface
+            if scale < 1:
+                width, height = surface.get_size()
+                scaled = _fit(surface, width * scale, height * scale)
+            frames[(scale, quality)] = self._encode(scaled, quality)
+        return frames, changed
+
+    def _encode(self, surface: pygame.Surface, quality: int) -> bytes:
+        """JPEG-encode a surface."""
+        buf = BytesIO()
+        if PIL_AVAILABLE:
+            image = Image.frombytes("RGB", surface.get_size(), _tobytes(surface, "RGB"))
+            image.save(buf, "JPEG", quality=quality)
+            return buf.getvalue()
+        try:
+            pygame.image.save(surface, buf, "frame.jpg")
+        except Exception:
+            buf.seek(0)
+            buf.truncate(0)
+            pygame.image.save(surface, buf, "frame.png")
+        return buf.getvalue()
+
+
+def _fit(surface: pygame.Surface, max_width, max_height) -> pygame.Surface:
+    """Smooth-scale ``surface`` down to fit the given box, keeping aspect."""
+    width, height = surface.get_size()
+    scale = min(max_width / width, max_height / height)
+    if scale >= 1:
+        return surface
+    size = (max(1, int(width * scale)), max(1, int(height * scale)))
+    return pygame.transform.smoothscale(surface, size)
@@ -0,0 +1,129 @@
+"""
+Frame pacing for the main loop.
+
+While the user is interacting (recent input, a held direction, an
+animation on screen) the loop ticks at the full frame rate. Otherwise it
+sleeps between iterations and only polls for input IDLE_POLL times per
+second, dropping to DEEP_IDLE_POLL after DEEP_IDLE_AFTER without input.
+The first input after an idle stretch brings the full rate back at once.
+
+The sleep is a ``threading.Event`` wait rather than ``pygame.event.wait``:
+with video drivers lacking native event waiting (dummy, KMSDRM on most
+handhelds) SDL implements the latter by polling every millisecond.
+Background threads whose results the loop should pick up promptly put
+them on a WakeQueue (or call ``wake()``), which ends the sleep early.
+The flag is cleared as soon as the sleep ends, before the loop drains
+any queue. A result put after the clear sets it again for the next
+sleep, and a drain that stops with items left calls ``wake()``.
+
+Redraws caused only by background work (download, scrape and patch
+progress) are throttled to BACKGROUND_INTERVAL.
+"""
+
+import queue
+import threading
+
+import pygame
+
+# ms after the last input during which the loop keeps the full frame rate
+ACTIVE_HOLD = 1000
+# ms between redraws driven only by background progress
+BACKGROUND_INTERVAL = 250
+# ms between input polls when idle, and after DEEP_IDLE_AFTER ms idle
+IDLE_POLL = 100
+DEEP_IDLE_POLL = 250
+DEEP_IDLE_AFTER = 10000
+
+# Event types that count as the user interacting; window and system
+# events don't hold the full frame rate
+INPUT_EVENTS = frozenset(
+    (
+        pygame.KEYDOWN,
+        pygame.KEYUP,
+        pygame.TEXTINPUT,
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEBUTTONUP,
+        pygame.MOUSEMOTION,
+        pygame.MOUSEWHEEL,
+        pygame.FINGERDOWN,
+        pygame.FINGERUP,
+        pygame.FINGERMOTION,
+        pygame.JOYBUTTONDOWN,
+        pygame.JOYBUTTONUP,
+        pygame.JOYAXISMOTION,
+        pygame.JOYHATMOTION,
+        pygame.CONTROLLERBUTTONDOWN,
+        pygame.CONTROLLERBUTTONUP,
+        pygame.CONTROLLERAXISMOTION,
+    )
+)
+
+_wake = threading.Event()
+
+
+def wake() -> None:
+    """End the main loop's idle sleep early (safe from any thread)."""
+    _wake.set()
+
+
+class WakeQueue(queue.Queue):
+    """Queue that wakes the main loop whenever an item is put."""
+
+    def put(self, item, block=True, timeout=None):
+        super().put(item, block, timeout)
+        _wake.set()
+
+
+class FramePacer:
+    """Decides how long the main loop sleeps between iterations."""
+
+    def __init__(self, fps: int):
+        self.fps = fps
+        self.clock = pygame.time.Clock()
+        # Startup counts as activity
+        self._last_input = pygame.time.get_ticks()
+        self._last_draw = 0
+        # Loop iterations and how many of them slept (for measurements)
+        self.iterations = 0
+        self.idle_waits = 0
+
+    def note_input(self) -> None:
+        """Record user input: the loop runs at full rate for a while."""
+        self._last_input = pygame.time.get_ticks()
+
+    def note_drawn(self) -> None:
+        """Record that a frame was drawn."""
+        self._last_draw = pygame.time.get_ticks()
+
+    def background_due(self) -> bool:
+        """Whether a redraw for background progress may happen now."""
+        return pygame.time.get_ticks() - self._last_draw >= BACKGROUND_INTERVAL
+
+    def wait(self, active: bool, pending: bool) -> None:
+        """
+        Sleep until the next loop iteration.
+
+        Args:
+            active: Interaction or animation in progress: keep the full rate
+            pending: Background work may change the screen: wake up when
+                the next background redraw is due
+        """
+        self.iterations += 1
+        now = pygame.time.get_ticks()
+        since_input = now - self._last_input
+        if active or since_input < ACTIVE_HOLD:
+            self.clock.tick(self.fps)
+        else:
+            self.idle_waits += 1
+            timeout = IDLE_POLL if since_input < DEEP_IDLE_AFTER else DEEP_IDLE_POLL
+            if pending:
+                remaining = BACKGROUND_INTERVAL - (now - self._last_draw)
+                if remaining > 0:
+                    timeout = min(timeout, remaining)
+            # Never spin faster than the full frame rate
+            _wake.wait(max(timeout, 1000 // self.fps) / 1000)
+            # Keep the clock's frame time meaningful after a long sleep
+            self.clock.tick()
+        # Everything put so far is drained by the iteration this starts;
+        # a put from here on sets the flag again, so it can't be missed
+        _wake.clear()
@@ -0,0 +1,161 @@
+"""
+Frame profiler for the main loop.
+
+The loop calls ``begin_frame()`` at the top of every iteration, ``lap(name)``
+after each phase (events, navigation, render, CRT layers, flip, capture)
+and ``end_frame()`` once a frame has been drawn. Iterations that draw
+nothing are dropped at the next ``begin_frame()``, so idle frames don't
+dilute the statistics.
+
+Each phase keeps a rolling window of recent durations for the on-screen
+p50/p99 overlay, and the last MAX_TRACE_FRAMES frames can be exported as
+Chrome trace-event JSON (chrome://tracing, Perfetto).
+
+Input latency is recorded alongside as the "input" phase: ``note_input()``
+marks when the loop picked up an input event or a held-direction repeat,
+and the next drawn frame records the time from the oldest such mark to
+the end of its "flip" phase. pygame doesn't expose SDL's event
+timestamps, so time spent in the event queue before the loop polls it
+(up to one frame while active, one idle poll otherwise) isn't included.
+
+When disabled every method returns immediately.
+"""
+
+import collections
+import json
+import os
+import time
+from typing import Deque, Dict, List, Optional, Tuple
+
+# Drawn frames the percentiles are computed over
+WINDOW = 120
+# Drawn frames kept for trace export
+MAX_TRACE_FRAMES = 2000
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of unsorted ``values`` (0.0 when empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class FrameProfiler:
+    """Per-phase timings of drawn frames."""
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        window: int = WINDOW,
+        trace_frames: int = MAX_TRACE_FRAMES,
+    ):
+        self.enabled = enabled
+        self.window = window
+        self.frames = 0
+        self._origin = time.perf_counter()
+        self._start: Optional[float] = None
+        self._last = 0.0
+        # (phase, start, end) of the frame in progress
+        self._laps: List[Tuple[str, float, float]] = []
+        # When the oldest input not yet shown on screen was picked up
+        self._input: Optional[float] = None
+        # phase -> recent durations in seconds, in first-seen order
+        self._durations: Dict[str, Deque[float]] = {}
+        self._trace: Deque[Tuple[float, float, list]] = collections.deque(
+            maxlen=trace_frames
+        )
+
+    def begin_frame(self) -> None:
+        """Start timing an iteration, dropping an undrawn previous one."""
+        if not self.enabled:
+            return
+        self._start = self._last = time.perf_counter()
+        self._laps = []
+
+    def lap(self, phase: str) -> None:
+        """Attribute the time since the previous lap to ``phase``."""
+        if not self.enabled or self._start is None:
+            return
+        now = time.perf_counter()
+        self._laps.append((phase, self._last, now))
+        self._last = now
+
+    def note_input(self) -> None:
+        """Mark input picked up; the next drawn frame records its latency."""
+        if not self.enabled or self._input is not None:
+            return
+        self._input = time.perf_counter()
+
+    def end_frame(self) -> None:
+        """Record the current iteration as a drawn frame."""
+        if not self.enabled or self._start is None:
+            return
+        totals: Dict[str, float] = {}
+        shown = self._last
+        for phase, start, end in self._laps:
+            totals[phase] = totals.get(phase, 0.0) + end - start
+            if phase == "flip":
+                shown = end
+        totals["frame"] = self._last - self._start
+        laps = self._laps
+        if self._input is not None:
+            totals["input"] = shown - self._input
+            laps = laps + [("input", self._input, shown)]
+            self._input = None
+        for phase, duration in totals.items():
+            samples = self._durations.get(phase)
+            if samples is None:
+                samples = self._durations[phase] = collections.deque(maxlen=self.window)
+            samples.append(duration)
+        self._trace.append((self._start, self._last, laps))
+        self.frames += 1
+        self._start = None
+
+    def stats(self) -> Dict[str, Tuple[float, float]]:
+        """Phase -> (p50, p99) in milliseconds over the recent window."""
+        return {
+            phase: (
+                percentile(list(samples), 0.5) * 1000,
+                percentile(list(samples), 0.99) * 1000,
+            )
+            for phase, samples in self._durations.items()
+        }
+
+    def trace_events(self) -> List[dict]:
+        """Recorded frames as Chrome trace "complete" events."""
+        events = []
+        origin = self._origin
+
+        def event(name, start, end):
+            return {
+                "name": name,
+                "ph": "X",
+                "ts": round((start - origin) * 1e6, 1),
+                "dur": round((end - start) * 1e6, 1),
+                "pid": 1,
+                # Input latency spans overlap frames: own track
+                "tid": 2 if name == "input" else 1,
+            }
+
+        for start, end, laps in self._trace:
+            events.append(event("frame", start, end))
+            events.extend(event(*lap) for lap in laps)
+        return events
+
+    def export_trace(self, path: str) -> str:
+        """
+        Write the recorded frames as Chrome trace-event JSON.
+
+        Args:
+            path: Output file; its directory is created if needed
+
+        Returns:
+            The path written
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({"traceEvents": self.trace_events(), "displayTimeUnit": "ms"}, f)
+        return path
@@ -0,0 +1,206 @@
+"""
+Off-main-thread image decoding for Console Utilities.
+
+Decodes downloaded image bytes and resamples them to their display size
+as a raw RGBA buffer, so the main thread only has to wrap the pixels with
+``pygame.image.frombuffer``. Uses Pillow when available (it releases the
+GIL while decoding and can run in a process pool), otherwise falls back
+to pygame without touching any display state.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from threading import Lock
+from typing import Optional, Tuple
+
+import pygame
+
+try:
+    from PIL import Image
+
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+# Raw decoded image: (RGBA bytes, (width, height))
+DecodedImage = Tuple[bytes, Tuple[int, int]]
+
+_tobytes = getattr(pygame.image, "tobytes", None) or pygame.image.tostring
+
+
+def _fit_size(
+    size: Tuple[int, int],
+    target_size: Optional[Tuple[int, int]],
+    max_dimension: Optional[int],
+) -> Tuple[int, int]:
+    """Return the output size for a decoded image."""
+    if target_size:
+        return target_size
+    if max_dimension and max(size) > max_dimension:
+        scale = max_dimension / max(size)
+        return max(1, int(size[0] * scale)), max(1, int(size[1] * scale))
+    return size
+
+
+def _decode_with_pil(
+    data: bytes,
+    target_size: Optional[Tuple[int, int]],
+    max_dimension: Optional[int],
+) -> DecodedImage:
+    """Decode and resample with Pillow."""
+    image = Image.open(BytesIO(data))
+    out_size = _fit_size(image.size, target_size, max_dimension)
+    # Let JPEG decode at a reduced scale when the output is much smaller
+    image.draft("RGB", out_size)
+    image = image.convert("RGBA")
+    if image.size != out_size:
+        image = image.resize(out_size, Image.BILINEAR, reducing_gap=2.0)
+    return image.tobytes(), out_size
+
+
+def _decode_with_pygame(
+    data: bytes,
+    target_size: Optional[Tuple[int, int]],
+    max_dimension: Optional[int],
+) -> DecodedImage:
+    """Decode and resample with pygame, without using the display."""
+    image = pygame.image.load(BytesIO(data))
+    if image.get_bitsize() not in (24, 32):
+        # smoothscale needs 24/32-bit input; expand paletted images
+        expanded = pygame.Surface(image.get_size(), pygame.SRCALPHA, 32)
+        expanded.blit(image, (0, 0))
+        image = expanded
+    out_size = _fit_size(image.get_size(), target_size, max_dimension)
+    if image.get_size() != out_size:
+        image = pygame.transform.smoothscale(image, out_size)
+    return _tobytes(image, "RGBA"), out_size
+
+
+def decode_image(
+    data: bytes,
+    target_size: Optional[Tuple[int, int]] = None,
+    max_dimension: Optional[int] = None,
+) -> DecodedImage:
+    """
+    Decode image bytes into a raw RGBA buffer at the display size.
+
+    Safe to call from worker threads and worker processes.
+
+    Args:
+        data: Encoded image bytes (PNG, JPEG, ...)
+        target_size: Exact output size, or None to keep the aspect ratio
+        max_dimension: Downscale so the longest side fits, if no target_size
+
+    Returns:
+        Tuple of (RGBA bytes, (width, height))
+    """
+    if PIL_AVAILABLE:
+        try:
+            return _decode_with_pil(data, target_size, max_dimension)
+        except Exception:
+            # Formats Pillow can't read may still load through SDL_image
+            pass
+    return _decode_with_pygame(data, target_size, max_dimension)
+
+
+def surface_to_raw(
+    surface: pygame.Surface, target_size: Optional[Tuple[int, int]] = None
+) -> DecodedImage:
+    """Resample an existing surface into a raw RGBA buffer."""
+    if target_size and surface.get_size() != target_size:
+        surface = pygame.transform.smoothscale(surface, target_size)
+    return _tobytes(surface, "RGBA"), surface.get_size()
+
+
+def raw_to_surface(decoded: DecodedImage) -> pygame.Surface:
+    """
+    Wrap a raw RGBA buffer as a surface. Must run on the main thread.
+
+    The surface is converted to the display format when a display exists,
+    which keeps later blits on the fast path.
+    """
+    pixels, size = decoded
+    surface = pygame.image.frombuffer(pixels, size, "RGBA")
+    if pygame.display.get_init() and pygame.display.get_surface() is not None:
+        surface = surface.convert_alpha()
+    return surface
+
+
+class ImageDecoder:
+    """
+    Runs decode_image in the calling thread or in an optional process pool.
+
+    A process pool moves decoding off the GIL entirely, but is only used
+    when Pillow is available; otherwise decoding runs in the caller's
+    (background) thread. Workers are spawned rather than forked: a fork
+    taken while another thread holds a lock (logging, malloc, caches)
+    leaves the worker hung on it forever. The pool is created with the
+    decoder, so construct it before starting background threads.
+    """
+
+    def __init__(self, processes: int = 0):
+        """
+        Initialize the decoder.
+
+        Args:
+            processes: Worker processes for decoding, 0 to decode in-thread
+        """
+        self._processes = processes if PIL_AVAILABLE else 0
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = Lock()
+        self._get_pool()
+
+    def _get_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Return the process pool, creating it if needed."""
+        if self._processes <= 0:
+            return None
+        with self._lock:
+            if self._pool is None:
+                try:
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self._processes,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                except Exception:
+                    # No multiprocessing on this platform, decode in-thread
+                    self._processes = 0
+            return self._pool
+
+    def decode(
+        self,
+        data: bytes,
+        target_size: Optional[Tuple[int, int]] = None,
+        max_dimension: Optional[int] = None,
+    ) -> DecodedImage:
+        """
+        Decode image bytes into a raw RGBA buffer (blocking).
+
+        Decode errors propagate to the caller. If a worker process died,
+        the pool is dropped (a new one starts on the next call) and this
+        image is decoded in-thread.
+        """
+        pool = self._get_pool()
+        if pool is not None:
+            try:
+                return pool.submit(
+                    decode_image, data, target_size, max_dimension
+                ).result()
+            except BrokenProcessPool:
+                self._discard_pool(pool)
+        return decode_image(data, target_size, max_dimension)
+
+    def _discard_pool(self, pool: ProcessPoolExecutor) -> None:
+        """Drop a broken pool unless another caller already replaced it."""
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self):
+        """Stop worker processes, if any."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
@@ -0,0 +1,165 @@
+"""
+Fixed-resolution rendering scaled to the window.
+
+With RENDER_RESOLUTION set, the UI is drawn onto an offscreen surface of
+that logical size and copied to the window in a single scale per frame,
+centered and letterboxed to keep its aspect ratio. Drawing cost then
+depends on the logical size only, and a window resize just recomputes
+where the frame goes: theme, screens, CRT overlays and cached layers all
+stay at the logical size.
+
+The copy is a nearest-neighbour ``transform.scale``. When the window is
+an exact integer multiple of the logical size that is plain pixel
+replication and partial updates scale just their regions; other sizes
+scale the whole frame. ``transform.smoothscale`` filters non-integer
+fits but costs about three times as much (7 ms vs 2.3 ms for 800x600 to
+1440x1080), so it is opt-in (RENDER_SMOOTH).
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+import pygame
+
+# Mouse and touch events whose coordinates are translated to logical ones
+_MOUSE_EVENTS = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION)
+_FINGER_EVENTS = (pygame.FINGERDOWN, pygame.FINGERUP, pygame.FINGERMOTION)
+
+
+def parse_resolution(value: str) -> Optional[Tuple[int, int]]:
+    """
+    Parse a ``"WxH"`` resolution.
+
+    Returns:
+        (width, height), or None if the value is empty or malformed
+    """
+    try:
+        width, height = (int(part) for part in value.lower().split("x"))
+    except ValueError:
+        return None
+    if width <= 0 or height <= 0:
+        return None
+    return width, height
+
+
+class RenderScaler:
+    """Logical render surface and its placement in the window."""
+
+    def __init__(self, size: Tuple[int, int], smooth: bool = False):
+        self.size = size
+        self.smooth = smooth
+        self.surface: Optional[pygame.Surface] = None
+        self.window: Optional[pygame.Surface] = None
+        # Window region the logical frame is scaled into
+        self.dest = pygame.Rect((0, 0), size)
+        # Integer scale factor, or 0 when the fit isn't a whole multiple
+        self.factor = 1
+
+    def resize(self, window: pygame.Surface) -> None:
+        """Fit the logical frame into a (new) window surface."""
+        self.window = window
+        width, height = self.size
+        win_w, win_h = window.get_size()
+        scale = min(win_w / width, win_h / height)
+        self.factor = int(scale) if scale >= 1 and scale == int(scale) else 0
+        dest_w = max(1, round(width * scale))
+        dest_h = max(1, round(height * scale))
+        self.dest = pygame.Rect(
+            (win_w - dest_w) // 2, (win_h - dest_h) // 2, dest_w, dest_h
+        )
+        if self.surface is None:
+            # Same pixel format as the window so scaling is a plain copy
+            self.surface = pygame.Surface(self.size).convert()
+        # Letterbox bars are never drawn over again
+        window.fill((0, 0, 0))
+
+    def present(self, rects: Optional[Sequence[pygame.Rect]] = None) -> None:
+        """
+        Scale the logical frame to the window and show it.
+
+        Args:
+            rects: Logical regions that changed; None for the whole frame
+        """
+        if self.factor and rects is not None:
+            pygame.display.update(self._scale_regions(rects))
+            return
+
+        self._scale_frame()
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update([self.to_window(rect) for rect in rects])
+
+    def _scale_frame(self) -> None:
+        target = self.window.subsurface(self.dest)
+        if self.factor or not self.smooth:
+            pygame.transform.scale(self.surface, self.dest.size, target)
+            return
+        try:
+            pygame.transform.smoothscale(self.surface, self.dest.size, target)
+        except ValueError:
+            # smoothscale needs 24/32-bit surfaces
+            pygame.transform.scale(self.surface, self.dest.size, target)
+
+    def _scale_regions(self, rects: Sequence[pygame.Rect]) -> List[pygame.Rect]:
+        """Pixel-double just the given regions; returns their window rects."""
+        factor = self.factor
+        mapped = []
+        for rect in rects:
+            rect = pygame.Rect(rect).clip(self.surface.get_rect())
+            if not rect.width or not rect.height:
+                continue
+            target = self.to_window(rect)
+            pygame.transform.scale(
+                self.surface.subsurface(rect),
+                (rect.width * factor, rect.height * factor),
+                self.window.subsurface(target),
+            )
+            mapped.append(target)
+        return mapped
+
+    def to_window(self, rect: pygame.Rect) -> pygame.Rect:
+        """Window rect covering a logical rect."""
+        sx = self.dest.width / self.size[0]
+        sy = self.dest.height / self.size[1]
+        left = int(rect.left * sx)
+        top = int(rect.top * sy)
+        right = -int(-rect.right * sx)
+        bottom = -int(-rect.bottom * sy)
+        return pygame.Rect(
+            self.dest.x + left, self.dest.y + top, right - left, bottom - top
+        ).clip(self.dest)
+
+    def to_logical(self, pos: Tuple[float, float]) -> Tuple[int, int]:
+        """Logical position of a window position, clamped to the frame."""
+        width, height = self.size
+        x = (pos[0] - self.dest.x) * width // self.dest.width
+        y = (pos[1] - self.dest.y) * height // self.dest.height
+        return (
+            int(min(max(x, 0), width - 1)),
+            int(min(max(y, 0), height - 1)),
+        )
+
+    def map_event(self, event: pygame.event.Event) -> pygame.event.Event:
+        """Translate a mouse or touch event's coordinates to logical ones."""
+        if event.type in _MOUSE_EVENTS:
+            attrs = dict(event.dict, pos=self.to_logical(event.pos))
+            if "rel" in attrs:
+                attrs["rel"] = (
+                    int(event.rel[0] * self.size[0] / self.dest.width),
+                    int(event.rel[1] * self.size[1] / self.dest.height),
+                )
+            return pygame.event.Event(event.type, attrs)
+        if event.type in _FINGER_EVENTS:
+            # Normalized to the window; renormalize to the frame
+            win_w, win_h = self.window.get_size()
+            x = (event.x * win_w - self.dest.x) / self.dest.width
+            y = (event.y * win_h - self.dest.y) / self.dest.height
+            attrs = dict(
+                event.dict,
+                x=min(max(x, 0.0), 1.0),
+                y=min(max(y, 0.0), 1.0),
+                dx=event.dx * win_w / self.dest.width,
+                dy=event.dy * win_h / self.dest.height,
+            )
+            return pygame.event.Event(event.type, attrs)
+        return event
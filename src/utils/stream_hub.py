@@ -0,0 +1,319 @@
+"""
+Event-loop fan-out for long-lived streaming HTTP responses.
+
+SSE and MJPEG connections are handed off by the request handler thread
+once the response headers are sent. A single selector thread then owns
+every such socket: when a publisher calls ``notify()``, each subscriber
+whose previous message has been fully written is asked for its next one
+from its own cursor. Slow clients keep their unsent bytes and are simply
+skipped until the socket drains, so they get the latest frame or state
+rather than a queue of stale ones.
+"""
+
+import selectors
+import socket
+import threading
+import time
+
+# Bytes per non-blocking send
+SEND_CHUNK = 256 * 1024
+# Drop clients whose socket has not accepted data for this long (seconds)
+STALL_TIMEOUT = 30.0
+# Longest sleep of the loop when no timer is due
+_MAX_WAIT = 1.0
+
+
+class MJPEGSubscriber:
+    """
+    Sends the latest encoded frame as multipart/x-mixed-replace parts.
+
+    With a RateController the client acknowledges frames, and the
+    controller picks the encoder variant and paces sends; otherwise
+    every new frame is sent at the encoder's default variant.
+    """
+
+    # Re-send the last frame on idle streams; some browsers only show a
+    # part once the next one starts
+    keepalive_interval = 1.0
+    # Kernel send buffer: room for about one frame, so frames wait in
+    # the hub (where newer ones replace them) rather than in the socket
+    send_buffer = 64 * 1024
+
+    def __init__(self, encoder, rate=None):
+        self._encoder = encoder
+        self._rate = rate
+        self._seq = 0
+        self.poll_at = None
+        if rate is not None:
+            # Acknowledging clients parse parts by length themselves
+            self.keepalive_interval = None
+            self._variant = rate.variant
+        else:
+            self._variant = encoder.default_variant
+        encoder.subscribe(self._variant)
+
+    def poll(self):
+        """Next part to send, or None while no newer frame may be sent."""
+        now = time.monotonic()
+        rate = self._rate
+        if rate is not None:
+            if rate.variant != self._variant:
+                self._encoder.set_variant(self._variant, rate.variant)
+                self._variant = rate.variant
+                # The new variant's first frame may carry a seq already
+                # sent (unchanged pixels): send it whatever its seq
+                self._seq = -1
+            if not rate.ready(now):
+                self.poll_at = rate.next_poll(now)
+                return None
+            self.poll_at = None
+        seq, frame, captured_at = self._encoder.latest(self._variant)
+        if seq == self._seq or not frame:
+            return None
+        self._seq = seq
+        if rate is not None:
+            rate.sent(seq, len(frame), now)
+        return self._part(seq, frame, captured_at)
+
+    def keepalive(self):
+        seq, frame, captured_at = self._encoder.latest(self._variant)
+        return self._part(seq, frame, captured_at) if frame else None
+
+    def close(self):
+        self._encoder.unsubscribe(self._variant)
+
+    @staticmethod
+    def _part(seq, frame, captured_at):
+        return (
+            b"--frame\r\n"
+            b"Content-Type: image/jpeg\r\n"
+            b"Content-Length: %d\r\n"
+            b"X-Frame-Seq: %d\r\n"
+            b"X-Capture-Time: %d\r\n\r\n" % (len(frame), seq, captured_at * 1000)
+            + frame
+            + b"\r\n"
+        )
+
+
+class _Client:
+    """Socket, subscriber and unsent bytes of one streaming connection."""
+
+    __slots__ = ("sock", "subscriber", "out", "last_write", "blocked_since")
+
+    def __init__(self, sock, subscriber, now):
+        self.sock = sock
+        self.subscriber = subscriber
+        self.out = None
+        self.last_write = now
+        self.blocked_since = None
+
+
+class StreamHub:
+    """
+    Single selector thread serving any number of streaming connections.
+
+    Subscribers are duck-typed objects with ``poll()`` returning the next
+    bytes to send from their own cursor (or None when up to date),
+    ``keepalive()``, a ``keepalive_interval`` in seconds (or None), and
+    ``close()``. A subscriber that paces itself may set ``poll_at`` to
+    the monotonic time it wants to be polled again without a notify,
+    and one that must not queue in the kernel may set ``send_buffer``
+    to cap the socket's send buffer size.
+    The thread starts with the first client and exits when the last one
+    disconnects.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inbox = []
+        self._thread = None
+        self._closing = False
+        self._selector = selectors.DefaultSelector()
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ)
+        self._clients = {}
+
+    @property
+    def clients(self) -> int:
+        """Number of connections currently streamed."""
+        return len(self._clients) + len(self._inbox)
+
+    def attach(self, sock, subscriber):
+        """
+        Take over a connected socket whose response headers were sent.
+
+        The handler's socket object is detached, so the HTTP server's
+        own shutdown and close of the request leave the connection open.
+        """
+        sock = socket.socket(fileno=sock.detach())
+        sock.setblocking(False)
+        send_buffer = getattr(subscriber, "send_buffer", None)
+        if send_buffer:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, send_buffer)
+        with self._lock:
+            self._inbox.append((sock, subscriber))
+            if self._thread is None:
+                self._closing = False
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        self.notify()
+
+    def notify(self):
+        """Wake the loop so idle subscribers poll for new data. Thread-safe."""
+        try:
+            self._wake_w.send(b"\0")
+        except (BlockingIOError, OSError):
+            # A wakeup is already pending
+            pass
+
+    def close(self):
+        """Disconnect every client and stop the loop thread."""
+        with self._lock:
+            self._closing = True
+        self.notify()
+
+    def _run(self):
+        """Selector loop: write, poll subscribers, send keepalives."""
+        while True:
+            with self._lock:
+                inbox, self._inbox = self._inbox, []
+                if self._closing or (not inbox and not self._clients):
+                    for sock, subscriber in inbox:
+                        self._close_client(_Client(sock, subscriber, 0.0))
+                    if self._closing:
+                        for client in list(self._clients.values()):
+                            self._drop(client)
+                    self._thread = None
+                    return
+
+            now = time.monotonic()
+            for sock, subscriber in inbox:
+                client = _Client(sock, subscriber, now)
+                self._clients[sock] = client
+                self._selector.register(sock, selectors.EVENT_READ, client)
+
+            for key, events in self._selector.select(self._wait_time(now)):
+                client = key.data
+                if client is None:
+                    self._drain_wakeups()
+                    continue
+                if events & selectors.EVENT_READ and not self._read(client):
+                    continue
+                if events & selectors.EVENT_WRITE:
+                    self._flush(client, time.monotonic())
+
+            now = time.monotonic()
+            for client in list(self._clients.values()):
+                if client.out is None:
+                    self._fill(client, now)
+                    if client.out is None and client.sock in self._clients:
+                        self._keepalive(client, now)
+                elif now - client.blocked_since > STALL_TIMEOUT:
+                    self._drop(client)
+
+    def _wait_time(self, now):
+        """Seconds until the next keepalive or poll is due, capped at _MAX_WAIT."""
+        wait = _MAX_WAIT
+        for client in self._clients.values():
+            if client.out is not None:
+                continue
+            interval = client.subscriber.keepalive_interval
+            if interval:
+                wait = min(wait, client.last_write + interval - now)
+            poll_at = getattr(client.subscriber, "poll_at", None)
+            if poll_at is not None:
+                wait = min(wait, poll_at - now)
+        return max(0.0, wait)
+
+    def _drain_wakeups(self):
+        try:
+            while self._wake_r.recv(4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def _read(self, client):
+        """Discard request bytes; returns False if the peer disconnected."""
+        try:
+            if client.sock.recv(4096):
+                return True
+        except BlockingIOError:
+            return True
+        except OSError:
+            pass
+        self._drop(client)
+        return False
+
+    def _fill(self, client, now):
+        """Poll the subscriber and send until it is up to date or blocked."""
+        while client.out is None and client.sock in self._clients:
+            try:
+                data = client.subscriber.poll()
+            except Exception:
+                self._drop(client)
+                return
+            if not data:
+                return
+            client.out = memoryview(data)
+            self._flush(client, now)
+
+    def _keepalive(self, client, now):
+        interval = client.subscriber.keepalive_interval
+        if not interval or now - client.last_write < interval:
+            return
+        data = client.subscriber.keepalive()
+        if data:
+            client.out = memoryview(data)
+            self._flush(client, now)
+        else:
+            client.last_write = now
+
+    def _flush(self, client, now):
+        """Write pending bytes without blocking; watch for writability if any remain."""
+        out = client.out
+        try:
+            while out:
+                sent = client.sock.send(out[:SEND_CHUNK])
+                out = out[sent:]
+        except BlockingIOError:
+            pass
+        except OSError:
+            self._drop(client)
+            return
+
+        if out:
+            if client.blocked_since is None:
+                self._selector.modify(
+                    client.sock, selectors.EVENT_READ | selectors.EVENT_WRITE, client
+                )
+                client.blocked_since = now
+            elif len(out) < len(client.out):
+                # Progress resets the stall clock
+                client.blocked_since = now
+            client.out = out
+            return
+
+        client.out = None
+        client.last_write = now
+        if client.blocked_since is not None:
+            client.blocked_since = None
+            self._selector.modify(client.sock, selectors.EVENT_READ, client)
+
+    def _drop(self, client):
+        if self._clients.pop(client.sock, None) is None:
+            return
+        self._selector.unregister(client.sock)
+        self._close_client(client)
+
+    @staticmethod
+    def _close_client(client):
+        try:
+            client.sock.close()
+        except OSError:
+            pass
+        try:
+            client.subscriber.close()
+        except Exception:
+            pass
@@ -0,0 +1,210 @@
+"""
+Per-client rate control for adaptive MJPEG streams.
+
+Clients acknowledge every frame they display. From the acks the
+controller keeps a smoothed RTT, the minimum RTT seen (the unloaded
+path) and a delivery-rate estimate (the windowed maximum of per-frame
+samples, each a lower bound of the link rate), and uses them to pick:
+
+- the frame interval, so the stream uses at most ~80% of the measured
+  delivery rate;
+- a quality level (scale and JPEG quality), stepping down when frames
+  start queueing on the link or the rate cannot carry half the target
+  frame rate, and probing back up once it has been quiet for a while.
+  Rate samples from an idle link understate its capacity, so probes are
+  driven by delay alone; a probe that fails doubles the wait before the
+  next one.
+
+At most MAX_IN_FLIGHT frames are unacknowledged at any time; newer
+frames replace older ones instead of queueing behind them, which keeps
+input-to-photon latency close to the RTT.
+"""
+
+import collections
+import threading
+
+# Quality levels, best first: (scale factor, JPEG quality)
+LEVELS = ((1.0, 80), (1.0, 65), (0.75, 60), (0.5, 55), (0.5, 40))
+# Frame rate floor when the link is very slow
+MIN_FPS = 2
+# Unacknowledged frames allowed on the wire
+MAX_IN_FLIGHT = 2
+# Frames not acknowledged within this many seconds count as lost
+ACK_TIMEOUT = 2.0
+# Queueing delay (smoothed RTT above the minimum) that triggers a step down
+TARGET_DELAY = 0.1
+# Fraction of the measured delivery rate the stream may use
+_HEADROOM = 0.8
+# Step down when the rate allows less than this fraction of max_fps
+_DEGRADE_FPS = 0.5
+# Seconds of delivery-rate samples the estimate is the maximum of
+_RATE_WINDOW = 5.0
+# Seconds between successive step downs, and of calm before a step up
+# (doubled after each failed probe, up to the maximum)
+_STEP_DOWN_GAP = 0.5
+_STEP_UP_AFTER = 3.0
+_MAX_STEP_UP_AFTER = 30.0
+# Smoothing factor of the RTT, rate and frame size averages
+_ALPHA = 0.2
+
+
+def _ewma(average, sample):
+    return sample if average is None else average + _ALPHA * (sample - average)
+
+
+class RateController:
+    """Throughput and RTT estimator choosing frame rate and quality for one client."""
+
+    def __init__(self, max_fps, levels=LEVELS):
+        self.max_fps = max_fps
+        self.levels = levels
+        self.level = 0
+        self.rtt = None
+        self.min_rtt = None
+        self.delivery_rate = None
+        self._rate_samples = collections.deque()
+        self._lock = threading.Lock()
+        self._in_flight = {}
+        self._sizes = {}
+        self._last_send = float("-inf")
+        self._last_ack = float("-inf")
+        self._last_step = float("-inf")
+        self._last_probe = float("-inf")
+        self._probe_wait = _STEP_UP_AFTER
+        self._calm_since = None
+
+    @property
+    def variant(self):
+        """(scale, quality) of the current level."""
+        return self.levels[self.level]
+
+    @property
+    def frame_interval(self):
+        """
+        Seconds between frames allowed by the delivery rate; 0 while the
+        rate is unknown (the encoder's own frame rate applies).
+        """
+        size = self._sizes.get(self.level)
+        if not self.delivery_rate or not size:
+            return 0.0
+        return min(size / (self.delivery_rate * _HEADROOM), 1.0 / MIN_FPS)
+
+    def ready(self, now):
+        """True if a frame may be sent now."""
+        with self._lock:
+            self._expire(now)
+            return (
+                len(self._in_flight) < MAX_IN_FLIGHT
+                and now - self._last_send >= self.frame_interval
+            )
+
+    def next_poll(self, now):
+        """Monotonic time at which ``ready`` may turn true without an ack."""
+        with self._lock:
+            due = self._last_send + self.frame_interval
+            if len(self._in_flight) >= MAX_IN_FLIGHT:
+                oldest = min(sent for sent, _ in self._in_flight.values())
+                due = max(due, oldest + ACK_TIMEOUT)
+            return max(due, now)
+
+    def sent(self, seq, size, now):
+        """Record a frame of ``size`` bytes written at ``now``."""
+        with self._lock:
+            self._in_flight[seq] = (now, size)
+            self._last_send = now
+            self._sizes[self.level] = _ewma(self._sizes.get(self.level), size)
+
+    def acked(self, seq, now):
+        """Record the client's acknowledgement of frame ``seq``."""
+        with self._lock:
+            entry = self._in_flight.pop(seq, None)
+            if entry is None:
+                return
+            # Older frames were superseded before the client showed them
+            for old in [s for s in self._in_flight if s < seq]:
+                del self._in_flight[old]
+            sent_at, size = entry
+            rtt = now - sent_at
+            self.rtt = _ewma(self.rtt, rtt)
+            if self.min_rtt is None or rtt < self.min_rtt:
+                self.min_rtt = rtt
+            else:
+                # Forget slowly, in case the path itself got longer
+                self.min_rtt += (rtt - self.min_rtt) * 0.01
+
+            # Delivered since the later of this frame's send and the previous
+            # ack; never more than the link could carry
+            interval = now - max(sent_at, self._last_ack)
+            self._last_ack = now
+            samples = self._rate_samples
+            samples.append((now, size / max(interval, 0.001)))
+            while samples[0][0] < now - _RATE_WINDOW:
+                samples.popleft()
+            self.delivery_rate = max(sample for _, sample in samples)
+            self._adapt(now)
+
+    def stats(self):
+        """Current estimates for display in the client overlay."""
+        with self._lock:
+            scale, quality = self.variant
+            return {
+                "level": self.level,
+                "scale": scale,
+                "quality": quality,
+                "fps": round(
+                    min(self.max_fps, 1.0 / max(self.frame_interval, 1e-3)), 1
+                ),
+                "rtt_ms": round(self.rtt * 1000) if self.rtt is not None else None,
+                "rate_kbps": (
+                    round(self.delivery_rate * 8 / 1000) if self.delivery_rate else None
+                ),
+            }
+
+    def _expire(self, now):
+        """Treat long-unacknowledged frames as lost (congestion)."""
+        lost = [
+            s for s, (sent, _) in self._in_flight.items() if now - sent > ACK_TIMEOUT
+        ]
+        for seq in lost:
+            del self._in_flight[seq]
+        if lost:
+            self._step_down(now)
+
+    def _fps_at(self, level):
+        """Frame rate the delivery rate allows at ``level``, None if unknown."""
+        size = self._sizes.get(level)
+        if not size:
+            return None
+        return self.delivery_rate * _HEADROOM / size
+
+    def _adapt(self, now):
+        queue_delay = self.rtt - self.min_rtt
+        fps = self._fps_at(self.level)
+        if queue_delay > TARGET_DELAY or (
+            fps is not None and fps < self.max_fps * _DEGRADE_FPS
+        ):
+            self._calm_since = None
+            self._step_down(now)
+            return
+        if queue_delay > TARGET_DELAY / 3:
+            self._calm_since = None
+            return
+        if self._calm_since is None:
+            self._calm_since = now
+        if self.level > 0 and now - self._calm_since >= self._probe_wait:
+            if now - self._last_probe < 2 * self._probe_wait:
+                # The previous probe held; probe again sooner
+                self._probe_wait = max(_STEP_UP_AFTER, self._probe_wait / 2)
+            self.level -= 1
+            self._last_step = self._last_probe = now
+            self._calm_since = now
+
+    def _step_down(self, now):
+        if (
+            self.level < len(self.levels) - 1
+            and now - self._last_step >= _STEP_DOWN_GAP
+        ):
+            if now - self._last_probe < self._probe_wait:
+                self._probe_wait = min(_MAX_STEP_UP_AFTER, self._probe_wait * 2)
+            self.level += 1
+            self._last_step = now
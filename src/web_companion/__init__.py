@@ -6,6 +6,7 @@ on the same network and get a context-aware web interface for faster input.
 """
 
 import collections
+import hashlib
 import io
 import json
 import os
@@ -22,7 +23,24 @@ from socketserver import ThreadingMixIn
 import pygame
 
 from constants import SCREEN_WIDTH, SCREEN_HEIGHT, WEB_COMPANION_PORT
-from .state_serializer import serialize_web_state
+from utils.frame_encoder import FrameEncoder
+from utils.frame_pacing import WakeQueue
+from utils.stream_hub import StreamHub, MJPEGSubscriber
+from .state_serializer import serialize_web_state, get_list_source
+from .list_pager import ListPager
+from .dir_cache import DirectoryCache
+from .uploads import UploadTracker, MultipartError, receive_files
+from .downloads import (
+    RangeNotSatisfiable,
+    content_disposition,
+    etag_matches,
+    file_validators,
+    if_range_matches,
+    parse_range,
+    send_file,
+)
+from .zip_export import write_zip
+from .state_stream import StateStream, StateSubscriber
 from .action_handler import handle_action
 from .client import CLIENT_HTML
 
@@ -123,22 +141,25 @@ class WebCompanion:
 
     def __init__(self, port=WEB_COMPANION_PORT):
         self.port = port
-        self._action_queue = queue.Queue()
-        self._state_json = "{}"
-        self._state_lock = threading.Lock()
-        self._state_event = threading.Event()
-        self._frame = None
-        self._frame_lock = threading.Lock()
-        self._frame_event = threading.Event()
+        self._action_queue = WakeQueue()
+        self._stream = StateStream()
+        self._pager = ListPager()
+        self._dirs = DirectoryCache()
+        self._uploads = UploadTracker()
+        # SSE and MJPEG connections are served from one event loop thread
+        self._hub = StreamHub()
+        self._last_push_time = 0.0
+        self._push_pending = True
+        self._state_version = None
+        # Preview shown 180px tall on the phone; 2x for high-DPI screens
+        self._encoder = FrameEncoder(fps=15, quality=70, max_size=(640, 360))
+        self._encoder.add_listener(self._hub.notify)
         self._server = None
         self._thread = None
         self._running = False
         self._html_bytes = CLIENT_HTML.encode("utf-8")
         self._local_ip = _get_local_ip()
         self._settings = None
-        self._capture_buf = io.BytesIO()
-        self._frame_interval = 1.0 / 15
-        self._last_capture_time = 0.0
 
     @property
     def url(self):
@@ -158,54 +179,83 @@ class WebCompanion:
     def stop(self):
         """Stop the web companion server."""
         self._running = False
+        self._hub.close()
         if self._server:
             self._server.shutdown()
             self._server = None
         self._thread = None
 
-    def push_state(self, state, settings=None, data=None):
-        """Serialize and push state to connected SSE clients (throttled)."""
+    # Seconds between serializations, and before re-checking unchanged state
+    PUSH_INTERVAL = 0.1
+    RESYNC_INTERVAL = 5.0
+
+    def push_state(self, state, settings=None, data=None, changed=False):
+        """
+        Serialize and push state to connected SSE clients (throttled).
+
+        Serialization only runs when the state version moved or the caller
+        reports a change (at most every PUSH_INTERVAL), or every
+        RESYNC_INTERVAL to catch changes the version can't see. Clients
+        are woken only when the serialized state differs, which bumps the
+        stream version.
+        """
         if settings is not None:
             self._settings = settings
+        now = time.time()
+        elapsed = now - self._last_push_time
+        version = getattr(state, "version", None)
+        changed = (
+            self._uploads.consume_changed()
+            or changed
+            or version is None
+            or version != self._state_version
+        )
+        self._push_pending = self._push_pending or changed
+        if elapsed < self.PUSH_INTERVAL:
+            return
+        if not self._push_pending and elapsed < self.RESYNC_INTERVAL:
+            return
+        self._last_push_time = now
+        self._push_pending = False
+        self._state_version = version
         try:
             state_dict = serialize_web_state(state, settings, data)
-            state_json = json.dumps(state_dict, default=str)
-            with self._state_lock:
-                self._state_json = state_json
-            self._state_event.set()
+            uploads = self._uploads.snapshot()
+            if uploads:
+                state_dict["uploads"] = uploads
+            source = get_list_source(state, data) if "list" in state_dict else None
+            self._pager.publish(source)
+            if self._stream.publish(state_dict):
+                self._hub.notify()
         except Exception:
             pass
 
     def capture_frame(self, surface):
-        """Capture the current pygame surface as JPEG bytes for MJPEG stream."""
-        now = time.time()
-        if now - self._last_capture_time < self._frame_interval:
-            return
-        self._last_capture_time = now
+        """Hand the current pygame surface to the MJPEG encoder thread."""
+        self._encoder.capture(surface)
 
-        buf = self._capture_buf
-        buf.seek(0)
-        buf.truncate(0)
-        try:
-            pygame.image.save(surface, buf, "frame.jpg")
-        except Exception:
-            buf.seek(0)
-            buf.truncate(0)
-            pygame.image.save(surface, buf, "frame.png")
-        with self._frame_lock:
-            self._frame = buf.getvalue()
-        self._frame_event.set()
-
-    def process_actions(self, state):
-        """Drain the action queue and apply actions to app state."""
+    @property
+    def frame_pending(self):
+        """True when an MJPEG client waits on a frame that needs a redraw."""
+        return self._encoder.frame_pending
+
+    def process_actions(self, state) -> bool:
+        """Drain the action queue and apply actions to app state.
+
+        Returns:
+            True if any action was processed (state may have changed).
+        """
+        processed = False
         while not self._action_queue.empty():
             try:
                 action_data = self._action_queue.get_nowait()
+                processed = True
                 handle_action(state, action_data)
             except queue.Empty:
                 break
             except Exception:
                 pass
+        return processed
 
     def _run_http(self):
         """Run the HTTP server."""
@@ -217,19 +267,29 @@ class WebCompanion:
             def do_GET(self):
                 if self.path == "/events":
                     self._handle_sse()
-                elif self.path == "/mjpeg":
+                elif self.path.split("?")[0] == "/mjpeg":
                     self._handle_mjpeg()
+                elif self.path.startswith("/api/list"):
+                    self._handle_list_page()
                 elif self.path.startswith("/api/logs"):
                     self._handle_logs()
                 elif self.path == "/api/files/config":
                     self._handle_file_config()
                 elif self.path.startswith("/api/files/download"):
                     self._handle_file_download()
+                elif self.path.startswith("/api/files/zip"):
+                    self._handle_file_zip()
                 elif self.path.startswith("/api/files"):
                     self._handle_file_list()
                 else:
                     self._handle_page()
 
+            def do_HEAD(self):
+                if self.path.startswith("/api/files/download"):
+                    self._handle_file_download(head=True)
+                else:
+                    self.send_error(404)
+
             def do_POST(self):
                 if self.path == "/action":
                     self._handle_action()
@@ -271,28 +331,9 @@ class WebCompanion:
                 self.send_header("Connection", "keep-alive")
                 self.send_header("Access-Control-Allow-Origin", "*")
                 self.end_headers()
-
-                last_json = None
-                try:
-                    while companion._running:
-                        companion._state_event.wait(timeout=1.0)
-                        companion._state_event.clear()
-
-                        with companion._state_lock:
-                            current_json = companion._state_json
-
-                        if current_json != last_json:
-                            last_json = current_json
-                            msg = f"data: {current_json}\n\n"
-                            self.wfile.write(msg.encode("utf-8"))
-                            self.wfile.flush()
-
-                        time.sleep(0.1)  # Throttle to ~10/sec
-                except (BrokenPipeError, ConnectionResetError, OSError):
-                    pass
+                self._hand_off(StateSubscriber(companion._stream))
 
             def _handle_mjpeg(self):
-                boundary = b"--frame"
                 self.send_response(200)
                 self.send_header(
                     "Content-Type",
@@ -301,30 +342,15 @@ class WebCompanion:
                 self.send_header("Cache-Control", "no-cache, no-store")
                 self.send_header("Connection", "keep-alive")
                 self.end_headers()
+                self._hand_off(MJPEGSubscriber(companion._encoder))
 
-                try:
-                    while companion._running:
-                        companion._frame_event.wait(timeout=1.0)
-                        companion._frame_event.clear()
-
-                        with companion._frame_lock:
-                            frame = companion._frame
-
-                        if frame:
-                            self.wfile.write(
-                                boundary + b"\r\n"
-                                b"Content-Type: image/jpeg\r\n"
-                                b"Content-Length: "
-                                + str(len(frame)).encode()
-                                + b"\r\n\r\n"
-                                + frame
-                                + b"\r\n"
-                            )
-                            self.wfile.flush()
-
-                        time.sleep(1.0 / 15)  # ~15 FPS
-                except (BrokenPipeError, ConnectionResetError, OSError):
-                    pass
+            def _hand_off(self, subscriber):
+                """Pass the connection to the stream hub and free this thread."""
+                self.close_connection = True
+                if not companion._running:
+                    subscriber.close()
+                    return
+                companion._hub.attach(self.connection, subscriber)
 
             def _handle_action(self):
                 length = int(self.headers.get("Content-Length", 0))
@@ -343,6 +369,26 @@ class WebCompanion:
                 except (json.JSONDecodeError, KeyError):
                     pass
 
+            def _handle_list_page(self):
+                """GET /api/list?id=...&offset=...&limit=...&q=...&sort=..."""
+                try:
+                    offset = int(self._parse_query_param("offset") or 0)
+                    limit = int(self._parse_query_param("limit") or 100)
+                except ValueError:
+                    self._send_error_json("Invalid offset or limit")
+                    return
+                page = companion._pager.page(
+                    self._parse_query_param("id") or "",
+                    offset,
+                    limit,
+                    self._parse_query_param("q") or "",
+                    self._parse_query_param("sort") or "",
+                )
+                if page is None:
+                    self._send_error_json("List changed", 409)
+                    return
+                self._send_json(page)
+
             # ---- File Manager API handlers ----
 
             def _parse_query_param(self, param):
@@ -381,57 +427,63 @@ class WebCompanion:
                 self._send_json({"roms_dir": roms_dir})
 
             def _handle_file_list(self):
-                """GET /api/files?path=... - List directory contents."""
+                """
+                GET /api/files?path=...&offset=...&limit=...&q=...&sort=...
+
+                Lists a directory from the listing cache. Without a limit
+                every entry is returned. The ETag covers the response
+                body, so unchanged pages answer If-None-Match with 304.
+                """
                 path = self._parse_query_param("path") or "/"
                 resolved = self._safe_path(path)
                 if not resolved or not os.path.isdir(resolved):
                     self._send_error_json("Directory not found: " + (path or ""), 404)
                     return
+                try:
+                    offset = int(self._parse_query_param("offset") or 0)
+                    limit = self._parse_query_param("limit")
+                    limit = int(limit) if limit else None
+                except ValueError:
+                    self._send_error_json("Invalid offset or limit")
+                    return
 
-                entries = []
                 try:
-                    with os.scandir(resolved) as it:
-                        for entry in it:
-                            # Skip hidden files on Unix
-                            if entry.name.startswith("."):
-                                continue
-                            try:
-                                stat = entry.stat()
-                                entries.append(
-                                    {
-                                        "name": entry.name,
-                                        "is_dir": entry.is_dir(),
-                                        "size": (
-                                            stat.st_size if not entry.is_dir() else None
-                                        ),
-                                        "modified": stat.st_mtime,
-                                    }
-                                )
-                            except OSError:
-                                entries.append(
-                                    {
-                                        "name": entry.name,
-                                        "is_dir": entry.is_dir(),
-                                        "size": None,
-                                        "modified": None,
-                                    }
-                                )
+                    page = companion._dirs.page(
+                        resolved,
+                        offset,
+                        limit,
+                        self._parse_query_param("q") or "",
+                        self._parse_query_param("sort") or "name",
+                    )
                 except PermissionError:
                     self._send_error_json("Permission denied", 403)
                     return
+                except OSError:
+                    self._send_error_json("Directory not found: " + path, 404)
+                    return
 
-                # Sort: folders first, then alphabetical
-                entries.sort(
-                    key=lambda e: (
-                        0 if e["is_dir"] else 1,
-                        e["name"].lower(),
-                    )
-                )
+                body = json.dumps(page, default=str).encode("utf-8")
+                etag = '"%s"' % hashlib.sha1(body).hexdigest()[:20]
+                not_modified = etag_matches(self.headers.get("If-None-Match"), etag)
+                if not_modified:
+                    self.send_response(304)
+                else:
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Access-Control-Allow-Origin", "*")
+                self.end_headers()
+                if not not_modified:
+                    self.wfile.write(body)
 
-                self._send_json({"path": resolved, "entries": entries})
+            def _handle_file_download(self, head=False):
+                """GET/HEAD /api/files/download?path=... - Download a file.
 
-            def _handle_file_download(self):
-                """GET /api/files/download?path=... - Download a file."""
+                Supports single-range requests (206) with If-Range for
+                resuming, and conditional requests through ETag.
+                """
                 path = self._parse_query_param("path")
                 resolved = self._safe_path(path)
                 if not resolved or not os.path.isfile(resolved):
@@ -439,25 +491,88 @@ class WebCompanion:
                     return
 
                 try:
-                    file_size = os.path.getsize(resolved)
-                    filename = os.path.basename(resolved)
-                    self.send_response(200)
+                    f = open(resolved, "rb")
+                except OSError:
+                    self._send_error_json("File not found", 404)
+                    return
+
+                with f:
+                    st = os.fstat(f.fileno())
+                    size = st.st_size
+                    etag, last_modified = file_validators(st)
+
+                    if etag_matches(self.headers.get("If-None-Match"), etag):
+                        self.send_response(304)
+                        self.send_header("ETag", etag)
+                        self.send_header("Access-Control-Allow-Origin", "*")
+                        self.end_headers()
+                        return
+
+                    byte_range = None
+                    if if_range_matches(
+                        self.headers.get("If-Range"), etag, last_modified
+                    ):
+                        try:
+                            byte_range = parse_range(self.headers.get("Range"), size)
+                        except RangeNotSatisfiable:
+                            self.send_response(416)
+                            self.send_header("Content-Range", f"bytes */{size}")
+                            self.send_header("Content-Length", "0")
+                            self.send_header("Access-Control-Allow-Origin", "*")
+                            self.end_headers()
+                            return
+
+                    start, end = byte_range or (0, size - 1)
+                    length = end - start + 1 if size else 0
+                    self.send_response(206 if byte_range else 200)
                     self.send_header("Content-Type", "application/octet-stream")
-                    self.send_header("Content-Length", str(file_size))
+                    self.send_header("Content-Length", str(length))
+                    if byte_range:
+                        self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+                    self.send_header("Accept-Ranges", "bytes")
+                    self.send_header("ETag", etag)
+                    self.send_header("Last-Modified", last_modified)
                     self.send_header(
                         "Content-Disposition",
-                        f'attachment; filename="{filename}"',
+                        content_disposition(os.path.basename(resolved)),
                     )
                     self.send_header("Access-Control-Allow-Origin", "*")
                     self.end_headers()
+                    if head:
+                        return
+
+                    try:
+                        send_file(self.connection, f, start, length)
+                    except OSError:
+                        # Client went away mid-download
+                        self.close_connection = True
+
+            def _handle_file_zip(self):
+                """GET /api/files/zip?path=... - Download a folder as a ZIP.
 
-                    with open(resolved, "rb") as f:
-                        while True:
-                            chunk = f.read(65536)
-                            if not chunk:
-                                break
-                            self.wfile.write(chunk)
-                except (OSError, BrokenPipeError) as e:
+                The archive is streamed as it is built, so its length is
+                unknown up front and the connection closes at the end.
+                """
+                path = self._parse_query_param("path")
+                resolved = self._safe_path(path)
+                if not resolved or not os.path.isdir(resolved):
+                    self._send_error_json("Directory not found", 404)
+                    return
+
+                name = os.path.basename(resolved.rstrip(os.sep)) or "files"
+                self.send_response(200)
+                self.send_header("Content-Type", "application/zip")
+                self.send_header(
+                    "Content-Disposition", content_disposition(name + ".zip")
+                )
+                self.send_header("Connection", "close")
+                self.send_header("Access-Control-Allow-Origin", "*")
+                self.end_headers()
+                self.close_connection = True
+                try:
+                    write_zip(self.connection, resolved)
+                except OSError:
+                    # Client went away mid-download
                     pass
 
             def _handle_file_upload(self):
@@ -473,63 +588,32 @@ class WebCompanion:
                     self._send_error_json("Expected multipart/form-data")
                     return
 
-                try:
-                    # Extract boundary from Content-Type
-                    boundary = None
-                    for part in content_type.split(";"):
-                        part = part.strip()
-                        if part.startswith("boundary="):
-                            boundary = part[9:].strip().strip('"')
-                            break
-                    if not boundary:
-                        self._send_error_json("No boundary in Content-Type")
-                        return
+                boundary = None
+                for part in content_type.split(";"):
+                    part = part.strip()
+                    if part.startswith("boundary="):
+                        boundary = part[9:].strip().strip('"')
+                        break
+                if not boundary:
+                    self._send_error_json("No boundary in Content-Type")
+                    return
 
+                try:
                     content_length = int(self.headers.get("Content-Length", 0))
-                    body = self.rfile.read(content_length)
-                    boundary_bytes = boundary.encode("utf-8")
-
-                    uploaded = []
-                    # Split by boundary
-                    parts = body.split(b"--" + boundary_bytes)
-                    for part in parts:
-                        if not part or part.strip() in (b"", b"--"):
-                            continue
-                        # Remove trailing --\r\n if this is the last part
-                        if part.startswith(b"--"):
-                            continue
-
-                        # Split headers from body (separated by \r\n\r\n)
-                        header_end = part.find(b"\r\n\r\n")
-                        if header_end < 0:
-                            continue
-                        header_data = part[:header_end].decode(
-                            "utf-8", errors="replace"
-                        )
-                        file_data = part[header_end + 4 :]
-                        # Strip trailing \r\n
-                        if file_data.endswith(b"\r\n"):
-                            file_data = file_data[:-2]
-
-                        # Parse Content-Disposition for filename
-                        filename = None
-                        for line in header_data.split("\r\n"):
-                            if line.lower().startswith("content-disposition:"):
-                                for token in line.split(";"):
-                                    token = token.strip()
-                                    if token.startswith("filename="):
-                                        filename = token[9:].strip('"')
-                                        break
-
-                        if filename:
-                            filename = os.path.basename(filename)
-                            dest_path = os.path.join(resolved_dir, filename)
-                            with open(dest_path, "wb") as f:
-                                f.write(file_data)
-                            uploaded.append(filename)
-
+                    uploaded = receive_files(
+                        self.rfile,
+                        content_length,
+                        boundary,
+                        resolved_dir,
+                        companion._uploads,
+                    )
                     self._send_json({"ok": True, "uploaded": uploaded})
+                except MultipartError as e:
+                    # Body was not fully read; don't reuse the connection
+                    self.close_connection = True
+                    self._send_error_json(str(e))
                 except Exception as e:
+                    self.close_connection = True
                     self._send_error_json(str(e), 500)
 
             def _handle_file_mkdir(self):
@@ -64,6 +64,15 @@ html, body {
     text-overflow: ellipsis;
     flex: 1;
 }
+.transfer-status {
+    font-size: 11px;
+    color: var(--text-dim);
+    margin: 0 8px;
+    max-width: 50%;
+    white-space: nowrap;
+    overflow: hidden;
+    text-overflow: ellipsis;
+}
 .status-dot {
     width: 10px; height: 10px;
     border-radius: 50%;
@@ -242,6 +251,26 @@ html, body {
     color: var(--secondary);
     font-size: 16px;
 }
+.paged-list {
+    position: relative;
+}
+.paged-list .list-item {
+    position: absolute;
+    left: 0;
+    right: 0;
+    height: 56px;
+}
+.paged-list .list-item.placeholder {
+    opacity: 0.4;
+}
+.paged-tools {
+    display: flex;
+    gap: 6px;
+    margin-bottom: 8px;
+}
+.paged-tools input {
+    flex: 1;
+}
 .list-item .item-thumb {
     width: 36px;
     height: 36px;
@@ -596,6 +625,24 @@ html, body {
     min-width: 0;
 }
 .fm-address-bar:focus { border-color: var(--primary); }
+.fm-filter, .fm-sort {
+    padding: 5px 8px;
+    font-family: inherit;
+    font-size: 13px;
+    background: var(--bg);
+    color: var(--text);
+    border: 1px solid var(--primary-dark);
+    border-radius: var(--radius);
+    outline: none;
+}
+.fm-filter { flex: 1; min-width: 80px; }
+.fm-filter:focus, .fm-sort:focus { border-color: var(--primary); }
+.fm-more {
+    padding: 12px;
+    text-align: center;
+    color: var(--text-disabled);
+    font-size: 12px;
+}
 
 /* FM Action bar */
 .fm-action-bar {
@@ -1016,6 +1063,7 @@ html, body {
 <div id="app">
     <div class="header">
         <h1 id="title">Console Utilities</h1>
+        <span class="transfer-status" id="transferStatus"></span>
         <div class="status-dot" id="statusDot"></div>
     </div>
     <div class="tab-bar" id="tabBar">
@@ -1051,6 +1099,15 @@ html, body {
         <div class="fm-action-bar">
             <button id="fmUploadBtn">Upload Files</button>
             <button id="fmNewFolderBtn">New Folder</button>
+            <input type="search" class="fm-filter" id="fmFilter" placeholder="Filter" spellcheck="false" autocomplete="off">
+            <select class="fm-sort" id="fmSort" title="Sort">
+                <option value="name">Name</option>
+                <option value="name_desc">Name (Z-A)</option>
+                <option value="size_desc">Largest</option>
+                <option value="size">Smallest</option>
+                <option value="modified_desc">Newest</option>
+                <option value="modified">Oldest</option>
+            </select>
             <div class="fm-upload-progress" id="fmUploadProgress">
                 <span id="fmUploadLabel">Uploading...</span>
                 <div class="fm-upload-bar">
@@ -1118,6 +1175,7 @@ html, body {
 const content = document.getElementById('content');
 const titleEl = document.getElementById('title');
 const statusDot = document.getElementById('statusDot');
+const transferStatus = document.getElementById('transferStatus');
 const thumbWrap = document.getElementById('thumbWrap');
 const thumbToggle = document.getElementById('thumbToggle');
 const thumbImg = document.getElementById('thumbImg');
@@ -1136,6 +1194,8 @@ thumbToggle.addEventListener('click', (e) => {
     thumbVisible = !thumbVisible;
     thumbWrap.classList.toggle('collapsed', !thumbVisible);
     thumbToggle.textContent = thumbVisible ? 'Hide' : 'Show';
+    // Close the MJPEG stream while hidden so the handheld stops encoding
+    thumbImg.src = thumbVisible ? '/mjpeg?' + Date.now() : '';
 });
 
 // Reload MJPEG stream
@@ -1163,9 +1223,10 @@ function connectSSE() {
 
     evtSource.onmessage = (e) => {
         try {
-            const state = JSON.parse(e.data);
-            currentState = state;
-            renderState(state);
+            const msg = JSON.parse(e.data);
+            currentState = applyStateMessage(currentState, msg);
+            renderTransfers(currentState.uploads);
+            renderState(currentState);
         } catch(err) {}
     };
 
@@ -1180,6 +1241,36 @@ function connectSSE() {
     };
 }
 
+// Apply a full snapshot or a delta (changed fields + item patches)
+function applyStateMessage(state, msg) {
+    if (msg.full || !state) return msg.state || {};
+    const next = Object.assign({}, state, msg.set || {});
+    (msg.unset || []).forEach(key => { delete next[key]; });
+    if (msg.items) {
+        const items = Array.isArray(state.items) ? state.items.slice(0, msg.items.length) : [];
+        while (items.length < msg.items.length) items.push({name: ''});
+        msg.items.patches.forEach(([start, values]) => {
+            values.forEach((item, i) => { items[start + i] = item; });
+        });
+        next.items = items;
+    }
+    return next;
+}
+
+// Uploads in progress from any client, reported in the state stream
+function renderTransfers(uploads) {
+    if (!uploads || uploads.length === 0) {
+        transferStatus.textContent = '';
+        return;
+    }
+    const received = uploads.reduce((sum, u) => sum + u.received, 0);
+    const total = uploads.reduce((sum, u) => sum + u.total, 0);
+    const pct = total ? Math.round((received / total) * 100) : 0;
+    transferStatus.textContent = uploads.length === 1
+        ? `Uploading ${uploads[0].name} ${pct}%`
+        : `${uploads.length} uploads ${pct}%`;
+}
+
 function sendAction(obj) {
     fetch('/action', {
         method: 'POST',
@@ -1278,6 +1369,10 @@ function renderTextInput(state) {
 }
 
 function renderList(state) {
+    if (state.list) {
+        renderPagedList(state);
+        return;
+    }
     const items = state.items || [];
 
     // --- Incremental update: if the list DOM already exists with same item count, just patch classes/status ---
@@ -1315,6 +1410,20 @@ function renderList(state) {
                 if (wasSelected !== isSelected) {
                     el.classList.toggle('selected', isSelected);
                 }
+                // Update name if the item was patched in by a later delta
+                const nameEl = el.querySelector('.item-name');
+                if (nameEl && nameEl.textContent !== (item.name || '')) {
+                    nameEl.textContent = item.name || '';
+                }
+                const thumbEl = el.querySelector('.item-thumb');
+                if (item.thumb_url && (!thumbEl || thumbEl.getAttribute('src') !== item.thumb_url)) {
+                    if (thumbEl) {
+                        thumbEl.style.display = '';
+                        thumbEl.src = item.thumb_url;
+                    } else {
+                        el.insertAdjacentHTML('afterbegin', `<img class="item-thumb" src="${escAttr(item.thumb_url)}" loading="lazy" onerror="this.style.display='none'">`);
+                    }
+                }
                 // Update value text if present
                 const valueEl = el.querySelector('.item-value');
                 if (valueEl && item.value) {
@@ -1359,17 +1468,7 @@ function renderList(state) {
 
     // Game actions bar (download selected, search, details, download all)
     if (state.game_actions) {
-        html += `<div style="display:flex;gap:6px;margin-bottom:8px;flex-wrap:wrap;align-items:center">`;
-        html += `<button class="btn" style="flex:0 0 auto;padding:8px 12px;font-size:13px" onclick="sendAction({action:'search',text:''})">Search</button>`;
-        html += `<button class="btn" style="flex:0 0 auto;padding:8px 12px;font-size:13px" onclick="sendAction({action:'detail'})">Details</button>`;
-        if (state.selected_count > 0) {
-            html += `<span class="game-sel-count" style="font-size:13px;color:var(--text-dim)">${state.selected_count} selected</span>`;
-            html += `<button class="btn primary" style="flex:0 0 auto;padding:8px 12px;font-size:13px" onclick="sendAction({action:'download_selected'})">Download</button>`;
-        }
-        if (state.show_download_all) {
-            html += `<button class="btn" style="flex:0 0 auto;padding:8px 12px;font-size:13px;margin-left:auto" onclick="sendAction({action:'download_all'})">Download All</button>`;
-        }
-        html += `</div>`;
+        html += gameActionsHtml(state);
     }
 
     html += '<div class="list-items">';
@@ -1470,6 +1569,176 @@ function renderList(state) {
     }
 }
 
+// Game actions bar (download selected, search, details, download all)
+function gameActionsHtml(state) {
+    let html = '';
+    html += `<div style="display:flex;gap:6px;margin-bottom:8px;flex-wrap:wrap;align-items:center">`;
+    html += `<button class="btn" style="flex:0 0 auto;padding:8px 12px;font-size:13px" onclick="sendAction({action:'search',text:''})">Search</button>`;
+    html += `<button class="btn" style="flex:0 0 auto;padding:8px 12px;font-size:13px" onclick="sendAction({action:'detail'})">Details</button>`;
+    if (state.selected_count > 0) {
+        html += `<span class="game-sel-count" style="font-size:13px;color:var(--text-dim)">${state.selected_count} selected</span>`;
+        html += `<button class="btn primary" style="flex:0 0 auto;padding:8px 12px;font-size:13px" onclick="sendAction({action:'download_selected'})">Download</button>`;
+    }
+    if (state.show_download_all) {
+        html += `<button class="btn" style="flex:0 0 auto;padding:8px 12px;font-size:13px;margin-left:auto" onclick="sendAction({action:'download_all'})">Download All</button>`;
+    }
+    html += `</div>`;
+    return html;
+}
+
+// ---- Paged list (large lists fetched in pages from /api/list) ----
+
+const PAGE_SIZE = 100;
+const ROW_HEIGHT = 58;
+let paged = null;
+
+function renderPagedList(state) {
+    let list = content.querySelector('.paged-list');
+    if (!list || !paged || paged.id !== state.list.id) {
+        buildPagedShell(state);
+        list = content.querySelector('.paged-list');
+    }
+    content.querySelector('.paged-actions').innerHTML = gameActionsHtml(state);
+    paged.selected = new Set(state.selected_indices || []);
+    const moved = paged.highlighted !== state.highlighted;
+    paged.highlighted = state.highlighted;
+    paged.version++;
+    // Follow the handheld's highlight while rows are in list order
+    if (moved && !paged.query && !paged.sort) {
+        const listTop = list.getBoundingClientRect().top - content.getBoundingClientRect().top + content.scrollTop;
+        const y = listTop + state.highlighted * ROW_HEIGHT;
+        if (y < content.scrollTop) {
+            content.scrollTop = y;
+        } else if (y + ROW_HEIGHT > content.scrollTop + content.clientHeight) {
+            content.scrollTop = y + ROW_HEIGHT - content.clientHeight;
+        }
+    }
+    drawPagedRows();
+}
+
+function buildPagedShell(state) {
+    // Keep loaded pages when coming back to the same list (e.g. after a modal)
+    if (!paged || paged.id !== state.list.id) {
+        paged = {id: state.list.id, length: state.list.length, query: '', sort: '',
+                 total: state.list.length, pages: {}, selected: new Set(),
+                 highlighted: null, version: 0, drawn: ''};
+    }
+    paged.drawn = '';
+    let html = '';
+    if (state.search !== undefined && state.search !== null) {
+        html += `<div class="search-bar">
+            <input type="text" id="searchInput" value="${escAttr(state.search)}"
+                   placeholder="Search..." autocomplete="off" data-search-type="search">
+            <button class="btn" onclick="doSearch()">Go</button>
+        </div>`;
+    }
+    html += '<div class="paged-actions"></div>';
+    html += `<div class="paged-tools">
+        <input type="text" id="pagedFilter" value="${escAttr(paged.query)}"
+               placeholder="Filter this list..." autocomplete="off">
+        <select id="pagedSort">
+            <option value="">List order</option>
+            <option value="name">A-Z</option>
+            <option value="name_desc">Z-A</option>
+        </select>
+    </div>`;
+    html += '<div class="paged-list"></div>';
+    content.innerHTML = html;
+    content.dataset.wizardAction = '';
+
+    const searchInp = document.getElementById('searchInput');
+    if (searchInp) {
+        searchInp.addEventListener('keydown', (e) => {
+            if (e.key === 'Enter') {
+                e.preventDefault();
+                doSearch();
+            }
+        });
+    }
+    const filterInp = document.getElementById('pagedFilter');
+    const sortSel = document.getElementById('pagedSort');
+    sortSel.value = paged.sort;
+    let filterTimer = null;
+    const refilter = () => {
+        paged = Object.assign({}, paged, {query: filterInp.value.trim(), sort: sortSel.value,
+                                          pages: {}, drawn: '', version: paged.version + 1});
+        paged.total = (paged.query || paged.sort) ? null : paged.length;
+        content.scrollTop = 0;
+        drawPagedRows();
+    };
+    filterInp.addEventListener('input', () => {
+        clearTimeout(filterTimer);
+        filterTimer = setTimeout(refilter, 250);
+    });
+    sortSel.addEventListener('change', refilter);
+}
+
+function fetchPage(page) {
+    const p = paged;
+    p.pages[page] = null;  // in flight
+    const params = new URLSearchParams({id: p.id, offset: page * PAGE_SIZE, limit: PAGE_SIZE,
+                                        q: p.query, sort: p.sort});
+    fetch('/api/list?' + params)
+        .then(r => r.ok ? r.json() : null)
+        .then(data => {
+            // A 409 means the list changed; the next state message has its new id
+            if (!data || data.id !== p.id) return;
+            p.total = data.total;
+            p.pages[page] = data.items;
+            p.version++;
+            if (paged === p) drawPagedRows();
+        })
+        .catch(() => { delete p.pages[page]; });
+}
+
+function drawPagedRows() {
+    const list = content.querySelector('.paged-list');
+    if (!list || !paged) return;
+    if (paged.total === null) {
+        // Filtered total is unknown until the first page arrives
+        if (paged.pages[0] === undefined) fetchPage(0);
+        list.style.height = '0px';
+        list.innerHTML = '';
+        return;
+    }
+    list.style.height = (paged.total * ROW_HEIGHT) + 'px';
+    const top = content.getBoundingClientRect().top - list.getBoundingClientRect().top;
+    const first = Math.max(0, Math.floor(top / ROW_HEIGHT) - 10);
+    const last = Math.min(paged.total, Math.ceil((top + content.clientHeight) / ROW_HEIGHT) + 10);
+    const drawn = first + ':' + last + ':' + paged.version;
+    if (drawn === paged.drawn) return;
+    paged.drawn = drawn;
+
+    let html = '';
+    for (let i = first; i < last; i++) {
+        const page = Math.floor(i / PAGE_SIZE);
+        if (paged.pages[page] === undefined) fetchPage(page);
+        const rows = paged.pages[page];
+        const row = rows && rows[i - page * PAGE_SIZE];
+        const style = `top:${i * ROW_HEIGHT}px`;
+        if (!row) {
+            html += `<div class="list-item placeholder" style="${style}"></div>`;
+            continue;
+        }
+        const cls = [];
+        if (row.index === paged.highlighted) cls.push('highlighted');
+        if (paged.selected.has(row.index)) cls.push('selected');
+        let thumb = '';
+        if (row.thumb_url) {
+            thumb = `<img class="item-thumb" src="${escAttr(row.thumb_url)}" loading="lazy" onerror="this.style.display='none'">`;
+        }
+        html += `<div class="list-item ${cls.join(' ')}" style="${style}" onclick="sendAction({action:'select_index',index:${row.index}})">
+            ${thumb}
+            <span class="item-name">${escHtml(row.name)}</span>
+        </div>`;
+    }
+    list.innerHTML = html;
+}
+
+content.addEventListener('scroll', () => {
+    if (paged && content.querySelector('.paged-list')) drawPagedRows();
+}, {passive: true});
+
 function doSearch() {
     const inp = document.getElementById('searchInput');
     if (!inp) return;
@@ -1743,6 +2012,14 @@ const fm = {
     selected: new Set(), // indices
     loaded: false,
     loading: false,
+    // Rows are fetched a page at a time as the listing is scrolled
+    pageSize: 200,
+    total: 0,
+    query: '',
+    sort: 'name',
+    etag: null,
+    listToken: 0,
+    fetchingMore: false,
     history: [],
     contextTarget: null,
 
@@ -1753,6 +2030,8 @@ const fm = {
     backBtn: document.getElementById('fmBackBtn'),
     goBtn: document.getElementById('fmGoBtn'),
     viewToggle: document.getElementById('fmViewToggle'),
+    filterInput: document.getElementById('fmFilter'),
+    sortSelect: document.getElementById('fmSort'),
     uploadBtn: document.getElementById('fmUploadBtn'),
     newFolderBtn: document.getElementById('fmNewFolderBtn'),
     uploadProgress: document.getElementById('fmUploadProgress'),
@@ -1784,37 +2063,105 @@ const fm = {
         this.navigate(this.currentPath);
     },
 
-    // Navigate to a path
+    // Build a listing URL for the current filter and sort
+    listUrl(path, offset, limit) {
+        let url = '/api/files?path=' + encodeURIComponent(path) +
+            '&offset=' + offset + '&limit=' + limit;
+        if (this.query) url += '&q=' + encodeURIComponent(this.query);
+        if (this.sort !== 'name') url += '&sort=' + encodeURIComponent(this.sort);
+        return url;
+    },
+
+    // Navigate to a path; reloading the current one keeps the view if unchanged
     async navigate(path) {
         path = path || '/';
         // Normalize
         if (!path.startsWith('/')) path = '/' + path;
         if (path !== '/' && path.endsWith('/')) path = path.slice(0, -1);
 
+        if (path !== this.currentPath && this.query) {
+            // A filter applies to the folder it was typed in
+            this.query = '';
+            this.filterInput.value = '';
+        }
+        const token = ++this.listToken;
+        // The ETag is kept only while the first page holds every loaded row
+        const reload = this.loaded && path === this.currentPath && this.etag !== null;
+        const headers = reload ? { 'If-None-Match': this.etag } : {};
         this.loading = true;
-        this.selected.clear();
-        this.updateSelBar();
-        this.renderLoading();
+        this.fetchingMore = false;
+        if (!reload) {
+            this.selected.clear();
+            this.updateSelBar();
+            this.renderLoading();
+        }
 
         try {
-            const resp = await fetch('/api/files?path=' + encodeURIComponent(path));
+            const resp = await fetch(this.listUrl(path, 0, this.pageSize), { headers });
+            if (token !== this.listToken) return;
+            if (resp.status === 304) {
+                this.loading = false;
+                return;
+            }
             if (!resp.ok) {
                 const err = await resp.text();
                 throw new Error(err || resp.statusText);
             }
             const data = await resp.json();
+            if (token !== this.listToken) return;
             this.entries = data.entries || [];
+            this.total = data.total || 0;
+            this.etag = resp.headers.get('ETag');
+            this.selected.clear();
+            this.updateSelBar();
             this.currentPath = data.path || path;
             this.addressBar.value = this.currentPath;
             this.loaded = true;
             this.loading = false;
             this.render();
         } catch(err) {
+            if (token !== this.listToken) return;
             this.loading = false;
+            this.etag = null;
             this.renderError(err.message || 'Failed to load directory');
         }
     },
 
+    // Fetch the next page once the listing is scrolled near its end
+    async loadMore() {
+        if (this.loading || this.fetchingMore || this.entries.length >= this.total) return;
+        const main = this.mainEl;
+        if (main.scrollTop + main.clientHeight < main.scrollHeight - main.clientHeight) return;
+
+        const token = this.listToken;
+        const offset = this.entries.length;
+        this.fetchingMore = true;
+        try {
+            const resp = await fetch(this.listUrl(this.currentPath, offset, this.pageSize));
+            if (!resp.ok) throw new Error(resp.statusText);
+            const data = await resp.json();
+            if (token !== this.listToken || offset !== this.entries.length) return;
+            const more = data.entries || [];
+            this.entries = this.entries.concat(more);
+            this.total = data.total || 0;
+            // The ETag of the first page no longer covers every row
+            this.etag = null;
+            this.appendRows(offset);
+        } catch(err) {
+            return;
+        } finally {
+            if (token === this.listToken) this.fetchingMore = false;
+        }
+        this.loadMore();
+    },
+
+    // Re-list the current folder with a new filter or sort order
+    relist() {
+        this.etag = null;
+        this.mainEl.scrollTop = 0;
+        this.navigate(this.currentPath);
+    },
+
     // Go to parent directory
     goUp() {
         if (this.currentPath === '/') return;
@@ -1920,45 +2267,83 @@ const fm = {
         return this.currentPath + '/' + entry.name;
     },
 
+    gridItem(entry, i) {
+        const sel = this.selected.has(i) ? ' selected' : '';
+        return `<div class="fm-grid-item${sel}" data-index="${i}">
+            <div class="fm-checkbox">${this.selected.has(i) ? '&#10003;' : ''}</div>
+            <span class="fm-icon">${this.getIcon(entry)}</span>
+            <span class="fm-name">${escHtml(entry.name)}</span>
+        </div>`;
+    },
+
+    listItem(entry, i) {
+        const sel = this.selected.has(i) ? ' selected' : '';
+        return `<div class="fm-list-item${sel}" data-index="${i}">
+            <div class="fm-checkbox">${this.selected.has(i) ? '&#10003;' : ''}</div>
+            <span class="fm-icon">${this.getIcon(entry)}</span>
+            <span class="fm-name">${escHtml(entry.name)}</span>
+            <span class="fm-size">${entry.is_dir ? '' : this.formatSize(entry.size)}</span>
+            <span class="fm-modified">${this.formatDate(entry.modified)}</span>
+        </div>`;
+    },
+
+    // "Showing n of total" footer while rows remain to be fetched
+    moreHtml() {
+        if (this.entries.length >= this.total) return '';
+        return '<div class="fm-more" id="fmMore">Showing ' + this.entries.length +
+            ' of ' + this.total + '</div>';
+    },
+
+    emptyHtml() {
+        const msg = this.query ? 'No matching files' : 'This folder is empty';
+        return '<div class="fm-empty">' + msg + '</div>';
+    },
+
     // Render grid view
     renderGrid() {
         if (this.entries.length === 0) {
-            this.contentEl.innerHTML = '<div class="fm-empty">This folder is empty</div>';
+            this.contentEl.innerHTML = this.emptyHtml();
             return;
         }
         let html = '<div class="fm-grid">';
         this.entries.forEach((entry, i) => {
-            const sel = this.selected.has(i) ? ' selected' : '';
-            html += `<div class="fm-grid-item${sel}" data-index="${i}">
-                <div class="fm-checkbox">${this.selected.has(i) ? '&#10003;' : ''}</div>
-                <span class="fm-icon">${this.getIcon(entry)}</span>
-                <span class="fm-name">${escHtml(entry.name)}</span>
-            </div>`;
+            html += this.gridItem(entry, i);
         });
         html += '</div>';
-        this.contentEl.innerHTML = html;
+        this.contentEl.innerHTML = html + this.moreHtml();
     },
 
     // Render list view
     renderList() {
         if (this.entries.length === 0) {
-            this.contentEl.innerHTML = '<div class="fm-empty">This folder is empty</div>';
+            this.contentEl.innerHTML = this.emptyHtml();
             return;
         }
         let html = '<div class="fm-list-header"><span>Name</span><span>Size</span><span>Modified</span></div>';
         html += '<div class="fm-list">';
         this.entries.forEach((entry, i) => {
-            const sel = this.selected.has(i) ? ' selected' : '';
-            html += `<div class="fm-list-item${sel}" data-index="${i}">
-                <div class="fm-checkbox">${this.selected.has(i) ? '&#10003;' : ''}</div>
-                <span class="fm-icon">${this.getIcon(entry)}</span>
-                <span class="fm-name">${escHtml(entry.name)}</span>
-                <span class="fm-size">${entry.is_dir ? '' : this.formatSize(entry.size)}</span>
-                <span class="fm-modified">${this.formatDate(entry.modified)}</span>
-            </div>`;
+            html += this.listItem(entry, i);
         });
         html += '</div>';
-        this.contentEl.innerHTML = html;
+        this.contentEl.innerHTML = html + this.moreHtml();
+    },
+
+    // Add rows fetched by loadMore without rebuilding the existing ones
+    appendRows(start) {
+        const container = this.contentEl.querySelector('.fm-grid, .fm-list');
+        if (!container) {
+            this.render();
+            return;
+        }
+        const grid = this.viewMode === 'grid';
+        let html = '';
+        for (let i = start; i < this.entries.length; i++) {
+            html += grid ? this.gridItem(this.entries[i], i) : this.listItem(this.entries[i], i);
+        }
+        container.insertAdjacentHTML('beforeend', html);
+        const more = document.getElementById('fmMore');
+        if (more) more.remove();
+        this.contentEl.insertAdjacentHTML('beforeend', this.moreHtml());
     },
 
     render() {
@@ -1968,6 +2353,8 @@ const fm = {
             this.renderList();
         }
         this.viewToggle.textContent = this.viewMode === 'grid' ? 'List' : 'Grid';
+        // Keep fetching until the rows fill the view
+        this.loadMore();
     },
 
     renderLoading() {
@@ -2171,9 +2558,10 @@ const fm = {
             openBtn.style.display = 'none';
         }
 
-        // Show/hide download for files only
+        // Folders download as a streamed ZIP
         const dlBtn = menu.querySelector('[data-action="download"]');
-        dlBtn.style.display = (entry && !entry.is_dir) ? '' : 'none';
+        dlBtn.style.display = entry ? '' : 'none';
+        dlBtn.textContent = (entry && entry.is_dir) ? 'Download as ZIP' : 'Download';
 
         menu.classList.add('active');
 
@@ -2211,16 +2599,16 @@ const fm = {
             case 'open':
                 this.enter(idx);
                 break;
-            case 'download':
-                if (!entry.is_dir) {
-                    const a = document.createElement('a');
-                    a.href = '/api/files/download?path=' + encodeURIComponent(this.entryPath(entry));
-                    a.download = entry.name;
-                    document.body.appendChild(a);
-                    a.click();
-                    document.body.removeChild(a);
-                }
+            case 'download': {
+                const a = document.createElement('a');
+                const api = entry.is_dir ? '/api/files/zip' : '/api/files/download';
+                a.href = api + '?path=' + encodeURIComponent(this.entryPath(entry));
+                a.download = entry.is_dir ? entry.name + '.zip' : entry.name;
+                document.body.appendChild(a);
+                a.click();
+                document.body.removeChild(a);
                 break;
+            }
             case 'rename':
                 this.selected.clear();
                 this.selected.add(idx);
@@ -2251,6 +2639,21 @@ fm.addressBar.addEventListener('keydown', (e) => {
     }
 });
 
+// Filter and sort are applied by the server, a page at a time
+let fmFilterTimer = null;
+fm.filterInput.addEventListener('input', () => {
+    clearTimeout(fmFilterTimer);
+    fmFilterTimer = setTimeout(() => {
+        fm.query = fm.filterInput.value.trim();
+        fm.relist();
+    }, 250);
+});
+fm.sortSelect.addEventListener('change', () => {
+    fm.sort = fm.sortSelect.value;
+    fm.relist();
+});
+fm.mainEl.addEventListener('scroll', () => fm.loadMore(), { passive: true });
+
 // View toggle
 fm.viewToggle.addEventListener('click', () => {
     fm.viewMode = fm.viewMode === 'grid' ? 'list' : 'grid';
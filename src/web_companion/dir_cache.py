@@ -0,0 +1,205 @@
+"""
+Cached directory listings for the Web Companion file manager.
+
+Scanning a 20k-file ROM folder on a slow SD card takes seconds, so the
+names of each listed directory are cached, keyed by its path and
+validated by its inode and mtime on every request. File sizes and
+modification times are only stat'ed for the rows a client asks for (or
+for every entry once, when sorting by them) and re-stat'ed after a few
+seconds. Filtered and sorted orderings are kept per listing, like the
+game list pages of ``list_pager``.
+"""
+
+import collections
+import os
+import threading
+import time
+
+# Largest page a client may request
+MAX_PAGE_SIZE = 1000
+# Directories kept in the cache
+_MAX_DIRS = 16
+# Filtered/sorted orderings kept per directory
+_MAX_VIEWS = 8
+# Seconds before cached entry stats are refreshed
+_STAT_TTL = 5.0
+# FAT/exFAT SD cards store mtimes in 2 s steps: a directory scanned this
+# soon after its last change may change again without a new mtime
+_RACY_WINDOW = 2.0
+
+SORT_ORDERS = ("name", "name_desc", "size", "size_desc", "modified", "modified_desc")
+
+
+class _Listing:
+    """Names of one directory scan plus lazily gathered stats."""
+
+    def __init__(self, key, names, is_dir, trusted):
+        self.key = key
+        self.names = names
+        self.is_dir = is_dir
+        # Whether the directory mtime can be relied on to detect changes
+        self.trusted = trusted
+        self.lowered = [name.lower() for name in names]
+        self.stats = {}
+        self.stat_time = time.monotonic()
+        self.views = collections.OrderedDict()
+
+
+class DirectoryCache:
+    """Thread-safe LRU cache of directory listings."""
+
+    def __init__(self, max_dirs=_MAX_DIRS):
+        self._lock = threading.Lock()
+        self._dirs = collections.OrderedDict()
+        self._max_dirs = max_dirs
+
+    def page(self, path, offset=0, limit=None, query="", sort="name"):
+        """
+        Return a page of a directory listing.
+
+        Folders come first in every sort order. Hidden (dot) entries are
+        left out.
+
+        Args:
+            path: Directory to list
+            offset: First entry of the (filtered, sorted) listing
+            limit: Number of entries, capped at MAX_PAGE_SIZE; None for all
+            query: Case-insensitive words that must all occur in the name
+            sort: One of SORT_ORDERS
+
+        Returns:
+            Dict with path, count (all entries), total (after the filter),
+            offset and entries
+
+        Raises:
+            OSError: The directory cannot be read
+        """
+        listing = self._get_listing(path)
+        words = tuple(query.lower().split())
+        if sort not in SORT_ORDERS:
+            sort = "name"
+        key = (words, sort)
+        # Only references are taken under the lock; stat() calls on a slow
+        # card run outside it so other clients and folders aren't blocked
+        with self._lock:
+            if time.monotonic() - listing.stat_time > _STAT_TTL:
+                listing.stats = {}
+                listing.views = collections.OrderedDict(
+                    (key, order)
+                    for key, order in listing.views.items()
+                    if key[1].startswith("name")
+                )
+                listing.stat_time = time.monotonic()
+            stats = listing.stats
+            order = listing.views.get(key)
+            if order is not None:
+                listing.views.move_to_end(key)
+
+        if order is None:
+            order = self._build_order(listing, path, stats, words, sort)
+            with self._lock:
+                # Stat-based orders computed before a refresh are dropped
+                if sort.startswith("name") or listing.stats is stats:
+                    listing.views[key] = order
+                    if len(listing.views) > _MAX_VIEWS:
+                        listing.views.popitem(last=False)
+
+        offset = max(0, offset)
+        end = (
+            len(order) if limit is None else offset + min(max(0, limit), MAX_PAGE_SIZE)
+        )
+        rows = order[offset:end]
+        fresh = self._stat_missing(listing, path, stats, rows)
+        entries = []
+        for index in rows:
+            size, modified = fresh.get(index) or stats[index]
+            is_dir = listing.is_dir[index]
+            entries.append(
+                {
+                    "name": listing.names[index],
+                    "is_dir": is_dir,
+                    "size": None if is_dir else size,
+                    "modified": modified,
+                }
+            )
+        return {
+            "path": path,
+            "count": len(listing.names),
+            "total": len(order),
+            "offset": offset,
+            "entries": entries,
+        }
+
+    def _get_listing(self, path):
+        """Cached listing of ``path``, rescanned if the directory changed."""
+        st = os.stat(path)
+        key = (st.st_ino, st.st_mtime_ns)
+        with self._lock:
+            listing = self._dirs.get(path)
+            if listing is not None and listing.key == key and listing.trusted:
+                self._dirs.move_to_end(path)
+                return listing
+
+        names = []
+        is_dir = []
+        with os.scandir(path) as it:
+            for entry in it:
+                # Skip hidden files on Unix
+                if entry.name.startswith("."):
+                    continue
+                try:
+                    entry_is_dir = entry.is_dir()
+                except OSError:
+                    entry_is_dir = False
+                names.append(entry.name)
+                is_dir.append(entry_is_dir)
+        trusted = time.time() - st.st_mtime > _RACY_WINDOW
+        listing = _Listing(key, names, is_dir, trusted)
+
+        with self._lock:
+            self._dirs[path] = listing
+            self._dirs.move_to_end(path)
+            while len(self._dirs) > self._max_dirs:
+                self._dirs.popitem(last=False)
+        return listing
+
+    def _stat_missing(self, listing, path, stats, indices):
+        """
+        Stat the entries not yet in ``stats`` and publish the results.
+
+        Called without the lock held; returns the new (size, mtime) pairs.
+        """
+        fresh = {}
+        for index in indices:
+            if index in stats or index in fresh:
+                continue
+            try:
+                st = os.stat(os.path.join(path, listing.names[index]))
+                fresh[index] = (st.st_size, st.st_mtime)
+            except OSError:
+                fresh[index] = (None, None)
+        if fresh:
+            with self._lock:
+                stats.update(fresh)
+        return fresh
+
+    def _build_order(self, listing, path, stats, words, sort):
+        """Entry indices after filter and sort (called without the lock)."""
+        lowered = listing.lowered
+        order = [
+            i for i, name in enumerate(lowered) if all(word in name for word in words)
+        ]
+        field, _, direction = sort.partition("_")
+        if field == "name":
+            order.sort(key=lowered.__getitem__, reverse=bool(direction))
+        else:
+            column = 0 if field == "size" else 1
+            fresh = self._stat_missing(listing, path, stats, order)
+            order.sort(key=lowered.__getitem__)
+            order.sort(
+                key=lambda i: (fresh.get(i) or stats[i])[column] or 0,
+                reverse=bool(direction),
+            )
+        # Folders first, whatever the order
+        order.sort(key=lambda i: not listing.is_dir[i])
+        return order
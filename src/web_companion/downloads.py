@@ -0,0 +1,104 @@
+"""
+File download helpers for the Web Companion file manager.
+
+Validators (ETag/Last-Modified), single-range ``Range``/``If-Range``
+handling for resumable downloads, and zero-copy body transfer through
+``socket.sendfile`` (``os.sendfile`` where the platform has it).
+"""
+
+import email.utils
+import urllib.parse
+
+
+class RangeNotSatisfiable(Exception):
+    """Requested byte range lies outside the file."""
+
+
+def file_validators(st):
+    """
+    Return (etag, last_modified) header values for a file's stat result.
+
+    The ETag changes whenever the file is replaced, resized or modified.
+    """
+    etag = '"%x-%x-%x"' % (st.st_ino, st.st_size, st.st_mtime_ns)
+    last_modified = email.utils.formatdate(st.st_mtime, usegmt=True)
+    return etag, last_modified
+
+
+def parse_range(value, size):
+    """
+    Parse a ``Range`` header for a file of ``size`` bytes.
+
+    Only single ranges are honoured; multi-range and malformed headers
+    are ignored, which lets the caller send the whole file (RFC 9110).
+
+    Returns:
+        (start, end) inclusive byte offsets, or None to send everything
+
+    Raises:
+        RangeNotSatisfiable: The range starts beyond the end of the file
+    """
+    if not value:
+        return None
+    unit, _, spec = value.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, dash, last = spec.strip().partition("-")
+    if not dash:
+        return None
+    try:
+        if not first:
+            # Suffix range: the last N bytes
+            suffix = int(last)
+            if suffix <= 0 or size == 0:
+                raise RangeNotSatisfiable(value)
+            return max(0, size - suffix), size - 1
+        start = int(first)
+        end = int(last) if last else size - 1
+    except ValueError:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable(value)
+    if end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+def if_range_matches(value, etag, last_modified):
+    """True if an ``If-Range`` header allows serving a partial response."""
+    if not value:
+        return True
+    value = value.strip()
+    if value.startswith('"') or value.startswith("W/"):
+        # Weak validators never match for ranges
+        return value == etag
+    return value == last_modified
+
+
+def etag_matches(value, etag):
+    """True if an ``If-None-Match`` header matches ``etag``."""
+    if not value:
+        return False
+    if value.strip() == "*":
+        return True
+    tags = (tag.strip() for tag in value.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in tags)
+
+
+def content_disposition(filename):
+    """``Content-Disposition`` for an attachment, safe for non-ASCII names."""
+    fallback = filename.encode("ascii", "replace").decode("ascii")
+    fallback = fallback.replace("\\", "_").replace('"', "_")
+    quoted = urllib.parse.quote(filename, safe="")
+    return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quoted}"
+
+
+def send_file(sock, f, offset, count):
+    """
+    Send ``count`` bytes of ``f`` starting at ``offset`` to ``sock``.
+
+    Uses ``os.sendfile`` through ``socket.sendfile`` so the data never
+    enters Python; falls back to buffered sends where unsupported.
+    """
+    if count > 0:
+        sock.sendfile(f, offset, count)
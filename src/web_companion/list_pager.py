@@ -0,0 +1,111 @@
+"""
+Paged list access for Web Companion.
+
+SSE state only carries a list's identity and length; clients fetch the
+rows they are about to show from ``/api/list``. Pages are cut from the
+app's in-memory game list, with optional search and sort done here, and
+thumbnail URLs are only resolved for the rows of a requested page.
+"""
+
+import collections
+import threading
+
+from .state_serializer import _get_game_name, get_system_thumb_url
+
+# Largest page a client may request
+MAX_PAGE_SIZE = 500
+# Filtered/sorted orderings kept per list
+_MAX_VIEWS = 8
+
+SORT_ORDERS = ("", "name", "name_desc")
+
+
+class ListPager:
+    """Serves pages of the list currently shown on the handheld."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._source = None
+        # List id the cached names and views below were built for
+        self._cache_id = None
+        self._names = None
+        self._views = collections.OrderedDict()
+
+    def publish(self, source):
+        """
+        Set the list pages are served from.
+
+        Args:
+            source: (list_id, items, system) from get_list_source(), or None
+        """
+        with self._lock:
+            self._source = source
+
+    def page(self, list_id, offset=0, limit=100, query="", sort=""):
+        """
+        Return one page of the list.
+
+        Args:
+            list_id: Identity the client was given; stale ids get None
+            offset: First row of the (filtered, sorted) list to return
+            limit: Number of rows, capped at MAX_PAGE_SIZE
+            query: Case-insensitive words that must all occur in the name
+            sort: "" for list order, "name" or "name_desc"
+
+        Returns:
+            Dict with id, total, offset and items, or None if ``list_id``
+            no longer matches the list on screen
+        """
+        with self._lock:
+            source = self._source
+            if source is None or source[0] != list_id:
+                return None
+            order = self._get_order(list_id, source[1], query, sort)
+
+        _, items, system = source
+        offset = max(0, offset)
+        limit = min(max(0, limit), MAX_PAGE_SIZE)
+        rows = []
+        for index in order[offset : offset + limit]:
+            if index >= len(items):
+                break
+            game = items[index]
+            row = {"index": index, "name": _get_game_name(game)}
+            thumb = get_system_thumb_url(game, system)
+            if thumb:
+                row["thumb_url"] = thumb
+            rows.append(row)
+        return {"id": list_id, "total": len(order), "offset": offset, "items": rows}
+
+    def _get_order(self, list_id, items, query, sort):
+        """List indices after search and sort (caller holds the lock)."""
+        words = query.lower().split()
+        if sort not in SORT_ORDERS:
+            sort = ""
+        if not words and not sort:
+            return range(len(items))
+
+        if self._cache_id != list_id:
+            self._cache_id = list_id
+            self._names = None
+            self._views.clear()
+
+        key = (tuple(words), sort)
+        order = self._views.get(key)
+        if order is not None:
+            self._views.move_to_end(key)
+            return order
+
+        if self._names is None:
+            self._names = [_get_game_name(game).lower() for game in items]
+        names = self._names
+        order = [
+            i for i, name in enumerate(names) if all(word in name for word in words)
+        ]
+        if sort:
+            order.sort(key=names.__getitem__, reverse=sort == "name_desc")
+
+        self._views[key] = order
+        if len(self._views) > _MAX_VIEWS:
+            self._views.popitem(last=False)
+        return order
@@ -61,12 +61,19 @@ def _get_game_name(game):
 
 def _get_game_thumb_url(game, data, state):
     """Get the boxart/thumbnail URL for a game item."""
+    system = None
+    if data and state.selected_system < len(data):
+        system = data[state.selected_system]
+    return get_system_thumb_url(game, system)
+
+
+def get_system_thumb_url(game, system):
+    """Get the boxart/thumbnail URL for a game item of ``system``."""
     # Direct banner_url in the game dict
     if isinstance(game, dict) and game.get("banner_url"):
         return game["banner_url"]
     # Build from system boxarts base URL
-    if data and state.selected_system < len(data):
-        system = data[state.selected_system]
+    if system:
         boxart_base = system.get("boxarts", "")
         if boxart_base:
             if isinstance(game, dict):
@@ -78,6 +85,34 @@ def _get_game_thumb_url(game, data, state):
     return None
 
 
+def _get_games_list(state):
+    """The games list the games screen is showing (search results or all)."""
+    return state.search.filtered_list if state.search.mode else state.game_list
+
+
+def get_list_source(state, data=None):
+    """
+    Describe the in-memory list behind the current screen for paging.
+
+    Only the games screen is paged; its list can hold tens of thousands
+    of entries. Modals can cover the games screen, so only use this when
+    the serialized state carries a "list".
+
+    Returns:
+        (list_id, games, system) tuple, or None when no paged list is shown
+    """
+    if state.mode != "games":
+        return None
+    game_list = _get_games_list(state)
+    system = None
+    if data and state.selected_system < len(data):
+        system = data[state.selected_system]
+    # Advances whenever the list, system or search mode is replaced, so
+    # an id is never reused for a different list
+    list_id = "list-%d" % state.list_generation
+    return list_id, game_list, system
+
+
 def serialize_web_state(state, settings=None, data=None):
     """
     Serialize the current app state into a JSON-friendly dict.
@@ -593,18 +628,7 @@ def serialize_web_state(state, settings=None, data=None):
         }
 
     if state.mode == "games":
-        game_list = state.search.filtered_list if state.search.mode else state.game_list
-        items = []
-        for i, game in enumerate(game_list):
-            name = _get_game_name(game)
-            thumb = _get_game_thumb_url(game, data, state)
-            item = {
-                "name": name,
-                "selected": i in state.selected_games,
-            }
-            if thumb:
-                item["thumb_url"] = thumb
-            items.append(item)
+        list_id, game_list, _ = get_list_source(state, data)
         system_name = ""
         if data and state.selected_system < len(data):
             system_name = data[state.selected_system].get("name", "")
@@ -612,7 +636,9 @@ def serialize_web_state(state, settings=None, data=None):
         return {
             "screen_type": "list",
             "title": system_name or "Games",
-            "items": items,
+            # Items are fetched in pages from /api/list
+            "list": {"id": list_id, "length": len(game_list)},
+            "selected_indices": sorted(state.selected_games),
             "highlighted": state.highlighted,
             "search": state.search.query if state.search.mode else "",
             "game_actions": True,
@@ -0,0 +1,202 @@
+"""
+Versioned state stream for Web Companion.
+
+The app publishes serialized state dicts; each publish that differs from
+the previous one bumps the version. Every SSE client tracks what it has
+been sent: a full snapshot on connect, then compact deltas with only the
+changed top-level fields. List items are synced in windows: items around
+``highlighted`` go first, other changed items follow in bounded batches.
+A StateSubscriber wraps a ClientView as an SSE stream for StreamHub.
+"""
+
+import json
+import threading
+
+# Items on each side of the highlighted one sent with every delta
+ITEM_WINDOW = 40
+# Other changed items sent per message until the client catches up
+ITEM_BACKFILL = 200
+
+
+class StateStream:
+    """Latest serialized state and its version number."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = 0
+        self._state = {}
+
+    def publish(self, state_dict):
+        """
+        Store a new state dict.
+
+        Returns:
+            True if it differs from the current state (version bumped)
+        """
+        with self._lock:
+            if state_dict == self._state:
+                return False
+            self._state = state_dict
+            self._version += 1
+            return True
+
+    def current(self):
+        """Return (version, state dict). The dict must not be mutated."""
+        with self._lock:
+            return self._version, self._state
+
+
+def _window_bounds(length, highlighted):
+    """Index range [start, end) of the items around ``highlighted``."""
+    if not isinstance(highlighted, int):
+        highlighted = 0
+    center = min(max(highlighted, 0), max(length - 1, 0))
+    start = max(0, center - ITEM_WINDOW)
+    return start, min(length, center + ITEM_WINDOW + 1)
+
+
+def _changed_runs(old, new, start, end, limit=None):
+    """
+    Contiguous runs of indices in [start, end) where ``old`` and ``new``
+    differ, as [first, [items...]] pairs holding at most ``limit`` items.
+    """
+    runs = []
+    run = None
+    sent = 0
+    for i in range(start, end):
+        if i < len(old) and old[i] == new[i]:
+            run = None
+            continue
+        if limit is not None and sent >= limit:
+            break
+        if run is None:
+            run = [i, []]
+            runs.append(run)
+        run[1].append(new[i])
+        sent += 1
+    return runs
+
+
+class ClientView:
+    """What one SSE client has been sent so far."""
+
+    def __init__(self):
+        self.version = None
+        self._fields = {}
+        self._items = None
+        self._target_items = None
+
+    @property
+    def pending(self):
+        """True while list items outside the window still need syncing."""
+        return self._target_items is not None and self._items != self._target_items
+
+    def snapshot(self, version, state):
+        """Full state message, sent when the client connects."""
+        self.version = version
+        self._fields = state
+        items = state.get("items")
+        if isinstance(items, list):
+            self._items = list(items)
+            self._target_items = items
+        else:
+            self._items = self._target_items = None
+        return {"v": version, "full": True, "state": state}
+
+    def delta(self, version, state):
+        """
+        Delta message bringing the client to ``version``, or None if there
+        is nothing to send.
+        """
+        message = {"v": version}
+        changed = {}
+        removed = [key for key in self._fields if key not in state]
+        for key, value in state.items():
+            if key == "items" and isinstance(value, list):
+                continue
+            if key not in self._fields or self._fields[key] != value:
+                changed[key] = value
+
+        items = state.get("items")
+        if isinstance(items, list):
+            if self._items is None:
+                self._items = []
+            self._target_items = items
+            patch = self._sync_items(items, state.get("highlighted", 0))
+            if patch:
+                message["items"] = patch
+        else:
+            self._items = self._target_items = None
+
+        self.version = version
+        self._fields = state
+        if changed:
+            message["set"] = changed
+        if removed:
+            message["unset"] = removed
+        return message if len(message) > 1 else None
+
+    def _sync_items(self, items, highlighted):
+        """
+        Bring the client's item list towards ``items``: the window around
+        ``highlighted`` in full, plus up to ITEM_BACKFILL other changes.
+        """
+        view = self._items
+        length = len(items)
+        resized = len(view) != length
+        if len(view) > length:
+            del view[length:]
+
+        start, end = _window_bounds(length, highlighted)
+        runs = _changed_runs(view, items, start, end)
+        budget = ITEM_BACKFILL
+        for lo, hi in ((end, length), (0, start)):
+            if budget <= 0:
+                break
+            for run in _changed_runs(view, items, lo, hi, budget):
+                runs.append(run)
+                budget -= len(run[1])
+
+        for first, values in runs:
+            if first > len(view):
+                # Unsent gap; filled by a later backfill batch
+                view.extend([None] * (first - len(view)))
+            view[first : first + len(values)] = values
+
+        if not runs and not resized:
+            return None
+        return {"length": length, "patches": runs}
+
+
+class StateSubscriber:
+    """SSE subscriber with its own ClientView cursor over a StateStream."""
+
+    # Comment lines keep idle connections open through proxies
+    keepalive_interval = 15.0
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._view = ClientView()
+        self._started = False
+
+    def poll(self):
+        """Next SSE event bringing this client up to date, or None."""
+        version, state = self._stream.current()
+        view = self._view
+        if not self._started:
+            self._started = True
+            message = view.snapshot(version, state)
+        elif version != view.version or view.pending:
+            message = view.delta(version, state)
+        else:
+            return None
+        if not message:
+            return None
+        data = json.dumps(message, default=str, separators=(",", ":"))
+        return f"data: {data}\n\n".encode("utf-8")
+
+    def keepalive(self):
+        return b": keepalive\n\n"
+
+    def close(self):
+        pass
@@ -0,0 +1,246 @@
+"""
+Streaming multipart uploads for the Web Companion file manager.
+
+Request bodies are parsed incrementally with bounded buffers: each file
+part is written straight to a hidden temp file in the destination folder
+and renamed into place once complete, so uploading a multi-GB ISO never
+holds more than a chunk in memory. Active uploads are tracked for the
+SSE state so every connected client can show progress.
+"""
+
+import itertools
+import os
+import re
+import threading
+import uuid
+
+# Bytes read from the socket per step
+CHUNK_SIZE = 256 * 1024
+# Part headers larger than this are rejected
+MAX_HEADER_SIZE = 16 * 1024
+
+_FILENAME_RE = re.compile(r'filename="((?:[^"\\]|\\.)*)"|filename=([^;\s]+)')
+
+
+class MultipartError(ValueError):
+    """Malformed multipart/form-data body."""
+
+
+class UploadTracker:
+    """Thread-safe registry of uploads in progress."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._uploads = {}
+        self._ids = itertools.count(1)
+        self._changed = False
+
+    def start(self, total):
+        """Register an upload of ``total`` request bytes; returns its id."""
+        with self._lock:
+            upload_id = next(self._ids)
+            self._uploads[upload_id] = {"name": "", "received": 0, "total": total}
+            self._changed = True
+            return upload_id
+
+    def update(self, upload_id, name=None, received=None):
+        """Record the current file name and/or bytes received."""
+        with self._lock:
+            upload = self._uploads.get(upload_id)
+            if upload is None:
+                return
+            if name is not None:
+                upload["name"] = name
+            if received is not None:
+                upload["received"] = received
+            self._changed = True
+
+    def finish(self, upload_id):
+        """Drop a finished or failed upload."""
+        with self._lock:
+            if self._uploads.pop(upload_id, None) is not None:
+                self._changed = True
+
+    def consume_changed(self):
+        """Return whether uploads changed since the last call."""
+        with self._lock:
+            changed, self._changed = self._changed, False
+            return changed
+
+    def snapshot(self):
+        """List of active uploads as JSON-friendly dicts."""
+        with self._lock:
+            return [dict(upload) for upload in self._uploads.values()]
+
+
+class _BoundedReader:
+    """Reads at most ``length`` bytes of a request body, reporting progress."""
+
+    def __init__(self, stream, length, on_progress=None):
+        self._read = getattr(stream, "read1", stream.read)
+        self._remaining = length
+        self.received = 0
+        self._on_progress = on_progress
+
+    def read(self, size=CHUNK_SIZE):
+        if self._remaining <= 0:
+            return b""
+        data = self._read(min(size, self._remaining))
+        if not data:
+            raise MultipartError("Connection closed mid-upload")
+        self._remaining -= len(data)
+        self.received += len(data)
+        if self._on_progress:
+            self._on_progress(self.received)
+        return data
+
+
+def _parse_part_headers(raw):
+    """Parse part header lines into a lowercase-keyed dict."""
+    headers = {}
+    for line in raw.decode("utf-8", errors="replace").split("\r\n"):
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return headers
+
+
+def part_filename(headers):
+    """Base file name from a part's Content-Disposition, or None."""
+    match = _FILENAME_RE.search(headers.get("content-disposition", ""))
+    if not match:
+        return None
+    name = match.group(1) if match.group(1) is not None else match.group(2)
+    name = re.sub(r"\\(.)", r"\1", name)
+    # Browsers may send a client-side path; never let it escape dest_dir
+    name = os.path.basename(name.replace("\\", "/"))
+    return name if name not in ("", ".", "..") else None
+
+
+def iter_multipart(read, boundary):
+    """
+    Parse a multipart body incrementally.
+
+    Args:
+        read: Callable returning the next chunk of the body (b"" at the end)
+        boundary: Boundary string from the Content-Type header
+
+    Yields:
+        ("headers", dict) at the start of each part, ("data", bytes) for
+        its body in chunks, and ("end", None) when the part is complete
+    """
+    delimiter = b"\r\n--" + boundary.encode("utf-8")
+    # The first delimiter has no leading CRLF; prepend one to match it
+    buf = b"\r\n"
+
+    def fill():
+        nonlocal buf
+        chunk = read()
+        if not chunk:
+            raise MultipartError("Unexpected end of multipart body")
+        buf += chunk
+
+    # Skip the preamble up to the first delimiter
+    while True:
+        index = buf.find(delimiter)
+        if index >= 0:
+            buf = buf[index + len(delimiter) :]
+            break
+        buf = buf[-len(delimiter) :]
+        fill()
+
+    while True:
+        # After a delimiter: "--" ends the body, CRLF starts a part
+        while len(buf) < 2:
+            fill()
+        if buf.startswith(b"--"):
+            return
+        if not buf.startswith(b"\r\n"):
+            raise MultipartError("Malformed multipart delimiter")
+        buf = buf[2:]
+
+        while True:
+            index = buf.find(b"\r\n\r\n")
+            if index >= 0:
+                break
+            if len(buf) > MAX_HEADER_SIZE:
+                raise MultipartError("Multipart headers too large")
+            fill()
+        yield "headers", _parse_part_headers(buf[:index])
+        buf = buf[index + 4 :]
+
+        while True:
+            index = buf.find(delimiter)
+            if index >= 0:
+                if index:
+                    yield "data", buf[:index]
+                buf = buf[index + len(delimiter) :]
+                break
+            # Keep a tail that could hold the start of a split delimiter
+            keep = len(delimiter) - 1
+            if len(buf) > keep:
+                yield "data", buf[:-keep]
+                buf = buf[-keep:]
+            fill()
+        yield "end", None
+
+
+def receive_files(stream, length, boundary, dest_dir, tracker=None):
+    """
+    Stream the file parts of a multipart body into ``dest_dir``.
+
+    Each file is written to a hidden temp file next to its destination
+    and atomically renamed over it once its part is complete; on any
+    error the partial temp file is removed.
+
+    Args:
+        stream: Request body stream (the handler's rfile)
+        length: Content-Length of the body
+        boundary: Multipart boundary string
+        dest_dir: Existing directory to store files in
+        tracker: Optional UploadTracker to report progress to
+
+    Returns:
+        List of stored file names
+    """
+    upload_id = tracker.start(length) if tracker else None
+    on_progress = None
+    if tracker:
+
+        def on_progress(received):
+            tracker.update(upload_id, received=received)
+
+    reader = _BoundedReader(stream, length, on_progress)
+    uploaded = []
+    out = None
+    try:
+        for event, value in iter_multipart(reader.read, boundary):
+            if event == "headers":
+                filename = part_filename(value)
+                if filename:
+                    # Hidden from listings until renamed into place
+                    tmp_path = os.path.join(dest_dir, f".upload-{uuid.uuid4().hex}")
+                    out = open(tmp_path, "xb")
+                    if tracker:
+                        tracker.update(upload_id, name=filename)
+            elif event == "data":
+                if out:
+                    out.write(value)
+            elif out:
+                out.close()
+                out = None
+                os.replace(tmp_path, os.path.join(dest_dir, filename))
+                uploaded.append(filename)
+        # Discard the epilogue so the connection can be reused
+        while reader.read():
+            pass
+        return uploaded
+    finally:
+        if out:
+            out.close()
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        if tracker:
+            tracker.finish(upload_id)
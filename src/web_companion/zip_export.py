@@ -0,0 +1,134 @@
+"""
+Streaming ZIP export of folders for the Web Companion file manager.
+
+The archive is written straight to the HTTP response as it is built: no
+temp files, constant memory apart from the central directory entries,
+and ZIP64 records wherever sizes, offsets or entry counts need them.
+Already-compressed and very large files are stored; everything else
+(saves, configs, small cartridge ROMs) is deflated.
+"""
+
+import io
+import os
+import shutil
+import stat
+import zipfile
+
+# Bytes per read from source files and per write to the socket
+CHUNK_SIZE = 1024 * 1024
+
+# Compressed containers, disc images with internal compression, media
+STORED_EXTENSIONS = frozenset(
+    {
+        ".zip",
+        ".7z",
+        ".rar",
+        ".gz",
+        ".xz",
+        ".bz2",
+        ".zst",
+        ".chd",
+        ".cso",
+        ".zso",
+        ".rvz",
+        ".wia",
+        ".nsz",
+        ".xcz",
+        ".pbp",
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".webp",
+        ".mp4",
+        ".mkv",
+        ".mp3",
+        ".ogg",
+    }
+)
+# Deflating multi-GB disc images costs more handheld CPU than it saves
+DEFLATE_MAX_SIZE = 256 * 1024 * 1024
+
+
+class _SocketStream(io.RawIOBase):
+    """Unseekable raw stream over a connected socket."""
+
+    def __init__(self, sock):
+        self._sock = sock
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._sock.sendall(data)
+        return len(data)
+
+
+def compress_type_for(name, size):
+    """ZIP compression method for a file of ``size`` bytes named ``name``."""
+    if size > DEFLATE_MAX_SIZE:
+        return zipfile.ZIP_STORED
+    if os.path.splitext(name)[1].lower() in STORED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def iter_tree(root):
+    """
+    Yield (path, arcname, stat_result) for a directory tree, sorted.
+
+    Directories are yielded only when empty (files imply their parents).
+    Symlinked directories are not followed; unreadable entries and
+    in-progress upload temp files are skipped.
+    """
+    base = os.path.basename(os.path.normpath(root)) or "files"
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        rel = os.path.relpath(dirpath, root)
+        prefix = base if rel == "." else f"{base}/{rel.replace(os.sep, '/')}"
+        entries = 0
+        for name in sorted(filenames):
+            if name.startswith(".upload-"):
+                continue
+            path = os.path.join(dirpath, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            entries += 1
+            yield path, f"{prefix}/{name}", st
+        if not entries and not dirnames:
+            try:
+                yield dirpath, f"{prefix}/", os.stat(dirpath)
+            except OSError:
+                pass
+
+
+def write_zip(sock, root):
+    """
+    Stream a ZIP of the directory ``root`` to ``sock``.
+
+    Returns:
+        (files written, uncompressed bytes)
+    """
+    out = io.BufferedWriter(_SocketStream(sock), CHUNK_SIZE)
+    files = total = 0
+    # An unseekable target makes zipfile emit data descriptors
+    with zipfile.ZipFile(out, "w", allowZip64=True, strict_timestamps=False) as zf:
+        for path, arcname, st in iter_tree(root):
+            if arcname.endswith("/"):
+                zf.writestr(zipfile.ZipInfo.from_file(path, arcname), b"")
+                continue
+            zinfo = zipfile.ZipInfo.from_file(path, arcname)
+            zinfo.compress_type = compress_type_for(arcname, st.st_size)
+            try:
+                src = open(path, "rb")
+            except OSError:
+                continue
+            with src, zf.open(zinfo, "w") as dst:
+                shutil.copyfileobj(src, dst, CHUNK_SIZE)
+            files += 1
+            total += st.st_size
+    out.flush()
+    return files, total
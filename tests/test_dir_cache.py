@@ -0,0 +1,123 @@
+"""Tests for cached directory listings in the web companion."""
+
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from web_companion import dir_cache
+from web_companion.dir_cache import DirectoryCache, MAX_PAGE_SIZE
+
+
+def _make_dir(root, files=50, dirs=3):
+    for i in range(files):
+        (root / f"Game {i:03d}.zip").write_bytes(b"x" * i)
+    for i in range(dirs):
+        (root / f"Folder {i}").mkdir()
+    (root / ".hidden").write_text("")
+    _age(root)
+    return str(root)
+
+
+def _age(path, seconds=60):
+    """Backdate a directory's mtime so its listing is trusted."""
+    then = time.time() - seconds
+    os.utime(path, (then, then))
+
+
+def _count_scans(monkeypatch):
+    calls = []
+    real_scandir = os.scandir
+
+    def scandir(path):
+        calls.append(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(dir_cache.os, "scandir", scandir)
+    return calls
+
+
+class TestDirectoryCache:
+    def test_folders_first_then_names(self, tmp_path):
+        page = DirectoryCache().page(_make_dir(tmp_path), offset=0, limit=5)
+        assert page["count"] == 53
+        assert page["total"] == 53
+        assert [e["name"] for e in page["entries"]] == [
+            "Folder 0",
+            "Folder 1",
+            "Folder 2",
+            "Game 000.zip",
+            "Game 001.zip",
+        ]
+        assert page["entries"][0]["size"] is None
+        assert page["entries"][4]["size"] == 1
+
+    def test_no_limit_lists_everything(self, tmp_path):
+        page = DirectoryCache().page(_make_dir(tmp_path))
+        assert len(page["entries"]) == 53
+        assert ".hidden" not in [e["name"] for e in page["entries"]]
+
+    def test_limit_is_capped(self, tmp_path):
+        path = _make_dir(tmp_path, files=MAX_PAGE_SIZE + 10, dirs=0)
+        page = DirectoryCache().page(path, offset=5, limit=MAX_PAGE_SIZE * 2)
+        assert len(page["entries"]) == MAX_PAGE_SIZE
+        assert page["offset"] == 5
+
+    def test_filter_and_sort(self, tmp_path):
+        cache = DirectoryCache()
+        path = _make_dir(tmp_path)
+        page = cache.page(path, query="game 04", sort="size_desc")
+        assert page["total"] == 11  # 004 and 040-049
+        assert page["entries"][0]["name"] == "Game 049.zip"
+        page = cache.page(path, limit=1, sort="name_desc")
+        assert page["entries"][0]["name"] == "Folder 2"
+
+    def test_cached_until_directory_changes(self, tmp_path, monkeypatch):
+        cache = DirectoryCache()
+        path = _make_dir(tmp_path)
+        scans = _count_scans(monkeypatch)
+        cache.page(path, limit=10)
+        cache.page(path, offset=10, limit=10)
+        assert len(scans) == 1
+
+        (tmp_path / "Game new.zip").write_bytes(b"")
+        _age(path, 30)
+        page = cache.page(path, limit=10)
+        assert len(scans) == 2
+        assert page["count"] == 54
+
+    def test_recently_changed_directory_is_rescanned(self, tmp_path, monkeypatch):
+        cache = DirectoryCache()
+        path = _make_dir(tmp_path)
+        os.utime(path)
+        scans = _count_scans(monkeypatch)
+        cache.page(path, limit=10)
+        cache.page(path, limit=10)
+        assert len(scans) == 2
+
+    def test_missing_directory_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            DirectoryCache().page(str(tmp_path / "missing"))
+
+    @pytest.mark.parametrize("sort", ["name", "size", "modified_desc"])
+    def test_entries_are_stated_without_the_lock(self, tmp_path, monkeypatch, sort):
+        cache = DirectoryCache()
+        path = _make_dir(tmp_path)
+        real_stat = os.stat
+        held = []
+
+        def stat(target, *args, **kwargs):
+            if target != path:
+                held.append(cache._lock.locked())
+            return real_stat(target, *args, **kwargs)
+
+        monkeypatch.setattr(dir_cache.os, "stat", stat)
+        cache.page(path, sort=sort)
+        assert held and not any(held)
+        # Stats are published for the next request
+        held.clear()
+        cache.page(path, sort=sort)
+        assert held == []
@@ -0,0 +1,75 @@
+"""Tests for Range/conditional download helpers in the web companion."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pytest
+
+from web_companion.downloads import (
+    RangeNotSatisfiable,
+    content_disposition,
+    etag_matches,
+    file_validators,
+    if_range_matches,
+    parse_range,
+)
+
+
+class TestParseRange:
+    @pytest.mark.parametrize(
+        "header, expected",
+        [
+            (None, None),
+            ("bytes=0-99", (0, 99)),
+            ("bytes=100-", (100, 999)),
+            ("bytes=-10", (990, 999)),
+            ("bytes=-5000", (0, 999)),
+            ("bytes=900-5000", (900, 999)),
+            ("bytes=0-1,5-6", None),
+            ("items=0-1", None),
+            ("bytes=abc", None),
+            ("bytes=50-10", None),
+        ],
+    )
+    def test_parse(self, header, expected):
+        assert parse_range(header, 1000) == expected
+
+    @pytest.mark.parametrize("header", ["bytes=1000-", "bytes=-0"])
+    def test_unsatisfiable(self, header):
+        with pytest.raises(RangeNotSatisfiable):
+            parse_range(header, 1000)
+
+    def test_empty_file(self):
+        with pytest.raises(RangeNotSatisfiable):
+            parse_range("bytes=-10", 0)
+
+
+class TestValidators:
+    def test_etag_changes_with_content(self, tmp_path):
+        path = tmp_path / "save.srm"
+        path.write_bytes(b"a")
+        first, last_modified = file_validators(os.stat(path))
+        path.write_bytes(b"ab")
+        assert file_validators(os.stat(path))[0] != first
+        assert last_modified.endswith("GMT")
+
+    def test_if_range(self):
+        assert if_range_matches(None, '"x"', "date")
+        assert if_range_matches('"x"', '"x"', "date")
+        assert not if_range_matches('W/"x"', '"x"', "date")
+        assert not if_range_matches('"y"', '"x"', "date")
+        assert if_range_matches("date", '"x"', "date")
+
+    def test_if_none_match(self):
+        assert etag_matches('"a", W/"x"', '"x"')
+        assert etag_matches("*", '"x"')
+        assert not etag_matches(None, '"x"')
+
+
+def test_content_disposition_non_ascii():
+    header = content_disposition('Pokémon "Red".gb')
+    header.encode("latin-1")
+    assert 'filename="Pok?mon _Red_.gb"' in header
+    assert "filename*=UTF-8''Pok%C3%A9mon%20%22Red%22.gb" in header
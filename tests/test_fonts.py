@@ -0,0 +1,76 @@
+"""Tests for the shared font registry and glyph atlas."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame
+import pytest
+
+from ui import fonts
+
+WHITE = (255, 255, 255)
+
+
+@pytest.fixture(autouse=True)
+def font_module():
+    pygame.font.init()
+    fonts.clear()
+    yield
+    fonts.clear()
+
+
+def _pixels(surface):
+    return pygame.image.tobytes(surface, "RGBA")
+
+
+class TestFontRegistry:
+    def test_fonts_are_shared_per_size_and_style(self):
+        font = fonts.get_font(None, 20)
+        assert fonts.get_font(None, 20) is font
+        assert fonts.get_font(None, 24) is not font
+        bold = fonts.get_font(None, 20, bold=True)
+        assert bold is not font and bold.get_bold()
+        assert not font.get_bold()
+
+
+class TestGlyphAtlas:
+    def test_glyph_matches_font_render(self):
+        atlas = fonts.get_atlas(None, 20, WHITE)
+        target = pygame.Surface(atlas.size("7"), pygame.SRCALPHA)
+        atlas.render(target, "7", (0, 0))
+        expected = pygame.Surface(target.get_size(), pygame.SRCALPHA)
+        expected.blit(fonts.get_font(None, 20).render("7", True, WHITE), (0, 0))
+        assert _pixels(target) == _pixels(expected)
+
+    def test_string_is_laid_out_glyph_by_glyph(self):
+        atlas = fonts.get_atlas(None, 20, WHITE)
+        font = fonts.get_font(None, 20)
+        rect = atlas.render(pygame.Surface((200, 40)), "42%", (10, 5))
+        width = sum(font.size(char)[0] for char in "42%")
+        assert rect == pygame.Rect(10, 5, width, font.get_height())
+
+    def test_full_sheet_starts_over(self, monkeypatch):
+        monkeypatch.setattr(fonts, "ATLAS_WIDTH", 64)
+        monkeypatch.setattr(fonts, "ATLAS_MAX_HEIGHT", 64)
+        atlas = fonts.get_atlas(None, 20, WHITE)
+        text = "".join(chr(code) for code in range(0x21, 0x7F))
+        target = pygame.Surface((2000, 40))
+        # More glyphs than the small sheet holds
+        for start in range(0, len(text), 10):
+            chunk = text[start : start + 10]
+            assert atlas.render(target, chunk, (0, 0)).width > 0
+        assert atlas._sheet.get_height() <= 64
+        assert "~" in atlas._glyphs
+        assert "!" not in atlas._glyphs
+
+    def test_string_larger_than_sheet_falls_back(self, monkeypatch):
+        monkeypatch.setattr(fonts, "ATLAS_WIDTH", 64)
+        monkeypatch.setattr(fonts, "ATLAS_MAX_HEIGHT", 64)
+        atlas = fonts.get_atlas(None, 20, WHITE)
+        text = "".join(chr(code) for code in range(0x21, 0x7F))
+        font = fonts.get_font(None, 20)
+        assert atlas.size(text) == font.size(text)
+        rect = atlas.render(pygame.Surface((2000, 40)), text, (0, 0))
+        assert rect.size == font.size(text)
@@ -0,0 +1,101 @@
+"""Tests for background MJPEG frame encoding."""
+
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame
+
+from utils.frame_encoder import FrameEncoder
+
+
+def _surface(color, size=(320, 240)):
+    surface = pygame.Surface(size, 0, 32)
+    surface.fill(color)
+    return surface
+
+
+def _capture(encoder, surface, last_seq, timeout=2.0):
+    encoder._last_capture = 0.0  # bypass the fps throttle
+    encoder.capture(surface)
+    return encoder.wait_frame(last_seq, timeout)
+
+
+class TestFrameEncoder:
+    def test_no_work_without_subscribers(self):
+        encoder = FrameEncoder()
+        encoder.capture(_surface((255, 0, 0)))
+        assert encoder._pending is None
+        assert encoder._thread is None
+        assert not encoder.frame_pending
+
+    def test_encodes_jpeg_and_skips_unchanged_frames(self):
+        encoder = FrameEncoder()
+        encoder.subscribe()
+        try:
+            seq, frame = _capture(encoder, _surface((255, 0, 0)), 0)
+            assert seq == 1
+            assert frame[:2] == b"\xff\xd8"
+
+            seq, _ = _capture(encoder, _surface((255, 0, 0)), seq, timeout=0.3)
+            assert seq == 1
+
+            seq, _ = _capture(encoder, _surface((0, 0, 255)), seq)
+            assert seq == 2
+        finally:
+            encoder.unsubscribe()
+
+    def test_downscales_to_max_size(self):
+        encoder = FrameEncoder(max_size=(160, 160))
+        encoder.subscribe()
+        try:
+            _, frame = _capture(encoder, _surface((0, 255, 0)), 0)
+        finally:
+            encoder.unsubscribe()
+        assert pygame.image.load(io.BytesIO(frame)).get_size() == (160, 120)
+
+    def test_throttled_capture_requests_redraw(self):
+        encoder = FrameEncoder(fps=1000)
+        encoder.subscribe()
+        try:
+            assert encoder.frame_pending
+            encoder.capture(_surface((0, 0, 0)))
+            assert not encoder._capture_due
+            encoder._last_capture = float("inf")
+            encoder.capture(_surface((0, 0, 0)))
+            assert encoder._capture_due
+        finally:
+            encoder.unsubscribe()
+        assert not encoder.frame_pending
+
+    def test_encodes_each_subscribed_variant(self):
+        encoder = FrameEncoder()
+        encoder.subscribe()
+        encoder.subscribe((0.5, 40))
+        try:
+            seq, _ = _capture(encoder, _surface((0, 128, 255)), 0)
+            _, full, captured_at = encoder.latest()
+            _, half, _ = encoder.latest((0.5, 40))
+            assert captured_at > 0
+            assert pygame.image.load(io.BytesIO(full)).get_size() == (320, 240)
+            assert pygame.image.load(io.BytesIO(half)).get_size() == (160, 120)
+
+            # A new variant is encoded from the next capture, same seq
+            encoder.set_variant((0.5, 40), (0.75, 60))
+            encoder._last_capture = 0.0
+            assert encoder.frame_pending
+            encoder.capture(_surface((0, 128, 255)))
+            for _ in range(100):
+                if encoder.latest((0.75, 60))[1]:
+                    break
+                time.sleep(0.02)
+            seq2, frame, _ = encoder.latest((0.75, 60))
+            assert seq2 == seq
+            assert pygame.image.load(io.BytesIO(frame)).get_size() == (240, 180)
+        finally:
+            encoder.unsubscribe()
+            encoder.unsubscribe((0.75, 60))
+        assert not encoder.active
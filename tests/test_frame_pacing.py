@@ -0,0 +1,110 @@
+"""Tests for main loop frame pacing."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pytest
+
+from utils import frame_pacing
+from utils.frame_pacing import FramePacer, WakeQueue
+
+
+class FakeTime:
+    def __init__(self):
+        self.now = 0
+        self.waits = []
+        self.ticks = []
+
+    def get_ticks(self):
+        return self.now
+
+    def tick(self, fps=0):
+        self.ticks.append(fps)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeTime()
+    monkeypatch.setattr(frame_pacing.pygame.time, "get_ticks", fake.get_ticks)
+    monkeypatch.setattr(frame_pacing._wake, "wait", fake.waits.append)
+    return fake
+
+
+@pytest.fixture
+def pacer(clock):
+    pacer = FramePacer(20)
+    pacer.clock = clock
+    return pacer
+
+
+class TestFramePacer:
+    def test_full_rate_while_active(self, clock, pacer):
+        clock.now = 60000
+        pacer.wait(active=True, pending=False)
+        assert clock.ticks == [20]
+        assert clock.waits == []
+
+    def test_full_rate_shortly_after_input(self, clock, pacer):
+        clock.now = 60000
+        pacer.note_input()
+        clock.now += frame_pacing.ACTIVE_HOLD - 1
+        pacer.wait(active=False, pending=False)
+        assert clock.ticks == [20]
+
+    def test_idle_polls_slower_the_longer_it_lasts(self, clock, pacer):
+        clock.now = frame_pacing.ACTIVE_HOLD
+        pacer.wait(active=False, pending=False)
+        clock.now = frame_pacing.DEEP_IDLE_AFTER
+        pacer.wait(active=False, pending=False)
+        assert clock.waits == [
+            frame_pacing.IDLE_POLL / 1000,
+            frame_pacing.DEEP_IDLE_POLL / 1000,
+        ]
+        assert pacer.idle_waits == 2
+
+    def test_pending_work_wakes_when_redraw_is_due(self, clock, pacer):
+        clock.now = 60000
+        pacer.note_drawn()
+        clock.now += frame_pacing.BACKGROUND_INTERVAL - 80
+        assert not pacer.background_due()
+        pacer.wait(active=False, pending=True)
+        assert clock.waits == [0.08]
+
+    def test_overdue_redraw_does_not_spin(self, clock, pacer):
+        clock.now = 60000
+        pacer.wait(active=False, pending=True)
+        assert pacer.background_due()
+        assert clock.waits == [frame_pacing.DEEP_IDLE_POLL / 1000]
+
+    def test_never_faster_than_the_frame_rate(self, clock, pacer):
+        clock.now = 60000
+        pacer.note_drawn()
+        clock.now += frame_pacing.BACKGROUND_INTERVAL - 5
+        pacer.wait(active=False, pending=True)
+        assert clock.waits == [0.05]
+
+
+class TestWake:
+    def test_wake_queue_put_sets_the_wake_flag(self):
+        frame_pacing._wake.clear()
+        wake_queue = WakeQueue()
+        wake_queue.put("result")
+        assert frame_pacing._wake.is_set()
+        assert wake_queue.get_nowait() == "result"
+        frame_pacing._wake.clear()
+
+    def test_wake_ends_the_idle_sleep(self):
+        frame_pacing._wake.clear()
+        frame_pacing.wake()
+        pacer = FramePacer(20)
+        pacer._last_input = -frame_pacing.DEEP_IDLE_AFTER
+        pacer.wait(active=False, pending=False)
+        assert not frame_pacing._wake.is_set()
+
+    def test_full_rate_iterations_clear_the_flag(self, clock, pacer):
+        frame_pacing.wake()
+        pacer.wait(active=True, pending=False)
+        # Picked up by this iteration; the next idle sleep isn't cut short
+        assert not frame_pacing._wake.is_set()
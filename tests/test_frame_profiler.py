@@ -0,0 +1,126 @@
+"""Tests for the main-loop frame profiler."""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pytest
+
+from utils import frame_profiler
+from utils.frame_profiler import FrameProfiler, percentile
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake perf_counter advanced by hand, in seconds."""
+    now = [0.0]
+    monkeypatch.setattr(frame_profiler.time, "perf_counter", lambda: now[0])
+    return now
+
+
+def _frame(profiler, clock, phases):
+    profiler.begin_frame()
+    for phase, seconds in phases:
+        clock[0] += seconds
+        profiler.lap(phase)
+
+
+class TestFrameProfiler:
+    def test_disabled_records_nothing(self, clock):
+        profiler = FrameProfiler()
+        _frame(profiler, clock, [("render", 0.01)])
+        profiler.end_frame()
+        assert profiler.frames == 0
+        assert profiler.stats() == {}
+        assert profiler.trace_events() == []
+
+    def test_phase_percentiles(self, clock):
+        profiler = FrameProfiler(enabled=True)
+        for i in range(100):
+            _frame(profiler, clock, [("events", 0.001), ("render", 0.001 * (i + 1))])
+            profiler.end_frame()
+        stats = profiler.stats()
+        assert list(stats) == ["events", "render", "frame"]
+        assert stats["events"] == pytest.approx((1.0, 1.0))
+        assert stats["render"] == pytest.approx((51.0, 100.0))
+        assert stats["frame"] == pytest.approx((52.0, 101.0))
+
+    def test_repeated_phase_is_summed(self, clock):
+        profiler = FrameProfiler(enabled=True)
+        _frame(profiler, clock, [("crt", 0.002), ("render", 0.005), ("crt", 0.003)])
+        profiler.end_frame()
+        assert profiler.stats()["crt"] == pytest.approx((5.0, 5.0))
+
+    def test_undrawn_iterations_are_dropped(self, clock):
+        profiler = FrameProfiler(enabled=True)
+        _frame(profiler, clock, [("events", 0.5)])
+        _frame(profiler, clock, [("events", 0.001)])
+        profiler.end_frame()
+        assert profiler.frames == 1
+        assert profiler.stats()["frame"] == pytest.approx((1.0, 1.0))
+
+    def test_window_is_rolling(self, clock):
+        profiler = FrameProfiler(enabled=True, window=10)
+        for seconds in [1.0] * 10 + [0.001] * 10:
+            _frame(profiler, clock, [("render", seconds)])
+            profiler.end_frame()
+        assert profiler.stats()["render"] == pytest.approx((1.0, 1.0))
+
+    def test_chrome_trace_export(self, clock, tmp_path):
+        profiler = FrameProfiler(enabled=True, trace_frames=2)
+        for _ in range(3):
+            _frame(profiler, clock, [("events", 0.001), ("flip", 0.002)])
+            profiler.end_frame()
+        path = profiler.export_trace(str(tmp_path / "trace" / "frames.json"))
+        with open(path) as f:
+            events = json.load(f)["traceEvents"]
+        assert [e["name"] for e in events] == ["frame", "events", "flip"] * 2
+        frame, events_lap, flip = events[3:]
+        assert frame["ph"] == "X"
+        assert frame["dur"] == pytest.approx(3000)
+        assert flip["ts"] == pytest.approx(events_lap["ts"] + 1000)
+
+    def test_input_latency_runs_to_the_end_of_flip(self, clock):
+        profiler = FrameProfiler(enabled=True)
+        profiler.begin_frame()
+        clock[0] += 0.001
+        profiler.note_input()
+        # A later input in the same frame doesn't reset the mark
+        clock[0] += 0.001
+        profiler.note_input()
+        profiler.lap("events")
+        clock[0] += 0.004
+        profiler.lap("render")
+        clock[0] += 0.002
+        profiler.lap("flip")
+        clock[0] += 0.003
+        profiler.lap("capture")
+        profiler.end_frame()
+        assert profiler.stats()["input"] == pytest.approx((7.0, 7.0))
+
+    def test_input_carries_over_undrawn_iterations(self, clock):
+        profiler = FrameProfiler(enabled=True)
+        profiler.begin_frame()
+        profiler.note_input()
+        _frame(profiler, clock, [("events", 0.01)])
+        _frame(profiler, clock, [("flip", 0.005)])
+        profiler.end_frame()
+        _frame(profiler, clock, [("flip", 0.005)])
+        profiler.end_frame()
+        # Only the frame that showed the input records a latency
+        assert profiler.stats()["input"] == pytest.approx((15.0, 15.0))
+        names = [e["name"] for e in profiler.trace_events()]
+        assert names.count("input") == 1
+        (latency,) = [e for e in profiler.trace_events() if e["name"] == "input"]
+        assert latency["tid"] == 2
+
+    def test_disabled_ignores_input(self, clock):
+        profiler = FrameProfiler()
+        profiler.note_input()
+        assert profiler._input is None
+
+
+def test_percentile_of_empty_window():
+    assert percentile([], 0.99) == 0.0
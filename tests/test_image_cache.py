@@ -0,0 +1,347 @@
+"""Tests for thumbnail lookup caching in the image cache service."""
+
+import importlib.util
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+# Import image_cache directly to avoid services/__init__.py (which pulls in
+# download_manager → nsz → argparse and crashes under pytest).
+_mod_path = os.path.join(
+    os.path.dirname(__file__), "..", "src", "services", "image_cache.py"
+)
+_spec = importlib.util.spec_from_file_location("image_cache", _mod_path)
+_mod = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_mod)
+
+import pytest
+from queue import Queue
+
+from utils import frame_pacing
+
+BOXART = "http://example.com/boxart/"
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(_mod, "SYSTEMS_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(_mod, "_missing_art", _mod._MissingArtCache())
+    monkeypatch.setattr(_mod, "_listing_cache", _mod._ThumbnailListingCache())
+    return tmp_path
+
+
+@pytest.fixture
+def requests_log(monkeypatch):
+    calls = []
+
+    class _Response:
+        status_code = 404
+        content = b""
+
+        def raise_for_status(self):
+            raise _mod.requests.exceptions.HTTPError("404")
+
+    def fake_get(url, *args, **kwargs):
+        calls.append(url)
+        return _Response()
+
+    monkeypatch.setattr(_mod.requests, "get", fake_get)
+    return calls
+
+
+def _set_listing(listing_cache, boxart_url, filenames):
+    listing_cache._listings[boxart_url] = _mod._ListingIndex(filenames)
+    listing_cache._started[boxart_url] = True
+    event = _mod.Event()
+    event.set()
+    listing_cache._events[boxart_url] = event
+
+
+class TestMissingArtCache:
+    def test_marks_and_reports_missing(self, cache_dir):
+        misses = _mod._MissingArtCache()
+        assert not misses.is_missing(BOXART, "Game")
+        misses.mark_missing(BOXART, "Game")
+        assert misses.is_missing(BOXART, "Game")
+        assert not misses.is_missing(BOXART, "Other Game")
+
+    def test_persists_across_instances(self, cache_dir):
+        misses = _mod._MissingArtCache()
+        misses.mark_missing(BOXART, "Game")
+        misses.flush()
+        assert _mod._MissingArtCache().is_missing(BOXART, "Game")
+
+    def test_scoped_per_boxart_url(self, cache_dir):
+        misses = _mod._MissingArtCache()
+        misses.mark_missing(BOXART, "Game")
+        assert not misses.is_missing("http://other.example.com/", "Game")
+
+    def test_entries_expire_after_ttl(self, cache_dir):
+        misses = _mod._MissingArtCache()
+        misses.mark_missing(BOXART, "Game")
+        misses._misses[BOXART]["Game"] = time.time() - misses.TTL_SECONDS - 1
+        assert not misses.is_missing(BOXART, "Game")
+
+    def test_clear_missing_forgets_entry(self, cache_dir):
+        misses = _mod._MissingArtCache()
+        misses.mark_missing(BOXART, "Game")
+        misses.clear_missing(BOXART, "Game")
+        assert not misses.is_missing(BOXART, "Game")
+
+    def test_changes_inside_the_save_interval_are_saved_later(self, cache_dir):
+        misses = _mod._MissingArtCache()
+        misses.SAVE_INTERVAL = 0.1
+        misses.mark_missing(BOXART, "Game")
+        misses.clear_missing(BOXART, "Game")
+        # Nothing else happens; the held-back save still reaches the disk
+        deadline = time.time() + 5
+        while _mod._MissingArtCache().is_missing(BOXART, "Game"):
+            assert time.time() < deadline
+            time.sleep(0.02)
+
+
+# Fixture listing in libretro-thumbnails naming ("&", ":" etc. become "_")
+FIXTURE_LISTING = [
+    "Legend of Zelda, The - A Link to the Past (USA).png",
+    "Super Mario World 2 - Yoshi's Island (USA, Europe).png",
+    "Mario _ Luigi - Superstar Saga (USA).png",
+    "Castlevania - Symphony of the Night (USA).png",
+    "Final Fantasy III (USA).png",
+    "NHL '94 (USA).png",
+    "NHL 95 (USA).png",
+    "Sonic 3 _ Knuckles (World).png",
+    "Sonic the Hedgehog 3 (USA).png",
+    "Street Fighter II' Turbo - Hyper Fighting (USA).png",
+    "Pokemon - Red Version (USA, Europe).png",
+    "Ratchet _ Clank - Going Commando (USA).png",
+    "Mega Man 10 (USA).png",
+]
+
+# (game file name, expected listing entry or None)
+FIXTURE_GAMES = [
+    ("Legend of Zelda, The - A Link to the Past (USA).zip", FIXTURE_LISTING[0]),
+    ("Super Mario World 2 - Yoshi's Island (USA).zip", FIXTURE_LISTING[1]),
+    ("Mario & Luigi - Superstar Saga (USA).zip", FIXTURE_LISTING[2]),
+    ("Castlevania: Symphony of the Night (USA).bin", FIXTURE_LISTING[3]),
+    ("Final Fantasy 3 (USA).zip", FIXTURE_LISTING[4]),
+    ("NHL 94 (USA).zip", FIXTURE_LISTING[5]),
+    ("Sonic & Knuckles 3 (World).zip", FIXTURE_LISTING[7]),
+    ("Street Fighter II Turbo: Hyper Fighting (USA).zip", FIXTURE_LISTING[9]),
+    ("Pokemon Red Version (USA).zip", FIXTURE_LISTING[10]),
+    ("Ratchet and Clank - Going Commando (USA).iso", FIXTURE_LISTING[11]),
+    ("NHL 96 (USA).zip", None),
+    ("Sonic 3 (USA).zip", None),
+    ("Mega Man X (USA).zip", None),
+]
+
+
+class TestListingIndex:
+    def test_exact_cleaned_match(self):
+        index = _mod._ListingIndex(FIXTURE_LISTING)
+        assert index.match("NHL 95 (USA).zip") == "NHL 95 (USA).png"
+
+    def test_punctuation_and_articles_are_normalized(self):
+        index = _mod._ListingIndex(FIXTURE_LISTING)
+        assert index.match("Mario and Luigi: Superstar Saga") == FIXTURE_LISTING[2]
+
+    def test_numbers_must_match(self):
+        index = _mod._ListingIndex(FIXTURE_LISTING)
+        assert index.match("NHL 96") is None
+
+    def test_single_letter_titles_are_not_numerals(self):
+        index = _mod._ListingIndex(FIXTURE_LISTING)
+        assert index.match("Mega Man X (USA)") is None
+        assert index.match("Mega Man V (USA)") is None
+        assert index.match("Mega Man 10 (USA)") == "Mega Man 10 (USA).png"
+
+    def test_below_threshold_is_not_matched(self):
+        index = _mod._ListingIndex(FIXTURE_LISTING)
+        assert index.match("Sonic 3") is None
+
+    def test_fixture_match_rate_and_requests_per_game(
+        self, cache_dir, requests_log, capsys
+    ):
+        """Report match rate and HTTP requests per matched game."""
+        _set_listing(_mod._listing_cache, BOXART, FIXTURE_LISTING)
+        index = _mod._listing_cache._listings[BOXART]
+
+        exact = sum(
+            1
+            for game, _ in FIXTURE_GAMES
+            if _mod._clean_name_for_matching(game) in index.exact
+        )
+        matched = 0
+        for game, expected in FIXTURE_GAMES:
+            base_name = os.path.splitext(game)[0]
+            assert index.match(base_name) == expected, game
+            matched += expected is not None
+
+        # Each game costs one request when matched, none when known missing
+        cache = _mod.ImageCache()
+        for game, _ in FIXTURE_GAMES:
+            cache._load_image_with_fallback(
+                BOXART, os.path.splitext(game)[0], [".png"], game, game, (8, 8), Queue()
+            )
+        requests_per_match = len(requests_log) / matched
+        assert requests_per_match == 1.0
+
+        with capsys.disabled():
+            print(
+                f"\nlisting match rate: exact {exact}/{len(FIXTURE_GAMES)}, "
+                f"indexed {matched}/{len(FIXTURE_GAMES)}; "
+                f"{requests_per_match:.1f} HTTP requests per matched game"
+            )
+
+
+class TestFallbackLoading:
+    def _load(self, base_name):
+        cache = _mod.ImageCache()
+        queue = Queue()
+        cache._load_image_with_fallback(
+            BOXART,
+            base_name,
+            [".png", ".jpg", ".jpeg", ".gif", ".bmp"],
+            "key",
+            base_name,
+            (16, 16),
+            queue,
+        )
+        return queue.get_nowait()
+
+    def test_authoritative_listing_skips_extension_guessing(
+        self, cache_dir, requests_log
+    ):
+        _set_listing(_mod._listing_cache, BOXART, ["Other Game.png"])
+        _key, image = self._load("Missing Game")
+        assert image is _mod._KNOWN_MISSING
+        assert requests_log == []
+        assert _mod._missing_art.is_missing(BOXART, "Missing Game")
+
+    def test_known_miss_makes_no_requests(self, cache_dir, requests_log):
+        _set_listing(_mod._listing_cache, BOXART, [])
+        _mod._missing_art.mark_missing(BOXART, "Missing Game")
+        _key, image = self._load("Missing Game")
+        assert image is _mod._KNOWN_MISSING
+        assert requests_log == []
+
+    def test_all_404_guesses_are_persisted(self, cache_dir, requests_log):
+        _set_listing(_mod._listing_cache, BOXART, [])
+        _key, image = self._load("Missing Game")
+        assert image is _mod._KNOWN_MISSING
+        assert len(requests_log) == 5
+        assert _mod._missing_art.is_missing(BOXART, "Missing Game")
+
+    def test_known_miss_is_cached_without_retry(self, cache_dir):
+        cache = _mod.ImageCache()
+        queue = Queue()
+        queue.put(("key", _mod._KNOWN_MISSING))
+        cache._thumbnail_cache["key"] = "loading"
+        cache._process_queue(queue, cache._thumbnail_cache, 10)
+        assert cache._thumbnail_cache["key"] is None
+        assert "key" not in cache._retry_counts
+
+
+class TestImageDecode:
+    def _png_bytes(self, size=(40, 20)):
+        import io
+
+        import pygame
+
+        surface = pygame.Surface(size, pygame.SRCALPHA, 32)
+        surface.fill((10, 200, 30, 255))
+        buf = io.BytesIO()
+        pygame.image.save(surface, buf, "x.png")
+        return buf.getvalue()
+
+    def test_decodes_to_target_size(self):
+        from utils.image_decode import decode_image
+
+        pixels, size = decode_image(self._png_bytes(), target_size=(8, 8))
+        assert size == (8, 8)
+        assert len(pixels) == 8 * 8 * 4
+
+    def test_max_dimension_keeps_aspect_ratio(self):
+        from utils.image_decode import decode_image
+
+        _pixels, size = decode_image(self._png_bytes((40, 20)), max_dimension=10)
+        assert size == (10, 5)
+
+    def test_update_wraps_raw_buffers_into_surfaces(self):
+        from utils.image_decode import decode_image
+
+        cache = _mod.ImageCache()
+        cache._thumbnail_cache["key"] = "loading"
+        cache._thumbnail_queue.put(
+            ("key", decode_image(self._png_bytes(), target_size=(8, 8)))
+        )
+        assert cache.update()
+        surface = cache._thumbnail_cache["key"]
+        assert surface.get_size() == (8, 8)
+        assert surface.get_at((0, 0))[:3] == (10, 200, 30)
+
+    def test_update_respects_time_budget(self, monkeypatch):
+        from utils.image_decode import decode_image
+
+        cache = _mod.ImageCache()
+        monkeypatch.setattr(cache, "UPDATE_BUDGET_MS", -1.0)
+        decoded = decode_image(self._png_bytes(), target_size=(8, 8))
+        for i in range(3):
+            cache._thumbnail_queue.put((f"key{i}", decoded))
+        frame_pacing._wake.clear()
+        cache.update()
+        # At least one item per frame, the rest waits for later frames
+        # without letting the idle loop sleep on it
+        assert cache._thumbnail_queue.qsize() == 2
+        assert frame_pacing._wake.is_set()
+        frame_pacing._wake.clear()
+
+    def _decoder_with_pool(self, error):
+        from concurrent.futures import Future
+
+        from utils.image_decode import ImageDecoder
+
+        class Pool:
+            def submit(self, *args):
+                future = Future()
+                future.set_exception(error)
+                return future
+
+            def shutdown(self, **kwargs):
+                pass
+
+        decoder = ImageDecoder()
+        decoder._processes = 1
+        decoder._pool = Pool()
+        return decoder
+
+    def test_broken_pool_falls_back_in_thread(self):
+        from concurrent.futures.process import BrokenProcessPool
+
+        decoder = self._decoder_with_pool(BrokenProcessPool())
+        _pixels, size = decoder.decode(self._png_bytes(), target_size=(8, 8))
+        assert size == (8, 8)
+        assert decoder._pool is None
+
+    def test_decode_errors_propagate_without_a_retry(self, monkeypatch):
+        import utils.image_decode as image_decode
+
+        calls = []
+        monkeypatch.setattr(image_decode, "decode_image", calls.append)
+        decoder = self._decoder_with_pool(ValueError("not an image"))
+        with pytest.raises(ValueError):
+            decoder.decode(b"junk")
+        assert calls == []
+        assert decoder._pool is not None
+
+    def test_pool_is_created_up_front_with_spawned_workers(self):
+        from utils.image_decode import PIL_AVAILABLE, ImageDecoder
+
+        if not PIL_AVAILABLE:
+            pytest.skip("process pool needs Pillow")
+        decoder = ImageDecoder(1)
+        try:
+            assert decoder._pool._mp_context.get_start_method() == "spawn"
+        finally:
+            decoder.shutdown()
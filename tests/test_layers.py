@@ -0,0 +1,165 @@
+"""Tests for cached static layers."""
+
+import functools
+import gc
+import os
+import sys
+import weakref
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame
+import pytest
+
+from ui.layers import LayerCache
+from ui.organisms.grid import Grid
+from ui.organisms.menu_list import MenuList
+
+RED = (255, 0, 0)
+# 10x10 32-bit layer: 400 bytes
+LAYER = pygame.Rect(0, 0, 10, 10)
+
+
+@pytest.fixture
+def screen():
+    return pygame.Surface((40, 40), depth=32)
+
+
+class Painter:
+    def __init__(self, screen, rect=LAYER, color=RED):
+        self.calls = 0
+        self.screen = screen
+        self.rect = rect
+        self.color = color
+
+    def __call__(self):
+        self.calls += 1
+        self.screen.fill(self.color, self.rect)
+
+
+class TestLayerCache:
+    def test_captured_when_key_repeats(self, screen):
+        cache = LayerCache()
+        paint = Painter(screen)
+        results = [cache.draw(screen, "l", LAYER, "k", paint) for _ in range(4)]
+        assert results == [False, False, True, True]
+        assert paint.calls == 2
+        assert cache.captures == 1
+
+    def test_hit_restores_the_painted_pixels(self, screen):
+        cache = LayerCache()
+        paint = Painter(screen)
+        for _ in range(2):
+            cache.draw(screen, "l", LAYER, "k", paint)
+        screen.fill((0, 0, 0))
+        assert cache.draw(screen, "l", LAYER, "k", paint)
+        assert screen.get_at((5, 5))[:3] == RED
+        assert screen.get_at((20, 20))[:3] == (0, 0, 0)
+
+    def test_key_change_repaints(self, screen):
+        cache = LayerCache()
+        paint = Painter(screen)
+        for key in ("a", "a", "a", "b", "b"):
+            cache.draw(screen, "l", LAYER, key, paint)
+        assert paint.calls == 4
+
+    def test_changing_keys_never_capture(self, screen):
+        cache = LayerCache()
+        paint = Painter(screen)
+        for key in range(5):
+            cache.draw(screen, "l", LAYER, key, paint)
+        assert cache.captures == 0
+        assert cache.bytes == 0
+
+    def test_clipped_paint_is_not_captured(self, screen):
+        cache = LayerCache()
+        paint = Painter(screen)
+        screen.set_clip(pygame.Rect(0, 0, 5, 5))
+        for _ in range(3):
+            cache.draw(screen, "l", LAYER, "k", paint)
+        assert cache.captures == 0
+
+    def test_evicts_least_recently_drawn_over_budget(self, screen):
+        cache = LayerCache(budget=LAYER.width * LAYER.height * 4 * 2)
+        for name in ("a", "b", "a", "b", "c", "c"):
+            cache.draw(screen, name, LAYER, "k", Painter(screen))
+        assert cache.bytes == cache.budget
+        assert cache.evictions == 1
+        assert not cache.draw(screen, "a", LAYER, "k", Painter(screen))
+
+    def test_clear_forgets_layers(self, screen):
+        cache = LayerCache()
+        for _ in range(2):
+            cache.draw(screen, "l", LAYER, "k", Painter(screen))
+        cache.clear()
+        assert cache.bytes == 0
+        assert not cache.draw(screen, "l", LAYER, "k", Painter(screen))
+
+
+class TestMenuListLayer:
+    def test_only_the_highlighted_row_is_drawn_on_hits(self, screen, monkeypatch):
+        pygame.font.init()
+        menu_list = MenuList()
+        drawn = []
+
+        def render(screen, rect, label, **kwargs):
+            drawn.append(label)
+            return rect
+
+        monkeypatch.setattr(menu_list.menu_item, "render", render)
+        cache = LayerCache()
+        layer = functools.partial(cache.draw, screen, "rows")
+        items = ["one", "two", "three"]
+        for _ in range(3):
+            drawn.clear()
+            rects, _ = menu_list.render(
+                screen,
+                pygame.Rect(0, 0, 40, 30),
+                items,
+                highlighted=1,
+                selected=set(),
+                item_height=10,
+                layer=layer,
+            )
+        assert drawn == ["two"]
+        assert len(rects) == 3
+
+        drawn.clear()
+        menu_list.render(
+            screen,
+            pygame.Rect(0, 0, 40, 30),
+            items,
+            highlighted=1,
+            selected={0},
+            item_height=10,
+            layer=layer,
+        )
+        # Rows are redrawn from their own surfaces; only the changed one
+        # and the highlighted one are rendered
+        assert drawn == ["one", "two"]
+
+
+class TestGridLayer:
+    def test_layer_keeps_its_images_alive(self, screen):
+        pygame.font.init()
+        grid = Grid()
+        cache = LayerCache()
+        images = {"b": pygame.Surface((4, 4))}
+        alive = weakref.ref(images["b"])
+        grid.render(
+            screen,
+            pygame.Rect(0, 0, 40, 40),
+            ["a", "b"],
+            highlighted=0,
+            selected=set(),
+            columns=2,
+            cell_size=(20, 20),
+            get_label=str,
+            get_image=images.get,
+            layer=functools.partial(cache.draw, screen, "cells"),
+        )
+        # Evicted from the image cache, but the layer key still holds it,
+        # so its id can't be handed to another cover
+        del images["b"]
+        gc.collect()
+        assert alive() is not None
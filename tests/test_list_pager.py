@@ -0,0 +1,88 @@
+"""Tests for paged list access in the web companion."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from state import AppState
+from web_companion.list_pager import ListPager, MAX_PAGE_SIZE
+from web_companion.state_serializer import get_list_source
+
+SYSTEM = {"name": "Test", "boxarts": "http://example.com/boxart/"}
+GAMES = [{"filename": f"Game {i:05d}.zip"} for i in range(2000)]
+
+
+def _pager(list_id="list-1", games=GAMES):
+    pager = ListPager()
+    pager.publish((list_id, games, SYSTEM))
+    return pager
+
+
+class TestListPager:
+    def test_page_in_list_order(self):
+        page = _pager().page("list-1", offset=100, limit=2)
+        assert page == {
+            "id": "list-1",
+            "total": 2000,
+            "offset": 100,
+            "items": [
+                {
+                    "index": 100,
+                    "name": "Game 00100",
+                    "thumb_url": "http://example.com/boxart/Game 00100.png",
+                },
+                {
+                    "index": 101,
+                    "name": "Game 00101",
+                    "thumb_url": "http://example.com/boxart/Game 00101.png",
+                },
+            ],
+        }
+
+    def test_stale_list_id(self):
+        pager = _pager()
+        assert pager.page("list-0") is None
+        pager.publish(None)
+        assert pager.page("list-1") is None
+
+    def test_search_keeps_original_indices(self):
+        page = _pager().page("list-1", limit=5, query="GAME 0019")
+        assert page["total"] == 11
+        assert [row["index"] for row in page["items"]] == [19, 190, 191, 192, 193]
+
+    def test_sort_descending(self):
+        page = _pager().page("list-1", limit=2, sort="name_desc")
+        assert [row["index"] for row in page["items"]] == [1999, 1998]
+
+    def test_limit_is_capped(self):
+        page = _pager().page("list-1", limit=10_000)
+        assert len(page["items"]) == MAX_PAGE_SIZE
+
+    def test_new_list_drops_cached_views(self):
+        pager = _pager()
+        assert pager.page("list-1", query="00001")["total"] == 1
+        pager.publish(("list-2", GAMES[:5], SYSTEM))
+        assert pager.page("list-2", query="0000")["total"] == 5
+
+    def test_views_survive_a_modal_over_the_same_list(self):
+        pager = _pager()
+        pager.page("list-1", query="00001")
+        names = pager._names
+        pager.publish(None)
+        pager.publish(("list-1", GAMES, SYSTEM))
+        assert pager.page("list-1", query="00002")["total"] == 1
+        assert pager._names is names
+
+
+class TestListSource:
+    def test_replaced_list_gets_a_new_id(self):
+        state = AppState()
+        state.mode = "games"
+        state.game_list = games = [{"filename": "A.zip"}]
+        list_id = get_list_source(state)[0]
+        # Same object, length and system as before, but replaced meanwhile
+        state.game_list = [{"filename": "B.zip"}]
+        state.game_list = games
+        assert get_list_source(state)[0] != list_id
+        assert _pager(list_id).page(get_list_source(state)[0]) is None
@@ -0,0 +1,150 @@
+"""Tests for menu list row reuse and label measurement memos."""
+
+import gc
+import os
+import sys
+import weakref
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame
+import pytest
+
+from ui.atoms import text as text_module
+from ui.atoms.text import Text
+from ui.organisms import menu_list as menu_list_module
+from ui.organisms.menu_list import MenuList
+
+
+@pytest.fixture(autouse=True)
+def bare_argv(monkeypatch):
+    # The bundled nsz tool parses sys.argv when imported
+    monkeypatch.setattr(sys, "argv", sys.argv[:1])
+
+
+@pytest.fixture
+def drawn(monkeypatch):
+    pygame.font.init()
+    menu_list_module.row_cache.clear()
+    labels = []
+
+    def render(self, screen, rect, label, **kwargs):
+        labels.append(label)
+        return rect
+
+    monkeypatch.setattr(menu_list_module.MenuItem, "render", render)
+    return labels
+
+
+class CountingFont:
+    def __init__(self):
+        self.calls = 0
+
+    def size(self, text):
+        self.calls += 1
+        return len(text) * 10, 10
+
+
+class TestRowReuse:
+    def render(self, menu_list, items, highlighted):
+        screen = pygame.Surface((100, 100))
+        return menu_list.render(
+            screen,
+            pygame.Rect(0, 0, 100, 50),
+            items,
+            highlighted,
+            set(),
+            item_height=10,
+        )
+
+    def test_scrolling_renders_only_exposed_rows(self, drawn):
+        menu_list = MenuList()
+        items = [f"game {i}" for i in range(1000)]
+        self.render(menu_list, items, 500)
+        drawn.clear()
+        rects, scroll = self.render(menu_list, items, 501)
+        # Row 503 scrolled in and row 500 lost the highlight; the rest are
+        # blitted from their surfaces, the highlighted row is drawn live
+        assert scroll == 499
+        assert sorted(drawn) == ["game 500", "game 501", "game 503"]
+        assert len(rects) == 5
+
+    def test_unchanged_list_draws_only_the_highlighted_row(self, drawn):
+        menu_list = MenuList()
+        items = ["a", "b", "c"]
+        self.render(menu_list, items, 0)
+        drawn.clear()
+        self.render(menu_list, items, 0)
+        assert drawn == ["a"]
+
+    def test_cached_rows_keep_their_thumbnail_alive(self, drawn):
+        menu_list = MenuList()
+        thumbs = {"b": pygame.Surface((4, 4))}
+        alive = weakref.ref(thumbs["b"])
+
+        def render(highlighted):
+            return menu_list.render(
+                pygame.Surface((100, 100)),
+                pygame.Rect(0, 0, 100, 50),
+                ["a", "b"],
+                highlighted,
+                set(),
+                item_height=10,
+                get_thumbnail=thumbs.get,
+            )
+
+        render(0)
+        # The image cache evicts the art; the cached row still holds it,
+        # so its id can't be handed to another game's thumbnail
+        del thumbs["b"]
+        gc.collect()
+        assert alive() is not None
+        thumbs["b"] = pygame.Surface((4, 4))
+        drawn.clear()
+        render(0)
+        assert drawn == ["a", "b"]
+
+
+class TestTextMemos:
+    def test_truncation_is_measured_once(self):
+        font = CountingFont()
+        label = Text()
+        assert label._truncate("a long game title", font, 100) == "a long ..."
+        calls = font.calls
+        assert label._truncate("a long game title", font, 100) == "a long ..."
+        assert font.calls == calls
+
+    def test_fitting_text_is_not_truncated(self):
+        assert Text()._truncate("short", CountingFont(), 100) == "short"
+
+    def test_memo_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(text_module, "MAX_MEMO", 2)
+        text_module._fitted.clear()
+        font = CountingFont()
+        for word in ("one", "two", "three"):
+            Text()._truncate(word, font, 100)
+        assert len(text_module._fitted) <= 2
+
+    def test_memo_evicts_least_recently_used(self, monkeypatch):
+        monkeypatch.setattr(text_module, "MAX_MEMO", 2)
+        text_module._fitted.clear()
+        font = CountingFont()
+        Text()._truncate("one", font, 100)
+        Text()._truncate("two", font, 100)
+        Text()._truncate("one", font, 100)
+        Text()._truncate("three", font, 100)
+        assert [key[1] for key in text_module._fitted] == ["one", "three"]
+
+
+class TestDownloadAllView:
+    def test_appends_without_copying(self):
+        from ui.screens.games_screen import _WithExtraItem
+
+        games = [{"name": "a"}, {"name": "b"}]
+        view = _WithExtraItem(games, "extra")
+        assert len(view) == 3
+        assert view[1] is games[1]
+        assert view[2] == view[-1] == "extra"
+        assert view[1:] == [games[1], "extra"]
+        with pytest.raises(IndexError):
+            view[3]
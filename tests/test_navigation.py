@@ -0,0 +1,148 @@
+"""Tests for held-direction repeats and navigation event coalescing."""
+
+import collections
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame
+import pytest
+
+from constants import (
+    NAVIGATION_INITIAL_DELAY,
+    NAVIGATION_MAX_RATE,
+    NAVIGATION_MAX_STEPS,
+    NAVIGATION_START_RATE,
+)
+from input.navigation import NavigationHandler
+
+ARROWS = {
+    pygame.K_UP: "up",
+    pygame.K_DOWN: "down",
+    pygame.K_LEFT: "left",
+    pygame.K_RIGHT: "right",
+}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # Tick 0 means "not pressed" to the handler
+    now = [1000]
+    monkeypatch.setattr(pygame.time, "get_ticks", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def keys(monkeypatch):
+    held = collections.defaultdict(bool)
+    monkeypatch.setattr(pygame.key, "get_pressed", lambda: held)
+    return held
+
+
+def key(code, down=True):
+    kind = pygame.KEYDOWN if down else pygame.KEYUP
+    return pygame.event.Event(kind, key=code, mod=0, unicode="", scancode=0)
+
+
+def direction_of(event):
+    if event.type == pygame.KEYDOWN:
+        return ARROWS.get(event.key)
+    return None
+
+
+class TestHeldRepeats:
+    def hold(self, navigation, clock, keys, ms):
+        keys[pygame.K_DOWN] = True
+        navigation.update()
+        clock[0] += ms
+        navigation.update()
+        return navigation.repeats_due("down")
+
+    def test_nothing_before_the_first_repeat(self, clock, keys):
+        navigation = NavigationHandler()
+        assert self.hold(navigation, clock, keys, NAVIGATION_INITIAL_DELAY) == 0
+        clock[0] = 1000 + NAVIGATION_START_RATE - 1
+        assert navigation.repeats_due("down") == 0
+        clock[0] += 1
+        assert navigation.repeats_due("down") == 1
+
+    def test_slow_frame_gets_the_repeats_due_during_it(self, clock, keys):
+        navigation = NavigationHandler()
+        self.hold(navigation, clock, keys, 0)
+        # 350 ms, then 297.5 ms after it
+        clock[0] += NAVIGATION_START_RATE * 2
+        assert navigation.repeats_due("down") == 2
+        assert navigation.repeats_due("down") == 0
+
+    def test_repeats_are_capped_after_a_stall(self, clock, keys):
+        navigation = NavigationHandler()
+        self.hold(navigation, clock, keys, 0)
+        clock[0] += 60000
+        assert navigation.repeats_due("down") == NAVIGATION_MAX_STEPS
+        # The backlog is dropped, not caught up on
+        clock[0] += 1
+        assert navigation.repeats_due("down") == 0
+
+    def test_rate_accelerates_to_the_maximum(self, clock, keys):
+        navigation = NavigationHandler()
+        self.hold(navigation, clock, keys, 0)
+        steps = 0
+        for _ in range(500):
+            clock[0] += 10
+            steps += navigation.repeats_due("down")
+        assert navigation._velocity["down"] == NAVIGATION_MAX_RATE
+        # Frame-rate independent: 10 ms frames hit the same schedule
+        assert 1 < steps < 5000 / NAVIGATION_MAX_RATE
+
+    def test_release_stops_repeats(self, clock, keys):
+        navigation = NavigationHandler()
+        self.hold(navigation, clock, keys, 0)
+        keys[pygame.K_DOWN] = False
+        clock[0] += 5000
+        navigation.update()
+        assert navigation.repeats_due("down") == 0
+
+    def test_continuous_passes_the_steps(self, clock, keys):
+        navigation = NavigationHandler()
+        self.hold(navigation, clock, keys, 0)
+        clock[0] += NAVIGATION_START_RATE * 2
+        calls = []
+        assert navigation.handle_continuous(lambda *args: calls.append(args))
+        assert calls == [("down", (0, -1), 2)]
+
+
+class TestCoalesce:
+    def test_run_of_presses_is_capped(self):
+        navigation = NavigationHandler()
+        events = [key(pygame.K_DOWN)] * (NAVIGATION_MAX_STEPS + 3)
+        kept = navigation.coalesce(events, direction_of)
+        assert len(kept) == NAVIGATION_MAX_STEPS
+        assert navigation.coalesced == 3
+
+    def test_releases_dont_end_a_run(self):
+        navigation = NavigationHandler()
+        events = [key(pygame.K_DOWN), key(pygame.K_DOWN, down=False)] * 6
+        kept = navigation.coalesce(events, direction_of)
+        downs = [e for e in kept if e.type == pygame.KEYDOWN]
+        assert len(downs) == NAVIGATION_MAX_STEPS
+        assert len(kept) == NAVIGATION_MAX_STEPS + 6
+
+    def test_other_actions_and_directions_end_a_run(self):
+        navigation = NavigationHandler()
+        down, up, enter = key(pygame.K_DOWN), key(pygame.K_UP), key(pygame.K_RETURN)
+        events = (
+            [down] * NAVIGATION_MAX_STEPS
+            + [enter]
+            + [down] * NAVIGATION_MAX_STEPS
+            + [up]
+            + [down]
+        )
+        assert navigation.coalesce(events, direction_of) == events
+        assert navigation.coalesced == 0
+
+    def test_order_is_kept(self):
+        navigation = NavigationHandler()
+        events = [key(pygame.K_DOWN)] * 6 + [key(pygame.K_RETURN)]
+        kept = navigation.coalesce(events, direction_of)
+        assert kept[-1].key == pygame.K_RETURN
@@ -0,0 +1,139 @@
+"""Tests for fixed-resolution rendering scaled to the window."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame
+import pytest
+
+from utils.render_scaler import RenderScaler, parse_resolution
+
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+
+
+@pytest.fixture(autouse=True)
+def display(monkeypatch):
+    # Scaling only; nothing is shown
+    monkeypatch.setattr(pygame.display, "flip", lambda: None)
+    monkeypatch.setattr(pygame.display, "update", lambda rects: None)
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    yield
+
+
+def scaler_for(window_size, size=(80, 60), smooth=False):
+    scaler = RenderScaler(size, smooth=smooth)
+    scaler.resize(pygame.Surface(window_size, depth=32))
+    scaler.surface.fill(RED)
+    return scaler
+
+
+class TestParseResolution:
+    def test_parses_width_and_height(self):
+        assert parse_resolution("800x600") == (800, 600)
+        assert parse_resolution("1280X720") == (1280, 720)
+
+    @pytest.mark.parametrize("value", ["", "800", "800x", "0x600", "axb", "1x2x3"])
+    def test_rejects_malformed(self, value):
+        assert parse_resolution(value) is None
+
+
+class TestFit:
+    def test_integer_multiple_fills_the_window(self):
+        scaler = scaler_for((160, 120))
+        assert scaler.factor == 2
+        assert scaler.dest == pygame.Rect(0, 0, 160, 120)
+
+    def test_wider_window_is_pillarboxed(self):
+        scaler = scaler_for((200, 90))
+        assert scaler.factor == 0
+        assert scaler.dest == pygame.Rect(40, 0, 120, 90)
+
+    def test_integer_fit_with_letterbox(self):
+        scaler = scaler_for((200, 120))
+        assert scaler.factor == 2
+        assert scaler.dest == pygame.Rect(20, 0, 160, 120)
+
+    def test_smaller_window_is_not_integer(self):
+        assert scaler_for((40, 30)).factor == 0
+
+    def test_logical_surface_survives_resize(self):
+        scaler = scaler_for((160, 120))
+        surface = scaler.surface
+        scaler.resize(pygame.Surface((320, 240), depth=32))
+        assert scaler.surface is surface
+
+
+class TestPresent:
+    @pytest.mark.parametrize("smooth", [False, True])
+    @pytest.mark.parametrize("window", [(160, 120), (200, 90), (40, 30)])
+    def test_full_frame_covers_dest_only(self, window, smooth):
+        scaler = scaler_for(window, smooth=smooth)
+        scaler.present()
+        dest = scaler.dest
+        assert scaler.window.get_at(dest.center)[:3] == RED
+        assert scaler.window.get_at((dest.right - 1, dest.bottom - 1))[:3] == RED
+        if dest.x:
+            assert scaler.window.get_at((0, 0))[:3] == (0, 0, 0)
+
+    def test_integer_partial_update_scales_only_its_region(self):
+        scaler = scaler_for((160, 120))
+        scaler.present()
+        scaler.surface.fill(GREEN)
+        scaler.present([pygame.Rect(10, 10, 5, 5)])
+        window = scaler.window
+        assert window.get_at((20, 20))[:3] == GREEN
+        assert window.get_at((29, 29))[:3] == GREEN
+        assert window.get_at((30, 30))[:3] == RED
+        assert window.get_at((19, 19))[:3] == RED
+
+    def test_to_window_covers_the_scaled_rect(self):
+        scaler = scaler_for((200, 90))
+        assert scaler.to_window(pygame.Rect(0, 0, 80, 60)) == scaler.dest
+        assert scaler.to_window(pygame.Rect(1, 1, 1, 1)) == pygame.Rect(41, 1, 2, 2)
+
+
+class TestEvents:
+    def test_mouse_position_maps_to_logical(self):
+        scaler = scaler_for((200, 90))
+        event = pygame.event.Event(
+            pygame.MOUSEBUTTONDOWN, pos=(100, 45), button=1, touch=False
+        )
+        mapped = scaler.map_event(event)
+        assert mapped.pos == (40, 30)
+        assert mapped.button == 1
+
+    def test_letterbox_positions_clamp_to_the_edge(self):
+        scaler = scaler_for((200, 90))
+        assert scaler.to_logical((0, 0)) == (0, 0)
+        assert scaler.to_logical((199, 89)) == (79, 59)
+
+    def test_motion_rel_is_scaled(self):
+        scaler = scaler_for((160, 120))
+        event = pygame.event.Event(
+            pygame.MOUSEMOTION, pos=(10, 10), rel=(-6, 4), buttons=(1, 0, 0)
+        )
+        assert scaler.map_event(event).rel == (-3, 2)
+
+    def test_finger_renormalized_to_the_frame(self):
+        scaler = scaler_for((200, 90))
+        event = pygame.event.Event(
+            pygame.FINGERDOWN, x=0.5, y=0.5, dx=0.0, dy=0.0, finger_id=0
+        )
+        mapped = scaler.map_event(event)
+        assert mapped.x == pytest.approx(0.5)
+        assert mapped.y == pytest.approx(0.5)
+        left = scaler.map_event(
+            pygame.event.Event(
+                pygame.FINGERDOWN, x=0.1, y=0.0, dx=0.0, dy=0.0, finger_id=0
+            )
+        )
+        assert left.x == 0.0
+
+    def test_other_events_pass_through(self):
+        scaler = scaler_for((160, 120))
+        event = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a)
+        assert scaler.map_event(event) is event
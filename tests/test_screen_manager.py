@@ -0,0 +1,57 @@
+"""Tests for lazy screen loading in ScreenManager."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pytest
+
+from ui.screens import screen_manager
+from ui.screens.screen_manager import ScreenManager
+
+
+@pytest.fixture(autouse=True)
+def bare_argv(monkeypatch):
+    # The bundled nsz tool parses sys.argv when imported
+    monkeypatch.setattr(sys, "argv", sys.argv[:1])
+
+
+class TestLazyScreens:
+    def test_screens_are_built_on_first_access(self):
+        manager = ScreenManager()
+        assert not manager.is_loaded("we_patcher_screen")
+        screen = manager.we_patcher_screen
+        assert type(screen).__name__ == "WePatcherScreen"
+        assert manager.is_loaded("we_patcher_screen")
+        assert manager.we_patcher_screen is screen
+
+    def test_screens_share_the_manager_theme(self):
+        manager = ScreenManager()
+        assert manager.confirm_modal.theme is manager.theme
+
+    def test_every_registered_screen_resolves(self):
+        manager = ScreenManager()
+        for name, (_, class_name) in screen_manager._SCREENS.items():
+            assert type(getattr(manager, name)).__name__ == class_name
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError):
+            ScreenManager().no_such_screen
+
+    def test_preload_builds_one_screen_per_call(self):
+        manager = ScreenManager()
+        names = screen_manager._PRELOAD["games"]
+        assert manager.preload_next("games")
+        assert [manager.is_loaded(name) for name in names] == [True, False, False]
+        while manager.preload_next("games"):
+            pass
+        assert all(manager.is_loaded(name) for name in names)
+        assert not manager.preload_next("credits")
+
+    def test_package_exports_are_lazy(self):
+        from ui import screens
+
+        assert screens.ScreenManager is ScreenManager
+        with pytest.raises(AttributeError):
+            screens.NoSuchScreen
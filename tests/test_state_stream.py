@@ -0,0 +1,149 @@
+"""Tests for the versioned, delta-encoded web companion state stream."""
+
+import importlib.util
+import json
+import os
+
+# Import state_stream directly to avoid web_companion/__init__.py (which
+# starts pulling in the app's action handling and pygame).
+_mod_path = os.path.join(
+    os.path.dirname(__file__), "..", "src", "web_companion", "state_stream.py"
+)
+_spec = importlib.util.spec_from_file_location("state_stream", _mod_path)
+_mod = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_mod)
+
+
+def _items(count, prefix="Game"):
+    return [{"name": f"{prefix} {i}", "selected": False} for i in range(count)]
+
+
+def _apply(state, message):
+    """Python port of applyStateMessage() in the web client."""
+    if message.get("full") or state is None:
+        return dict(message["state"])
+    state = dict(state, **message.get("set", {}))
+    for key in message.get("unset", []):
+        state.pop(key, None)
+    if "items" in message:
+        length = message["items"]["length"]
+        items = list(state.get("items") or [])[:length]
+        items.extend({"name": ""} for _ in range(length - len(items)))
+        for start, values in message["items"]["patches"]:
+            items[start : start + len(values)] = values
+        state["items"] = items
+    return state
+
+
+class TestStateStream:
+    def test_version_bumps_only_on_change(self):
+        stream = _mod.StateStream()
+        assert stream.publish({"title": "A"})
+        assert not stream.publish({"title": "A"})
+        assert stream.current()[0] == 1
+        assert stream.publish({"title": "B"})
+        assert stream.current() == (2, {"title": "B"})
+
+
+class TestClientView:
+    def test_snapshot_then_field_delta(self):
+        view = _mod.ClientView()
+        first = {"screen_type": "list", "title": "A", "items": _items(3)}
+        message = view.snapshot(1, first)
+        assert message["full"] and message["state"] == first
+
+        second = dict(first, title="B", highlighted=2)
+        second.pop("screen_type")
+        message = view.delta(2, second)
+        assert message == {
+            "v": 2,
+            "set": {"title": "B", "highlighted": 2},
+            "unset": ["screen_type"],
+        }
+        assert view.delta(2, second) is None
+
+    def test_item_change_sends_only_changed_run(self):
+        view = _mod.ClientView()
+        items = _items(1000)
+        view.snapshot(1, {"items": items, "highlighted": 500})
+
+        changed = list(items)
+        changed[501] = dict(changed[501], selected=True)
+        message = view.delta(2, {"items": changed, "highlighted": 501})
+        assert message["items"] == {"length": 1000, "patches": [[501, [changed[501]]]]}
+        assert not view.pending
+
+    def test_new_list_sends_window_first_then_backfills(self):
+        view = _mod.ClientView()
+        client = _apply(None, view.snapshot(1, {"items": _items(10), "highlighted": 0}))
+
+        new_items = _items(5000, "Other")
+        state = {"items": new_items, "highlighted": 2500}
+        message = view.delta(2, state)
+        window = (2 * _mod.ITEM_WINDOW + 1) + _mod.ITEM_BACKFILL
+        assert sum(len(values) for _, values in message["items"]["patches"]) == window
+        client = _apply(client, message)
+        for i in range(2500 - _mod.ITEM_WINDOW, 2500 + _mod.ITEM_WINDOW + 1):
+            assert client["items"][i] == new_items[i]
+
+        messages = 1
+        while view.pending:
+            client = _apply(client, view.delta(2, state))
+            messages += 1
+        assert client["items"] == new_items
+        assert messages <= 5000 // _mod.ITEM_BACKFILL + 1
+
+    def test_shrinking_list_sends_length(self):
+        view = _mod.ClientView()
+        client = _apply(None, view.snapshot(1, {"items": _items(10)}))
+        message = view.delta(2, {"items": _items(4)})
+        assert message["items"] == {"length": 4, "patches": []}
+        assert _apply(client, message)["items"] == _items(4)
+
+    def test_items_removed_from_state(self):
+        view = _mod.ClientView()
+        view.snapshot(1, {"items": _items(3), "title": "A"})
+        message = view.delta(2, {"title": "A", "message": "Loading"})
+        assert message == {"v": 2, "set": {"message": "Loading"}, "unset": ["items"]}
+        assert not view.pending
+
+
+def _events(subscriber):
+    """Decode SSE events until the subscriber is up to date."""
+    messages = []
+    while True:
+        data = subscriber.poll()
+        if data is None:
+            return messages
+        assert data.startswith(b"data: ") and data.endswith(b"\n\n")
+        messages.append(json.loads(data[6:]))
+
+
+class TestStateSubscriber:
+    def test_snapshot_then_deltas_from_own_cursor(self):
+        stream = _mod.StateStream()
+        stream.publish({"title": "A", "items": _items(3)})
+        early = _mod.StateSubscriber(stream)
+        assert _events(early) == [
+            {"v": 1, "full": True, "state": {"title": "A", "items": _items(3)}}
+        ]
+        assert _events(early) == []
+
+        stream.publish({"title": "B", "items": _items(3)})
+        stream.publish({"title": "C", "items": _items(3)})
+        late = _mod.StateSubscriber(stream)
+        assert _events(early) == [{"v": 3, "set": {"title": "C"}}]
+        assert _events(late)[0]["state"]["title"] == "C"
+
+    def test_backfill_drains_without_new_versions(self):
+        stream = _mod.StateStream()
+        stream.publish({"highlighted": 0, "items": []})
+        subscriber = _mod.StateSubscriber(stream)
+        _events(subscriber)
+        stream.publish({"highlighted": 0, "items": _items(1000)})
+        messages = _events(subscriber)
+        assert len(messages) > 1
+        client = {"items": []}
+        for message in messages:
+            client = _apply(client, message)
+        assert client["items"] == _items(1000)
@@ -0,0 +1,80 @@
+"""Tests for change tracking in AppState."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from state import AppState, DownloadQueueItem
+
+
+class TestStateVersion:
+    def test_field_assignment_bumps_version(self):
+        state = AppState()
+        version = state.version
+        state.highlighted = 3
+        assert state.changed_since(version)
+
+    def test_same_value_does_not_bump(self):
+        state = AppState()
+        state.mode = "games"
+        state.loading.progress = 10
+        version = state.version
+        state.mode = "games"
+        state.loading.progress = 10
+        assert not state.changed_since(version)
+
+    def test_nested_and_queued_objects_bump(self):
+        state = AppState()
+        item = DownloadQueueItem(game={}, system_data={}, system_name="NES")
+        state.download_queue.items.append(item)
+        version = state.version
+        item.progress = 0.5
+        assert state.changed_since(version)
+        version = state.version
+        state.scraper_wizard.step = "done"
+        assert state.changed_since(version)
+
+    def test_new_container_bumps_in_place_edit_does_not(self):
+        state = AppState()
+        version = state.version
+        state.selected_games.add(1)
+        assert not state.changed_since(version)
+        state.mark_changed()
+        assert state.changed_since(version)
+        version = state.version
+        state.selected_games = set()
+        assert state.changed_since(version)
+
+    def test_input_bookkeeping_is_untracked(self):
+        state = AppState()
+        version = state.version
+        state.navigation.up = True
+        state.touch.start_time = 123
+        state.ui_rects.menu_items = [object()]
+        state._from_web_companion = True
+        assert not state.changed_since(version)
+
+
+class TestListGeneration:
+    def test_replacing_the_shown_list_advances(self):
+        state = AppState()
+        for change in (
+            lambda: setattr(state, "game_list", [{"name": "A"}]),
+            lambda: setattr(state, "selected_system", 2),
+            lambda: setattr(state.search, "filtered_list", []),
+            lambda: setattr(state.search, "mode", True),
+        ):
+            generation = state.list_generation
+            change()
+            assert state.list_generation != generation
+
+    def test_other_changes_keep_the_generation(self):
+        state = AppState()
+        state.game_list = games = [{"name": "A"}]
+        generation = state.list_generation
+        state.game_list = games
+        state.selected_system = 0
+        state.highlighted = 5
+        state.search.query = "a"
+        assert state.list_generation == generation
@@ -0,0 +1,164 @@
+"""Tests for the event-loop fan-out of streaming responses."""
+
+import os
+import socket
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame
+
+from utils.frame_encoder import FrameEncoder
+from utils.stream_hub import MJPEGSubscriber, StreamHub
+
+PAYLOAD = b"x" * 65536
+
+
+class _Source:
+    """Publisher with a version number, like StateStream or FrameEncoder."""
+
+    def __init__(self):
+        self.version = 0
+
+    def publish(self, hub):
+        self.version += 1
+        hub.notify()
+
+
+class _Subscriber:
+    """Sends "<version>:<payload>\\n" whenever its cursor is behind."""
+
+    keepalive_interval = None
+
+    def __init__(self, source):
+        self.source = source
+        self.sent = 0
+        self.closed = False
+
+    def poll(self):
+        version = self.source.version
+        if version == self.sent:
+            return None
+        self.sent = version
+        return b"%d:" % version + PAYLOAD + b"\n"
+
+    def keepalive(self):
+        return None
+
+    def close(self):
+        self.closed = True
+
+
+def _connect(hub, subscriber):
+    server, client = socket.socketpair()
+    hub.attach(server, subscriber)
+    client.settimeout(5.0)
+    return client
+
+
+def _read_until(sock, version, buf=b""):
+    """Read messages until ``version`` arrives; returns versions seen."""
+    seen = []
+    while True:
+        while b"\n" in buf:
+            line, buf = buf.split(b"\n", 1)
+            seen.append(int(line.split(b":", 1)[0]))
+            if seen[-1] == version:
+                return seen
+        buf += sock.recv(1 << 20)
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+class TestStreamHub:
+    def test_fan_out_with_independent_cursors(self):
+        hub, source = StreamHub(), _Source()
+        source.version = 1
+        first = _connect(hub, _Subscriber(source))
+        assert _read_until(first, 1) == [1]
+
+        second = _connect(hub, _Subscriber(source))
+        assert _read_until(second, 1) == [1]
+        source.publish(hub)
+        assert _read_until(first, 2) == [2]
+        assert _read_until(second, 2) == [2]
+        hub.close()
+
+    def test_slow_client_skips_stale_messages(self):
+        hub, source = StreamHub(), _Source()
+        server, slow = socket.socketpair()
+        slow.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 8192)
+        subscriber = _Subscriber(source)
+        hub.attach(server, subscriber)
+        slow.settimeout(5.0)
+        fast = _connect(hub, _Subscriber(source))
+
+        for _ in range(200):
+            source.publish(hub)
+            time.sleep(0.001)
+        # The fast reader is not held back by the stalled one
+        assert _read_until(fast, 200)[-1] == 200
+
+        seen = _read_until(slow, 200)
+        assert seen[-1] == 200
+        assert len(seen) < 50
+        assert seen == sorted(seen)
+        hub.close()
+
+    def test_disconnect_closes_subscriber_and_stops_thread(self):
+        hub, source = StreamHub(), _Source()
+        subscriber = _Subscriber(source)
+        client = _connect(hub, subscriber)
+        source.publish(hub)
+        _read_until(client, 1)
+
+        client.close()
+        _wait_for(lambda: subscriber.closed)
+        _wait_for(lambda: hub._thread is None)
+        assert hub.clients == 0
+
+
+class _Rate:
+    """RateController stand-in that is always ready."""
+
+    def __init__(self, variant):
+        self.variant = variant
+        self.seqs = []
+
+    def ready(self, now):
+        return True
+
+    def sent(self, seq, size, now):
+        self.seqs.append(seq)
+
+
+class TestMJPEGSubscriber:
+    def test_variant_switch_on_a_static_screen_is_sent(self):
+        encoder = FrameEncoder()
+        rate = _Rate(encoder.default_variant)
+        subscriber = MJPEGSubscriber(encoder, rate)
+        surface = pygame.Surface((320, 240), 0, 32)
+        try:
+            encoder.capture(surface)
+            _wait_for(lambda: encoder.latest()[1])
+            assert subscriber.poll() is not None
+            assert subscriber.poll() is None
+
+            # Quality step on unchanged pixels: same seq, new variant
+            rate.variant = (0.5, 40)
+            assert subscriber.poll() is None
+            encoder._last_capture = 0.0
+            encoder.capture(surface)
+            _wait_for(lambda: encoder.latest((0.5, 40))[1])
+            part = subscriber.poll()
+            assert part is not None
+            assert rate.seqs == [1, 1]
+            assert subscriber.poll() is None
+        finally:
+            subscriber.close()
@@ -0,0 +1,85 @@
+"""Tests for adaptive MJPEG rate control."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from utils import stream_rate
+from utils.stream_rate import RateController
+
+# Frame sizes per level, roughly those of a 640x480 menu screen
+SIZES = (60000, 40000, 25000, 12000, 8000)
+
+
+def _simulate(rate, bandwidth, delay, seconds, fps=15, start=0.0):
+    """
+    Drive ``rate`` over a FIFO link of ``bandwidth`` bytes/s and one-way
+    ``delay``, with a new frame captured ``fps`` times a second; returns
+    the capture-to-display latency of every frame shown.
+    """
+    link_free = start
+    seq = 0
+    captured = None
+    acks = []
+    latencies = []
+    tick = 1.0 / (fps * 4)
+    for i in range(int(seconds * fps * 4)):
+        now = start + i * tick
+        for ack_time, ack_seq in sorted(a for a in acks if a[0] <= now):
+            rate.acked(ack_seq, ack_time)
+        acks = [a for a in acks if a[0] > now]
+        if i % 4 == 0:
+            seq += 1
+            captured = now
+        if captured is not None and rate.ready(now):
+            size = SIZES[rate.level]
+            rate.sent(seq, size, now)
+            link_free = max(link_free, now) + size / bandwidth
+            shown = link_free + delay
+            latencies.append(shown - captured)
+            acks.append((shown + delay, seq))
+            captured = None
+    return latencies
+
+
+class TestRateController:
+    def test_fast_link_keeps_best_quality_and_full_rate(self):
+        rate = RateController(15)
+        latencies = _simulate(rate, bandwidth=5_000_000, delay=0.005, seconds=10)
+        assert rate.level == 0
+        assert len(latencies) >= 140
+        assert max(latencies) < 0.05
+
+    def test_slow_link_degrades_and_bounds_latency(self):
+        rate = RateController(15)
+        # 300 kB/s cannot carry 60 kB frames at 15 fps
+        latencies = _simulate(rate, bandwidth=300_000, delay=0.02, seconds=20)
+        assert rate.level >= 2
+        assert max(latencies[-50:]) < 0.3
+        assert rate.stats()["fps"] < 15
+
+    def test_recovers_when_link_improves(self):
+        rate = RateController(15)
+        _simulate(rate, bandwidth=150_000, delay=0.02, seconds=15)
+        degraded = rate.level
+        assert degraded >= 3
+        _simulate(rate, bandwidth=5_000_000, delay=0.02, seconds=30, start=15.0)
+        assert rate.level == 0
+
+    def test_window_blocks_until_ack_or_timeout(self):
+        rate = RateController(15)
+        rate.sent(1, 1000, 0.0)
+        rate.sent(2, 1000, 0.01)
+        assert not rate.ready(0.02)
+        assert rate.next_poll(0.02) == stream_rate.ACK_TIMEOUT
+
+        rate.acked(2, 0.05)
+        # Acking a newer frame also retires the older one
+        assert rate.level == 0
+        assert rate.ready(0.1)
+
+        rate.sent(3, 1000, 1.0)
+        rate.sent(4, 1000, 1.0)
+        assert rate.ready(1.0 + stream_rate.ACK_TIMEOUT + 0.1)
+        assert rate.level == 1
@@ -0,0 +1,114 @@
+"""Tests for the shared text surface cache."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame
+import pytest
+
+from ui import text_cache as text_cache_module
+from ui.atoms.text import Text
+from ui.text_cache import TextCache
+
+# 10x10 32-bit surfaces: 400 bytes each
+ENTRY = 400
+
+
+def _surface():
+    return pygame.Surface((10, 10), pygame.SRCALPHA)
+
+
+@pytest.fixture
+def cache():
+    return TextCache(budget=ENTRY * 3, max_pinned=ENTRY * 2)
+
+
+class TestTextCache:
+    def test_evicts_least_recently_used(self, cache):
+        for key in "abc":
+            cache.put(key, _surface())
+        assert cache.get("a") is not None
+        cache.put("d", _surface())
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.bytes == ENTRY * 3
+        assert cache.evictions == 1
+
+    def test_budget_counts_bytes(self, cache):
+        cache.put("first", _surface())
+        cache.put("second", _surface())
+        # Twice the size of an entry: only the oldest has to go
+        cache.put("wide", pygame.Surface((20, 10), pygame.SRCALPHA))
+        assert cache.get("first") is None
+        assert cache.get("second") is not None
+        assert cache.get("wide") is not None
+
+    def test_pinned_entries_survive_list_content(self, cache):
+        cache.put("title", _surface(), pin=True)
+        for i in range(10):
+            cache.put(i, _surface())
+        assert cache.get("title") is not None
+        assert cache.bytes <= cache.budget
+
+    def test_released_pins_become_evictable(self, cache):
+        cache.put("title", _surface(), pin=True)
+        cache.release_pins()
+        for i in range(3):
+            cache.put(i, _surface())
+        assert cache.get("title") is None
+        assert cache.stats()["pinned"] == 0
+
+    def test_pins_past_limit_fall_back_to_lru(self, cache):
+        for key in ("one", "two", "three"):
+            cache.put(key, _surface(), pin=True)
+        stats = cache.stats()
+        assert stats["pinned"] == 2
+        assert stats["pinned_bytes"] == ENTRY * 2
+        assert stats["entries"] == 3
+
+    def test_hit_and_miss_counters(self, cache):
+        assert cache.get("a") is None
+        cache.put("a", _surface())
+        cache.get("a")
+        cache.get("a")
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"]) == (2, 1)
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+
+class TestTextAtom:
+    def test_instances_share_rendered_surfaces(self, monkeypatch):
+        pygame.font.init()
+        monkeypatch.setattr(text_cache_module, "text_cache", TextCache())
+        monkeypatch.setattr("ui.atoms.text.text_cache", text_cache_module.text_cache)
+        first = Text()._get_text_surface("Super Mario", 20, (255, 255, 255))
+        second = Text()._get_text_surface("Super Mario", 20, (255, 255, 255))
+        assert first is second
+
+    def test_status_footer_leaves_the_cache_alone(self, monkeypatch):
+        from ui.molecules.status_footer import StatusFooter, StatusFooterItem
+
+        pygame.font.init()
+        cache = TextCache()
+        monkeypatch.setattr("ui.atoms.text.text_cache", cache)
+        screen = pygame.Surface((400, 300))
+        footer = StatusFooter()
+        for done in range(20):
+            footer.render(screen, [StatusFooterItem(f"Scraping: {done}/20", 0.5)])
+        # Status strings change every update; none of them is cached,
+        # let alone pinned until the next mode change
+        assert cache.bytes == 0
+        assert cache.pinned_bytes == 0
+
+    def test_dynamic_text_is_truncated_to_max_width(self):
+        pygame.font.init()
+        screen = pygame.Surface((400, 50))
+        text = Text()
+        full = text.render_dynamic(screen, "A very long status line " * 4, (0, 0))
+        short = text.render_dynamic(
+            screen, "A very long status line " * 4, (0, 0), max_width=150
+        )
+        assert full.width > 150
+        assert short.width <= 150
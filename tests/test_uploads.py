@@ -0,0 +1,122 @@
+"""Tests for streaming multipart uploads in the web companion."""
+
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pytest
+
+from web_companion.uploads import (
+    MultipartError,
+    UploadTracker,
+    iter_multipart,
+    part_filename,
+    receive_files,
+)
+
+BOUNDARY = "----WebKitFormBoundaryx7Yq"
+
+
+def _body(*parts):
+    out = b""
+    for headers, data in parts:
+        out += b"--" + BOUNDARY.encode() + b"\r\n" + headers + b"\r\n\r\n" + data
+        out += b"\r\n"
+    return out + b"--" + BOUNDARY.encode() + b"--\r\n"
+
+
+def _file_part(name, data):
+    headers = (
+        b'Content-Disposition: form-data; name="file"; filename="'
+        + name.encode()
+        + b'"\r\nContent-Type: application/octet-stream'
+    )
+    return headers, data
+
+
+class _Chunked(io.RawIOBase):
+    """Body stream returning at most ``size`` bytes per read."""
+
+    def __init__(self, data, size):
+        self._data = data
+        self._size = size
+
+    def read(self, n=-1):
+        chunk, self._data = self._data[: min(n, self._size)], self._data[self._size :]
+        return chunk
+
+
+class TestIterMultipart:
+    @pytest.mark.parametrize("chunk", [1, 7, 64, 100000])
+    def test_split_delimiters(self, chunk):
+        payload = b"A\r\n--" + BOUNDARY[:5].encode() + b"B" * 300
+        body = _body(_file_part("a.bin", payload), (b"Content-Disposition: x", b"v"))
+        stream = _Chunked(body, chunk)
+        events = list(iter_multipart(lambda: stream.read(4096), BOUNDARY))
+
+        data = [b"", b""]
+        part = -1
+        for event, value in events:
+            if event == "headers":
+                part += 1
+            elif event == "data":
+                data[part] += value
+        assert data == [payload, b"v"]
+        assert [e for e, _ in events if e != "data"] == [
+            "headers",
+            "end",
+            "headers",
+            "end",
+        ]
+
+    def test_truncated_body(self):
+        body = _body(_file_part("a.bin", b"x" * 100))[:-30]
+        stream = io.BytesIO(body)
+        with pytest.raises(MultipartError):
+            list(iter_multipart(lambda: stream.read(16), BOUNDARY))
+
+
+class TestPartFilename:
+    def test_strips_client_paths(self):
+        header = {"content-disposition": 'form-data; filename="C:\\\\x\\\\rom.iso"'}
+        assert part_filename(header) == "rom.iso"
+        header = {"content-disposition": 'form-data; filename="../../etc/passwd"'}
+        assert part_filename(header) == "passwd"
+        assert part_filename({"content-disposition": 'filename=".."'}) is None
+
+
+class TestReceiveFiles:
+    def test_streams_files_and_tracks_progress(self, tmp_path):
+        body = _body(_file_part("one.bin", b"1" * 5000), _file_part("two.sav", b"22"))
+        tracker = UploadTracker()
+        seen = []
+        original_update = tracker.update
+
+        def update(upload_id, name=None, received=None):
+            original_update(upload_id, name, received)
+            seen.extend(tracker.snapshot())
+
+        tracker.update = update
+        uploaded = receive_files(
+            _Chunked(body, 1024), len(body), BOUNDARY, str(tmp_path), tracker
+        )
+
+        assert uploaded == ["one.bin", "two.sav"]
+        assert (tmp_path / "one.bin").read_bytes() == b"1" * 5000
+        assert (tmp_path / "two.sav").read_bytes() == b"22"
+        assert sorted(os.listdir(tmp_path)) == ["one.bin", "two.sav"]
+        assert seen[-1]["received"] == len(body)
+        assert {"one.bin", "two.sav"} <= {upload["name"] for upload in seen}
+        assert tracker.snapshot() == []
+
+    def test_disconnect_removes_partial_file(self, tmp_path):
+        (tmp_path / "game.iso").write_bytes(b"old")
+        body = _body(_file_part("game.iso", b"9" * 10000))
+        with pytest.raises(MultipartError):
+            receive_files(
+                _Chunked(body[:6000], 512), len(body), BOUNDARY, str(tmp_path)
+            )
+        assert os.listdir(tmp_path) == ["game.iso"]
+        assert (tmp_path / "game.iso").read_bytes() == b"old"
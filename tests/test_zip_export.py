@@ -0,0 +1,67 @@
+"""Tests for streaming ZIP export in the web companion."""
+
+import io
+import os
+import socket
+import sys
+import threading
+import zipfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from web_companion.zip_export import compress_type_for, write_zip
+
+
+def _export(root):
+    """Run write_zip over a socket pair and return the received bytes."""
+    server, client = socket.socketpair()
+    received = []
+
+    def reader():
+        while True:
+            data = client.recv(65536)
+            if not data:
+                break
+            received.append(data)
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    result = write_zip(server, str(root))
+    server.close()
+    thread.join()
+    client.close()
+    return result, b"".join(received)
+
+
+class TestZipExport:
+    def test_roundtrip(self, tmp_path):
+        root = tmp_path / "saves"
+        (root / "snes").mkdir(parents=True)
+        (root / "empty").mkdir()
+        (root / "snes" / "mario.srm").write_bytes(b"\x00" * 8192)
+        (root / "snes" / "mario.zip").write_bytes(os.urandom(1000))
+        (root / "notes.txt").write_text("hello")
+        (root / ".upload-0123").write_bytes(b"partial")
+
+        (files, total), data = _export(root)
+        assert (files, total) == (3, 8192 + 1000 + 5)
+
+        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+            assert zf.testzip() is None
+            names = zf.namelist()
+            assert names == [
+                "saves/notes.txt",
+                "saves/empty/",
+                "saves/snes/mario.srm",
+                "saves/snes/mario.zip",
+            ]
+            assert zf.read("saves/snes/mario.srm") == b"\x00" * 8192
+            info = zf.getinfo("saves/snes/mario.srm")
+            assert info.compress_type == zipfile.ZIP_DEFLATED
+            assert info.compress_size < 100
+            assert zf.getinfo("saves/snes/mario.zip").compress_type == 0
+
+    def test_compression_policy(self):
+        assert compress_type_for("Game.CHD", 10) == zipfile.ZIP_STORED
+        assert compress_type_for("game.sfc", 4 << 20) == zipfile.ZIP_DEFLATED
+        assert compress_type_for("game.iso", 4 << 30) == zipfile.ZIP_STORED